@@ -0,0 +1,197 @@
+"""
+Example usage of CostModel: learning curves, supply chain adjustments and LCOE
+for evolving solar technologies.
+"""
+
+import logging
+import os
+import sys
+
+# Allow running as `python examples/<script>.py` from the repository root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.modules.economic_framework.cost_model import CostModel
+from src.modules.supply_chain_dynamics.supply_chain_model import SupplyChainModel
+from src.modules.technological_evolution.solar_tech_model import SolarTechModel, SolarTechnology
+
+# Setup basic logging for the example
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# --- Example Usage of CostModel --- 
+# 1. Initialize CostModel for a technology (e.g., standard silicon PV)
+initial_solar_costs = {
+    'module_usd_per_kw': 280, 
+    'bos_usd_per_kw': 150,
+    'inverter_usd_per_kw': 100,
+    'installation_usd_per_kw': 200,
+    'opex_per_kw_year': 20
+}
+solar_cost_model = CostModel(
+    technology_name='StandardSiliconPV',
+    initial_costs=initial_solar_costs,
+    learning_rate=0.18, # 18% learning rate
+    initial_production_volume=100 # GW
+)
+
+# Demonstrate cost component update
+solar_cost_model.update_cost_component('module_usd_per_kw', 270)
+
+# Apply learning curve
+solar_cost_model.apply_learning_curve(cumulative_production_volume=200) # Double the production
+logging.info(f"Costs after learning (200 GW): {solar_cost_model.current_costs}")
+solar_cost_model.apply_learning_curve(cumulative_production_volume=400) # Double again
+logging.info(f"Costs after learning (400 GW): {solar_cost_model.current_costs}")
+
+# LCOE Calculation
+lcoe_solar = solar_cost_model.calculate_lcoe(
+    capacity_factor=0.18, # Typical for some European locations
+    discount_rate=0.05,   # 5% WACC
+    economic_lifetime_years=25
+)
+logging.info(f"LCOE for StandardSiliconPV (direct from var): {lcoe_solar:.2f} USD/MWh")
+
+# --- Supply Chain Integration Example ---
+logging.info("\n--- Supply Chain Integration Example ---")
+# 1. Initialize SupplyChainModel (it uses its own default/updated initial_data)
+# Note: The supply_chain_model.py now has updated China capacities from previous steps.
+scm = SupplyChainModel()
+
+# 2. Create a new CostModel instance for a technology, passing the scm
+solar_panel_costs_for_scm_test = {
+    'module_usd_per_kw': 220, # Starting module cost before supply chain impact
+    'bos_usd_per_kw': 140,
+    'inverter_usd_per_kw': 90,
+    'installation_usd_per_kw': 180,
+    'opex_per_kw_year': 22
+}
+cost_model_with_scm = CostModel(
+    technology_name='UtilitySolarSCM',
+    initial_costs=solar_panel_costs_for_scm_test,
+    learning_rate=0.15,
+    initial_production_volume=50,
+    supply_chain_model=scm # Pass the initialized SupplyChainModel
+)
+logging.info(f"Initial module_usd_per_kw for UtilitySolarSCM: {cost_model_with_scm.current_costs['module_usd_per_kw']:.2f}")
+
+# 3. Apply supply chain adjustments
+cost_model_with_scm.adjust_costs_based_on_supply_chain(
+    material_item_name='polysilicon', 
+    module_item_name='solar_modules'
+)
+logging.info(f"Adjusted module_usd_per_kw for UtilitySolarSCM after supply chain assessment: {cost_model_with_scm.current_costs['module_usd_per_kw']:.2f}")
+
+# Recalculate LCOE to see impact (optional demonstration)
+lcoe_scm_adjusted = cost_model_with_scm.calculate_lcoe(
+    capacity_factor=0.22, 
+    discount_rate=0.05, 
+    economic_lifetime_years=25
+)
+logging.info(f"LCOE for UtilitySolarSCM (SCM adjusted, direct from var): {lcoe_scm_adjusted:.2f} USD/MWh")
+
+# --- CostModel with SolarTechModel Integration Example (Advanced Silicon PV) ---
+logging.info("\n--- CostModel with SolarTechModel Integration Example (Advanced Silicon PV) ---")
+# 1. Setup SolarTechModel
+stm = SolarTechModel()
+# Add a technology that matches a CostModel instance name
+adv_si_pv_tech = SolarTechnology(
+    name='AdvancedSiliconPV_Evolving',
+    base_efficiency=0.22, # 22% in start_year
+    projected_efficiency_2035=0.26, # 26% by 2035
+    start_year=2023,
+    commercial_scale_year=2020,
+    degradation_rate_annual=0.005,
+    base_capex_usd_per_kw=900, # USD/kW in start_year
+    annual_capex_reduction_rate=0.03 # 3% annual reduction
+)
+stm.add_technology(adv_si_pv_tech)
+
+# 2. Setup CostModel for this technology (mainly for OPEX, learning rate not directly used by new LCOE method)
+# The initial_costs' CAPEX components in CostModel will be IGNORED by the new LCOE method,
+# as it fetches CAPEX from SolarTechModel. However, OPEX is still taken from CostModel.
+evolving_solar_opex_costs = {
+    'opex_per_kw_year': 18, # Example OPEX for this evolving tech
+    # CAPEX components here are not strictly needed for the new LCOE method, but CostModel expects them for initialization.
+    'module_usd_per_kw': 0, 
+    'bos_usd_per_kw': 0, 
+    'inverter_usd_per_kw': 0,
+    'installation_usd_per_kw': 0
+}
+evolving_solar_cost_model = CostModel(technology_name='AdvancedSiliconPV_Evolving',
+                                    initial_costs=evolving_solar_opex_costs,
+                                    learning_rate=0, # Not used by calculate_lcoe_for_evolving_solar_tech
+                                    initial_production_volume=1 # Not used by calculate_lcoe_for_evolving_solar_tech
+                                    )
+
+# 3. Calculate LCOE for different years using the new method
+logging.info("\nCalculating LCOE for AdvancedSiliconPV_Evolving using SolarTechModel:")
+years_to_test = [2023, 2025, 2030, 2035]
+for year in years_to_test:
+    logging.info(f"\n--- Year {year} ---")
+    lcoe_results = evolving_solar_cost_model.calculate_lcoe_for_evolving_solar_tech(
+        solar_tech_model=stm,
+        technology_name='AdvancedSiliconPV_Evolving',
+        year=year,
+        capacity_factor=0.20,
+        discount_rate=0.05,
+        economic_lifetime_years=25
+    )
+    if lcoe_results and lcoe_results.get('error') is None:
+        logging.info(f"  LCOE: {lcoe_results['lcoe_usd_per_mwh']:.2f} USD/MWh")
+        logging.info(f"  CAPEX: {lcoe_results['capex_usd_per_kw']:.2f} USD/kW")
+        logging.info(f"  Efficiency: {lcoe_results['efficiency']:.4f}")
+        logging.info(f"  OPEX: {lcoe_results['opex_per_kw_year']:.2f} USD/kW/yr")
+    else:
+        logging.info(f"  Could not calculate LCOE: {lcoe_results.get('error') if lcoe_results else 'Unknown error'}")
+
+# Example with a technology not yet commercially available
+future_tech = SolarTechnology(
+    name='FutureX',
+    base_efficiency=0.30, # 30% in start_year
+    projected_efficiency_2035=0.40, # 40% by 2035
+    start_year=2028,
+    commercial_scale_year=2030, 
+    degradation_rate_annual=0.005,
+    base_capex_usd_per_kw=1200, # USD/kW in start_year
+    annual_capex_reduction_rate=0.05 # 5% annual reduction
+)
+stm.add_technology(future_tech)
+
+future_tech_opex_costs = {'opex_per_kw_year': 25}
+future_tech_cost_model = CostModel(technology_name='FutureX',
+                                   initial_costs=future_tech_opex_costs,
+                                   learning_rate=0)
+
+logging.info("\nCalculating LCOE for FutureX (not yet commercial in 2028):")
+lcoe_future_tech_2028 = future_tech_cost_model.calculate_lcoe_for_evolving_solar_tech(
+    solar_tech_model=stm,
+    technology_name='FutureX',
+    year=2028, 
+    capacity_factor=0.25, 
+    discount_rate=0.06, 
+    economic_lifetime_years=20
+)
+logging.info(lcoe_future_tech_2028)
+
+logging.info("\nCalculating LCOE for FutureX (commercial in 2030):")
+lcoe_future_tech_2030 = future_tech_cost_model.calculate_lcoe_for_evolving_solar_tech(
+    solar_tech_model=stm,
+    technology_name='FutureX',
+    year=2030, 
+    capacity_factor=0.25, 
+    discount_rate=0.06, 
+    economic_lifetime_years=20
+)
+logging.info(lcoe_future_tech_2030)
+
+# Example of tech not in SolarTechModel
+logging.info("\nCalculating LCOE for a technology not in SolarTechModel:")
+non_existent_cost_model = CostModel(technology_name='PhantomTech', initial_costs={'opex_per_kw_year':10}, learning_rate=0)
+lcoe_phantom = non_existent_cost_model.calculate_lcoe_for_evolving_solar_tech(
+    solar_tech_model=stm, 
+    technology_name='PhantomTech', 
+    year=2030, 
+    capacity_factor=0.2, 
+    discount_rate=0.05, 
+    economic_lifetime_years=25
+)
+logging.info(lcoe_phantom)
@@ -0,0 +1,59 @@
+"""
+Example usage of MarketSimulator: energy prices and ancillary service revenues.
+"""
+
+import logging
+import os
+import sys
+
+# Allow running as `python examples/<script>.py` from the repository root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.modules.economic_framework.market_model import MarketSimulator
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Example Usage
+example_designs = {
+    'California_ISO': {
+        'type': 'capacity_market',
+        'base_energy_price_usd_per_mwh': 60,
+        'tou_factors': {'off_peak': 0.7, 'mid_peak': 1.0, 'on_peak': 1.8},
+        'ancillary_services': {
+            'frequency_response': {'price_usd_per_mw_year': 6000, 'notes': 'Primary frequency control', 'availability_factor': 0.95},
+            'voltage_support': {'price_usd_per_mw_year': 2500, 'availability_factor': 0.9}
+        }
+    },
+    'Germany': {
+        'type': 'energy_only',
+        'base_energy_price_usd_per_mwh': 45,
+        'tou_factors': {'off_peak': 0.9, 'mid_peak': 1.0, 'on_peak': 1.3},
+        'ancillary_services': {
+            'frequency_response': {'price_usd_per_mw_year': 5000, 'availability_factor': 1.0}
+        }
+    },
+    'Texas_ERCOT': {
+        'type': 'energy_only_plus',
+        'base_energy_price_usd_per_mwh': 35,
+        # No TOU factors defined, should default to 1x
+        'ancillary_services': {
+            'spinning_reserve': {'price_usd_per_mw_year': 7000, 'availability_factor': 0.85}
+        }
+    }
+}
+simulator = MarketSimulator(market_designs=example_designs)
+
+logger.info("--- Energy Price Calculations ---")
+simulator.get_energy_price(region='California_ISO', time_of_day='on_peak')
+simulator.get_energy_price(region='California_ISO', time_of_day='off_peak')
+simulator.get_energy_price(region='Germany', time_of_day='mid_peak')
+simulator.get_energy_price(region='Texas_ERCOT', time_of_day='on_peak') # Should use base_price for Texas with default TOU
+simulator.get_energy_price(region='Unknown_Region', time_of_day='on_peak', default_base_price=40) # Test default base price
+
+logger.info("--- Ancillary Revenue Estimations ---")
+simulator.estimate_ancillary_revenue(capacity_mw=100, service_type='frequency_response', region='Germany')
+simulator.estimate_ancillary_revenue(capacity_mw=50, service_type='voltage_support', region='California_ISO')
+simulator.estimate_ancillary_revenue(capacity_mw=100, service_type='spinning_reserve', region='Texas_ERCOT')
+simulator.estimate_ancillary_revenue(capacity_mw=100, service_type='non_existent_service', region='Germany')
+simulator.estimate_ancillary_revenue(capacity_mw=100, service_type='frequency_response', region='Unknown_Region')
@@ -4,9 +4,158 @@ and their evolution across different regions.
 """
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..technological_evolution.solar_tech_model import is_storage_technology
+from ..units import HOURS_PER_YEAR
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing optional sections of a market design; never mutate it
+_EMPTY: dict = {}
+
+@dataclass(slots=True)
+class RegionOutcome:
+    """Dispatch results for one region in one simulated year."""
+    total_generation_mwh: Dict[str, float] = field(default_factory=dict) # {tech_name: dispatched MWh}
+    annual_demand_mwh: float = 0.0
+    total_dispatched_generation_mwh: float = 0.0
+    unmet_demand_mwh: float = 0.0
+
+DEFAULT_PV_CAPACITY_FACTOR = 0.20  # General assumption for PV-like technologies
+DEFAULT_BATTERY_EFFECTIVE_CF = 0.10 # General assumption for battery annual energy contribution
+
+# Per-region grid state: (peak load MW, tech names, capacities MW), or None when the region has no load data
+RegionGridState = Optional[Tuple[float, List[str], np.ndarray]]
+# Per-tech dispatch status for one year: (lookup error or None, commercially available, is storage)
+TechDispatchStatus = Tuple[Optional[str], bool, bool]
+
+def _tech_dispatch_status(tech_name: str, tech_details: dict) -> TechDispatchStatus:
+    """Reduces a SolarTechModel details dict to the flags dispatch needs, once per tech and year."""
+    if 'error' in tech_details:
+        return tech_details['error'], False, False
+    # Details from older configs may carry no storage flag or availability; assume available if missing
+    is_storage = tech_details['is_storage'] if 'is_storage' in tech_details else is_storage_technology(tech_name)
+    return None, tech_details.get('is_commercially_available', True), is_storage
+
+def _dispatch_one_region(region_name: str, year: int, grid_snapshot: Dict[str, RegionGridState],
+                         tech_snapshot: Dict[str, TechDispatchStatus]) -> RegionOutcome:
+    """Runs the simplified merit-order dispatch for one region.
+
+    Works only on the snapshots built by `MarketSimulator.simulate_dispatch_for_year`
+    (grid state per region, dispatch status per tech for the year), so it can run in a worker process.
+    """
+    # Resolve log levels once; the per-tech messages below are only formatted when they will be emitted
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if info_enabled:
+        logger.info("Simulating dispatch for region: %s in year %d", region_name, year)
+    outcome = RegionOutcome()
+
+    # 1. Get Regional Demand
+    region_state = grid_snapshot[region_name]
+    if region_state is None:
+        logger.warning(f"  Region {region_name} or its 'current_load_mw' not found in grid_model. Skipping dispatch for this region.")
+        return outcome
+
+    regional_peak_load_mw, tech_names, capacities_mw = region_state
+    # Simplistic annual demand calculation (flat load profile)
+    annual_demand_mwh = regional_peak_load_mw * HOURS_PER_YEAR
+    outcome.annual_demand_mwh = annual_demand_mwh
+    if info_enabled:
+        logger.info("  Annual demand for %s: %.2f MWh (based on peak load: %.2f MW)", region_name, annual_demand_mwh, regional_peak_load_mw)
+
+    # 2. Get Installed Capacities & Prepare Dispatchable Tech Arrays
+    if not tech_names:
+        if info_enabled:
+            logger.info("  No installed capacities found in %s for year %d. No dispatch possible.", region_name, year)
+        outcome.unmet_demand_mwh = annual_demand_mwh
+        return outcome
+
+    is_dispatchable = capacities_mw > 0
+    is_battery = np.zeros(len(tech_names), dtype=bool)
+    for i, tech_name in enumerate(tech_names):
+        if not is_dispatchable[i]:
+            continue
+
+        error, is_commercial, is_battery[i] = tech_snapshot[tech_name]
+        if error is not None:
+            logger.warning(f"    Error retrieving details for {tech_name} in {region_name}: {error}. Skipping for dispatch.")
+            is_dispatchable[i] = False
+        elif not is_commercial:
+            if info_enabled:
+                logger.info("    Technology %s in %s is not commercially available in %d. Skipping for dispatch.", tech_name, region_name, year)
+            is_dispatchable[i] = False
+
+    # Batteries use a default effective capacity factor for their annual energy contribution.
+    # Everything else is treated as PV-like with a default capacity factor: using SolarTechnology
+    # efficiency to modulate it is complex without irradiance data for the region.
+    capacity_factors = np.where(is_battery, DEFAULT_BATTERY_EFFECTIVE_CF, DEFAULT_PV_CAPACITY_FACTOR)
+    potential_mwh = capacities_mw * capacity_factors * HOURS_PER_YEAR
+    if debug_enabled:
+        for i in np.flatnonzero(is_dispatchable):
+            logger.debug("    %s (%s) in %s: Capacity=%.2f MW, Potential Annual Gen (CF=%s)=%.2f MWh",
+                         tech_names[i], 'Battery' if is_battery[i] else 'PV-like', region_name,
+                         capacities_mw[i], capacity_factors[i], potential_mwh[i])
+
+    is_dispatchable &= potential_mwh > 0
+    dispatchable_idx = np.flatnonzero(is_dispatchable)
+    potential = potential_mwh[dispatchable_idx]
+    # Marginal cost assumed to be 0 for renewables/storage in this simplified model
+    marginal_cost = np.zeros(potential.shape[0])
+
+    # 3. Perform Simplified Merit-Order Dispatch (Order doesn't matter much with MC=0)
+    if marginal_cost.any():
+        order = np.argsort(marginal_cost, kind='stable')
+        potential_sorted = potential[order]
+    else:
+        # All-zero marginal costs (the renewable/storage default): a stable sort would return
+        # the techs in their current order, so skip it
+        order = np.arange(potential.shape[0])
+        potential_sorted = potential
+    cumulative = np.cumsum(potential_sorted)
+    # Techs before the marginal one (the first whose cumulative potential reaches demand) run
+    # at full potential; the marginal tech covers the remainder and later techs are not needed.
+    marginal_idx = int(np.searchsorted(cumulative, annual_demand_mwh, side='left'))
+    dispatched = potential_sorted[:marginal_idx + 1].copy()
+    if marginal_idx < dispatched.shape[0]:
+        dispatched[marginal_idx] = annual_demand_mwh - (cumulative[marginal_idx - 1] if marginal_idx else 0.0)
+
+    dispatched_generation_for_region_mwh = 0
+    # Map merit-order positions straight back to positions in tech_names; no per-tech records are built
+    dispatched_tech_idx = dispatchable_idx[order[:marginal_idx + 1]].tolist()
+    for tech_idx, generation_to_dispatch in zip(dispatched_tech_idx, dispatched.tolist()):
+        if generation_to_dispatch > 0:
+            tech_name = tech_names[tech_idx]
+            outcome.total_generation_mwh[tech_name] = generation_to_dispatch
+            dispatched_generation_for_region_mwh += generation_to_dispatch
+            if info_enabled:
+                logger.info("    Dispatching %.2f MWh from %s in %s.", generation_to_dispatch, tech_name, region_name)
+
+    outcome.total_dispatched_generation_mwh = dispatched_generation_for_region_mwh
+    outcome.unmet_demand_mwh = max(0, annual_demand_mwh - dispatched_generation_for_region_mwh)
+    if info_enabled:
+        logger.info("  Dispatch summary for %s: Total Dispatched=%.2f MWh, Unmet Demand=%.2f MWh",
+                    region_name, dispatched_generation_for_region_mwh, outcome.unmet_demand_mwh)
+    return outcome
+
+# Snapshots installed in each dispatch worker process by _init_dispatch_worker
+_worker_state = None
+
+def _init_dispatch_worker(year: int, grid_snapshot: Dict[str, RegionGridState], tech_snapshot: Dict[str, TechDispatchStatus]):
+    global _worker_state
+    _worker_state = (year, grid_snapshot, tech_snapshot)
+
+def _dispatch_region_task(region_name: str) -> RegionOutcome:
+    year, grid_snapshot, tech_snapshot = _worker_state
+    return _dispatch_one_region(region_name, year, grid_snapshot, tech_snapshot)
+
 class MarketSimulator:
     """Simulates energy market dynamics, including energy prices and ancillary service revenues.
 
@@ -15,7 +164,10 @@ class MarketSimulator:
     energy prices, time-of-use (TOU) multipliers, and details for various
     ancillary services, including their prices and availability.
     """
-    def __init__(self, market_designs: dict):
+    # Below this many regions a year is dispatched in-process; worker start-up would cost more than it saves
+    PARALLEL_MIN_REGIONS = 64
+
+    def __init__(self, market_designs: dict, max_workers: Optional[int] = 1):
         """Initializes MarketSimulator with market configurations for various regions.
 
         Args:
@@ -36,6 +188,9 @@ class MarketSimulator:
                     This factor accounts for market limitations, participation caps,
                     or intermittent availability of the service opportunity.
                   - Other service-specific notes or parameters.
+            max_workers (int, optional): Worker processes used to dispatch regions in parallel
+                when a year covers at least PARALLEL_MIN_REGIONS regions. 1 (the default) keeps
+                dispatch in-process; None uses one worker per CPU.
 
         Example:
             {
@@ -54,7 +209,29 @@ class MarketSimulator:
             }
         """
         self.market_designs = market_designs
-        logger.info(f"MarketSimulator initialized with {len(self.market_designs)} market designs.")
+        self.max_workers = max_workers
+        self.refresh_lookup_tables()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("MarketSimulator initialized with %d market designs.", len(self.market_designs))
+
+    def refresh_lookup_tables(self):
+        """Flattens `market_designs` into the lookup tables used by the price and revenue getters.
+
+        Called from `__init__`; call it again after mutating `market_designs` in place.
+        """
+        self._base_price = {}        # region -> base energy price (only regions that define one)
+        self._tou_multiplier = {}    # (region, time_of_day) -> TOU multiplier
+        self._ancillary_table = {}   # (region, service_type) -> (price_usd_per_mw_year, availability_factor)
+        for region, design in self.market_designs.items():
+            if 'base_energy_price_usd_per_mwh' in design:
+                self._base_price[region] = design['base_energy_price_usd_per_mwh']
+            for time_of_day, multiplier in design.get('tou_factors', _EMPTY).items():
+                self._tou_multiplier[(region, time_of_day)] = multiplier
+            for service_type, service_config in design.get('ancillary_services', _EMPTY).items():
+                self._ancillary_table[(region, service_type)] = (
+                    service_config.get('price_usd_per_mw_year', 0),
+                    service_config.get('availability_factor', 1.0) # Default to 1.0 if not specified
+                )
 
     def simulate_dispatch_for_year(self, 
                                    year: int, 
@@ -79,104 +256,52 @@ class MarketSimulator:
             cost_model: Instance of CostModel.
 
         Returns:
-            dict: A dictionary containing market outcomes for the year. 
-                  Example: {'RegionA': {'total_generation_gwh': 1000, 'avg_price_usd_mwh': 50}}
-                  This structure needs to be aligned with what SimulationEngine expects to collect.
+            dict: Market outcomes for the year, mapping each region name to a RegionOutcome.
+                  Example: {'RegionA': RegionOutcome(total_generation_mwh={'PV': 1000.0}, annual_demand_mwh=5000.0, ...)}
         """
-        # In a real implementation, you'd use: from typing import Dict, List, Any
-        # For now, keeping it simple for placeholder.
-        logger.info(f"MarketSimulator.simulate_dispatch_for_year called for year {year}, regions: {regions}, investments: {new_investments}.")
-        
-        market_outcomes = {}
-        HOURS_PER_YEAR = 8760
-        DEFAULT_PV_CAPACITY_FACTOR = 0.20  # General assumption for PV-like technologies
-        DEFAULT_BATTERY_EFFECTIVE_CF = 0.10 # General assumption for battery annual energy contribution
+        logger.info("MarketSimulator.simulate_dispatch_for_year called for year %d, %d regions.", year, len(regions))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Regions: %s, investments: %s", regions, new_investments)
 
+        # Regions are dispatched independently from plain snapshots of the grid and technology state,
+        # so they can be fanned out to worker processes without shipping the model objects.
+        grid_snapshot = {}
         for region_name in regions:
-            logger.info(f"Simulating dispatch for region: {region_name} in year {year}")
-            market_outcomes[region_name] = {
-                'total_generation_mwh': {},
-                'annual_demand_mwh': 0,
-                'total_dispatched_generation_mwh': 0,
-                'unmet_demand_mwh': 0
-            }
-
-            # 1. Get Regional Demand
-            if region_name not in grid_model.regional_data or 'current_load_mw' not in grid_model.regional_data[region_name]:
-                logger.warning(f"  Region {region_name} or its 'current_load_mw' not found in grid_model. Skipping dispatch for this region.")
+            region_data = grid_model.regional_data.get(region_name)
+            if region_data is None:
+                grid_snapshot[region_name] = None
                 continue
-        
-            regional_peak_load_mw = grid_model.regional_data[region_name]['current_load_mw']
-            # Simplistic annual demand calculation (flat load profile)
-            annual_demand_mwh = regional_peak_load_mw * HOURS_PER_YEAR 
-            market_outcomes[region_name]['annual_demand_mwh'] = annual_demand_mwh
-            logger.info(f"  Annual demand for {region_name}: {annual_demand_mwh:.2f} MWh (based on peak load: {regional_peak_load_mw:.2f} MW)")
-
-            # 2. Get Installed Capacities & Prepare Dispatchable Tech List
-            installed_capacities = grid_model.get_current_capacity_by_tech(region_name)
-            if not installed_capacities:
-                logger.info(f"  No installed capacities found in {region_name} for year {year}. No dispatch possible.")
-                market_outcomes[region_name]['unmet_demand_mwh'] = annual_demand_mwh
+            tech_names, capacities_mw = grid_model.get_current_capacity_arrays(region_name)
+            grid_snapshot[region_name] = (region_data.current_load_mw, tech_names, capacities_mw)
+
+        # Technology parameters depend only on (tech, year), so look each tech up and classify it
+        # (error, commercial availability, storage) once for all regions
+        tech_snapshot = {}
+        for region_state in grid_snapshot.values():
+            if region_state is None:
                 continue
+            _, tech_names, capacities_mw = region_state
+            for i in np.flatnonzero(capacities_mw > 0):
+                tech_name = tech_names[i]
+                if tech_name not in tech_snapshot:
+                    tech_snapshot[tech_name] = _tech_dispatch_status(tech_name, solar_tech_model.get_technology_details(tech_name, year))
 
-            dispatchable_techs = []
-            for tech_name, capacity_mw in installed_capacities.items():
-                if capacity_mw <= 0:
-                    continue
-
-                tech_details = solar_tech_model.get_technology_details(tech_name, year)
-                if 'error' in tech_details:
-                    logger.warning(f"    Error retrieving details for {tech_name} in {region_name}: {tech_details['error']}. Skipping for dispatch.")
-                    continue
-            
-                if not tech_details.get('is_commercially_available', True): # Assume available if key missing (for older configs)
-                    logger.info(f"    Technology {tech_name} in {region_name} is not commercially available in {year}. Skipping for dispatch.")
-                    continue
-
-                potential_annual_generation_mwh = 0
-                # Marginal cost assumed to be 0 for renewables/storage in this simplified model
-                marginal_cost = 0 
-
-                if "BATTERY" in tech_name.upper():
-                    # Using a default effective capacity factor for battery's annual energy contribution
-                    potential_annual_generation_mwh = capacity_mw * DEFAULT_BATTERY_EFFECTIVE_CF * HOURS_PER_YEAR
-                    logger.debug(f"    {tech_name} (Battery) in {region_name}: Capacity={capacity_mw:.2f} MW, Potential Annual Gen (eff_CF={DEFAULT_BATTERY_EFFECTIVE_CF})={potential_annual_generation_mwh:.2f} MWh")
-                else: # Assume PV-like
-                    # Using SolarTechnology efficiency to modulate a base capacity factor is complex without irradiance data.
-                    # For now, using a default capacity factor for all PV.
-                    # Future: capacity_factor = tech_details.get('capacity_factor', DEFAULT_PV_CAPACITY_FACTOR) 
-                    # - efficiency from tech_details could be used if solar irradiance data for the region was available.
-                    potential_annual_generation_mwh = capacity_mw * DEFAULT_PV_CAPACITY_FACTOR * HOURS_PER_YEAR
-                    logger.debug(f"    {tech_name} (PV-like) in {region_name}: Capacity={capacity_mw:.2f} MW, Potential Annual Gen (CF={DEFAULT_PV_CAPACITY_FACTOR})={potential_annual_generation_mwh:.2f} MWh")
-
-                if potential_annual_generation_mwh > 0:
-                    dispatchable_techs.append({
-                        'name': tech_name,
-                        'potential_mwh': potential_annual_generation_mwh,
-                        'marginal_cost': marginal_cost # Currently 0 for all
-                    })
-        
-            # 3. Perform Simplified Merit-Order Dispatch (Order doesn't matter much with MC=0)
-            # Sorting by marginal cost (though all are 0 for now)
-            dispatchable_techs.sort(key=lambda x: x['marginal_cost'])
-        
-            dispatched_generation_for_region_mwh = 0
-            for tech in dispatchable_techs:
-                if dispatched_generation_for_region_mwh >= annual_demand_mwh:
-                    break # Demand met
-            
-                generation_to_dispatch = min(tech['potential_mwh'], annual_demand_mwh - dispatched_generation_for_region_mwh)
-            
-                if generation_to_dispatch > 0:
-                    market_outcomes[region_name]['total_generation_mwh'][tech['name']] = generation_to_dispatch
-                    dispatched_generation_for_region_mwh += generation_to_dispatch
-                    logger.info(f"    Dispatching {generation_to_dispatch:.2f} MWh from {tech['name']} in {region_name}.")
-
-            market_outcomes[region_name]['total_dispatched_generation_mwh'] = dispatched_generation_for_region_mwh
-            market_outcomes[region_name]['unmet_demand_mwh'] = max(0, annual_demand_mwh - dispatched_generation_for_region_mwh)
-            logger.info(f"  Dispatch summary for {region_name}: Total Dispatched={dispatched_generation_for_region_mwh:.2f} MWh, Unmet Demand={market_outcomes[region_name]['unmet_demand_mwh']:.2f} MWh")
-
-        logger.info(f"MarketSimulator.simulate_dispatch_for_year completed for year {year}. Market Outcomes: {market_outcomes}")
+        if self.max_workers == 1 or len(regions) < self.PARALLEL_MIN_REGIONS:
+            market_outcomes = {region_name: _dispatch_one_region(region_name, year, grid_snapshot, tech_snapshot)
+                               for region_name in regions}
+        else:
+            # The snapshots are pickled once per worker through the initializer, not once per region.
+            # Workers are spawned rather than forked: forking next to numba's thread pool can deadlock.
+            workers = self.max_workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_dispatch_worker,
+                                     initargs=(year, grid_snapshot, tech_snapshot)) as executor:
+                outcomes = executor.map(_dispatch_region_task, regions, chunksize=max(1, len(regions) // (4 * workers)))
+                market_outcomes = dict(zip(regions, outcomes))
+
+        logger.info("MarketSimulator.simulate_dispatch_for_year completed for year %d.", year)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Market Outcomes: %s", market_outcomes)
         return market_outcomes
 
     def get_energy_price(self, region: str, time_of_day: str, default_base_price: float = 50) -> float:
@@ -199,15 +324,13 @@ class MarketSimulator:
         Returns:
             float: The calculated energy price in USD per MWh.
         """
-        region_design = self.market_designs.get(region, {})
-        base_price = region_design.get('base_energy_price_usd_per_mwh', default_base_price)
-        
-        tou_factors = region_design.get('tou_factors', {})
+        base_price = self._base_price.get(region, default_base_price)
         # Default multiplier is 1 if time_of_day key is missing or tou_factors itself is missing
-        tou_multiplier = tou_factors.get(time_of_day, 1.0) 
+        tou_multiplier = self._tou_multiplier.get((region, time_of_day), 1.0)
         
         price = base_price * tou_multiplier
-        logger.info(f"Energy price in {region} at {time_of_day}: ${price:.2f}/MWh (Base: ${base_price:.2f}, TOU x{tou_multiplier:.2f})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Energy price in %s at %s: $%.2f/MWh (Base: $%.2f, TOU x%.2f)", region, time_of_day, price, base_price, tou_multiplier)
         return price
 
     def estimate_ancillary_revenue(self, capacity_mw: float, service_type: str, region: str) -> float:
@@ -229,61 +352,13 @@ class MarketSimulator:
         Returns:
             float: Estimated total annual revenue from the specified ancillary service in USD.
         """
-        region_design = self.market_designs.get(region, {})
-        ancillary_services_config = region_design.get('ancillary_services', {})
-        service_config = ancillary_services_config.get(service_type, {})
-        
-        revenue_per_mw_year = service_config.get('price_usd_per_mw_year', 0)
-        availability_factor = service_config.get('availability_factor', 1.0) # Default to 1.0 if not specified
+        revenue_per_mw_year, availability_factor = self._ancillary_table.get((region, service_type), (0, 1.0))
         
         total_revenue = capacity_mw * revenue_per_mw_year * availability_factor
-        if revenue_per_mw_year > 0: # Only print if there's a base rate, even if availability makes it zero
-            logger.info(f"Estimated ancillary service ({service_type}) revenue in {region} for {capacity_mw}MW: ${total_revenue:.2f}/year (Rate: ${revenue_per_mw_year}/MW/year, Availability: {availability_factor*100:.0f}%)")
-        else:
-            logger.info(f"Ancillary service ({service_type}) not defined or no revenue in {region}.")
+        if logger.isEnabledFor(logging.INFO):
+            if revenue_per_mw_year > 0: # Only print if there's a base rate, even if availability makes it zero
+                logger.info("Estimated ancillary service (%s) revenue in %s for %sMW: $%.2f/year (Rate: $%s/MW/year, Availability: %.0f%%)",
+                            service_type, region, capacity_mw, total_revenue, revenue_per_mw_year, availability_factor * 100)
+            else:
+                logger.info("Ancillary service (%s) not defined or no revenue in %s.", service_type, region)
         return total_revenue
-
-if __name__ == '__main__':
-    # Example Usage
-    example_designs = {
-        'California_ISO': {
-            'type': 'capacity_market',
-            'base_energy_price_usd_per_mwh': 60,
-            'tou_factors': {'off_peak': 0.7, 'mid_peak': 1.0, 'on_peak': 1.8},
-            'ancillary_services': {
-                'frequency_response': {'price_usd_per_mw_year': 6000, 'notes': 'Primary frequency control', 'availability_factor': 0.95},
-                'voltage_support': {'price_usd_per_mw_year': 2500, 'availability_factor': 0.9}
-            }
-        },
-        'Germany': {
-            'type': 'energy_only',
-            'base_energy_price_usd_per_mwh': 45,
-            'tou_factors': {'off_peak': 0.9, 'mid_peak': 1.0, 'on_peak': 1.3},
-            'ancillary_services': {
-                'frequency_response': {'price_usd_per_mw_year': 5000, 'availability_factor': 1.0}
-            }
-        },
-        'Texas_ERCOT': {
-            'type': 'energy_only_plus',
-            'base_energy_price_usd_per_mwh': 35,
-            # No TOU factors defined, should default to 1x
-            'ancillary_services': {
-                'spinning_reserve': {'price_usd_per_mw_year': 7000, 'availability_factor': 0.85}
-            }
-        }
-    }
-    simulator = MarketSimulator(market_designs=example_designs)
-    
-    logger.info("--- Energy Price Calculations ---")
-    simulator.get_energy_price(region='California_ISO', time_of_day='on_peak')
-    simulator.get_energy_price(region='California_ISO', time_of_day='off_peak')
-    simulator.get_energy_price(region='Germany', time_of_day='mid_peak')
-    simulator.get_energy_price(region='Texas_ERCOT', time_of_day='on_peak') # Should use base_price for Texas with default TOU
-    simulator.get_energy_price(region='Unknown_Region', time_of_day='on_peak', default_base_price=40) # Test default base price
-
-    logger.info("--- Ancillary Revenue Estimations ---")
-    simulator.estimate_ancillary_revenue(capacity_mw=100, service_type='frequency_response', region='Germany')
-    simulator.estimate_ancillary_revenue(capacity_mw=50, service_type='voltage_support', region='California_ISO')
-    simulator.estimate_ancillary_revenue(capacity_mw=100, service_type='spinning_reserve', region='Texas_ERCOT')
-    simulator.estimate_ancillary_revenue(capacity_mw=100, service_type='non_existent_service', region='Germany')
-    simulator.estimate_ancillary_revenue(capacity_mw=100, service_type='frequency_response', region='Unknown_Region')
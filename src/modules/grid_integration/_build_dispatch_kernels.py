@@ -0,0 +1,34 @@
+"""
+Ahead-of-time build of the dispatch kernels.
+
+Compiles `_dispatch_reduce_loop` into the `_dispatch_kernels_aot` extension next to
+this file, so `_dispatch_kernels` can import it instead of JIT-compiling at startup.
+Requires numba and a C compiler:
+
+    python -m src.modules.grid_integration._build_dispatch_kernels
+
+Note: `numba.pycc` has been pending deprecation since Numba 0.57 and will be removed once
+its replacement ships. Without it, `_dispatch_kernels` keeps using the cached JIT kernel.
+"""
+
+import os
+
+try:
+    from numba.pycc import CC
+except ImportError as e:
+    raise ImportError("Building the AOT dispatch kernels requires a numba release that still ships numba.pycc; "
+                      "without it the cached JIT kernel in _dispatch_kernels is used instead.") from e
+
+from ._dispatch_kernels_src import _dispatch_reduce_loop, DISPATCH_REDUCE_SIGNATURE
+
+
+def build(output_dir: str = None) -> None:
+    """Builds the extension module into output_dir (defaults to this package)."""
+    cc = CC('_dispatch_kernels_aot')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.export('dispatch_reduce', DISPATCH_REDUCE_SIGNATURE)(_dispatch_reduce_loop)
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()
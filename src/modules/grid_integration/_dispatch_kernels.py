@@ -0,0 +1,36 @@
+"""
+Numeric kernels backing DispatchModeler.
+
+Numba is optional: when it is installed the reduction over dispatch profiles is
+compiled into a single fused pass; otherwise an equivalent NumPy implementation
+is used. A precompiled extension built by `_build_dispatch_kernels` is preferred
+when present, so runs start without any JIT compilation.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
+from ._dispatch_kernels_src import _dispatch_reduce_loop, DISPATCH_REDUCE_SIGNATURE
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def _dispatch_reduce_numpy(demand, solar, other):
+    """Returns (curtailment, unmet demand) summed over all time steps, accumulated in float64."""
+    surplus = solar.astype(np.float64) + other - demand
+    return float(np.sum(np.maximum(surplus, 0.0))), float(-np.sum(np.minimum(surplus, 0.0)))
+
+
+try:
+    from ._dispatch_kernels_aot import dispatch_reduce as _dispatch_reduce
+    AOT_AVAILABLE = True
+except ImportError:  # extension not built; fall back to JIT or NumPy
+    AOT_AVAILABLE = False
+    if NUMBA_AVAILABLE:
+        _dispatch_reduce = numba.njit(DISPATCH_REDUCE_SIGNATURE, cache=True, fastmath=True, parallel=True)(_dispatch_reduce_loop)
+    else:
+        _dispatch_reduce = _dispatch_reduce_numpy
@@ -0,0 +1,27 @@
+"""
+Pure-Python source of the dispatch kernels.
+
+Kept separate from `_dispatch_kernels` so the AOT build can import the loop and its
+signature without triggering the JIT compilation done there at import time.
+"""
+
+try:
+    from numba import prange
+except ImportError:  # numba is an optional accelerator
+    prange = range
+
+# Explicit signature shared by the eager JIT and the AOT build
+DISPATCH_REDUCE_SIGNATURE = 'UniTuple(float64, 2)(float32[::1], float32[::1], float32[::1])'
+
+
+def _dispatch_reduce_loop(demand, solar, other):
+    """Returns (curtailment, unmet demand) summed over all time steps in one pass.
+    Inputs are float32 profiles; each step is promoted to float64 before accumulating.
+    """
+    curt = 0.0
+    unmet = 0.0
+    for i in prange(demand.shape[0]):
+        diff = float(solar[i]) + float(other[i]) - float(demand[i])
+        curt += max(diff, 0.0)
+        unmet += max(-diff, 0.0)
+    return curt, unmet
@@ -0,0 +1,34 @@
+"""
+Numeric kernels backing GridModel's batch APIs.
+
+Numba is optional: when it is installed the interconnection cost formula is compiled
+into one parallel pass that gathers each candidate's region coefficients in place;
+otherwise an equivalent NumPy implementation is used.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def _batch_intercon_cost_numpy(region_ids, new_mw, dist, coeff_a, coeff_b):
+    """Returns (A + B * distance) * capacity interconnection costs for every candidate."""
+    return (coeff_a[region_ids] + coeff_b[region_ids] * dist) * new_mw
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _batch_intercon_cost(region_ids, new_mw, dist, coeff_a, coeff_b):
+        """Returns (A + B * distance) * capacity interconnection costs for every candidate."""
+        out = np.empty(region_ids.shape[0])
+        for k in numba.prange(region_ids.shape[0]):
+            r = region_ids[k]
+            out[k] = (coeff_a[r] + coeff_b[r] * dist[k]) * new_mw[k]
+        return out
+else:
+    _batch_intercon_cost = _batch_intercon_cost_numpy
@@ -3,6 +3,10 @@ Handles sub-hourly dispatch modeling, system inertia evolution tracking,
 and the adoption of grid-forming inverters.
 """
 
+import numpy as np
+
+from ._dispatch_kernels import _dispatch_reduce
+
 class DispatchModeler:
     """A class for modeling power system dispatch and inertia characteristics."""
     def __init__(self, system_parameters: dict):
@@ -15,20 +19,21 @@ class DispatchModeler:
 
     def simulate_dispatch(self, demand_profile_mw: list, solar_profile_mw: list, other_generation_mw: list) -> dict:
         """Simulates dispatch for a given period (e.g., 24 hours, sub-hourly steps).
-        Profiles are lists of power values for each time step.
+        Profiles are lists (or arrays) of power values for each time step.
         """
-        # Highly simplified dispatch logic
-        curtailment_mwh = 0
-        unmet_demand_mwh = 0
-        time_steps = len(demand_profile_mw)
-
-        for i in range(time_steps):
-            available_supply = solar_profile_mw[i] + other_generation_mw[i]
-            demand = demand_profile_mw[i]
-            if available_supply > demand:
-                curtailment_mwh += (available_supply - demand) # Assuming 1-hour steps for MWh
-            elif available_supply < demand:
-                unmet_demand_mwh += (demand - available_supply)
+        # Highly simplified dispatch logic, reduced over whole profiles in one pass.
+        # MW profiles are stored as float32 (half the memory traffic); the kernels sum in float64.
+        demand = np.ascontiguousarray(demand_profile_mw, dtype=np.float32)
+        solar = np.ascontiguousarray(solar_profile_mw, dtype=np.float32)
+        other = np.ascontiguousarray(other_generation_mw, dtype=np.float32)
+        time_steps = demand.shape[0]
+        if solar.shape[0] != time_steps or other.shape[0] != time_steps:
+            # The compiled kernel does not bounds-check, so mismatched profiles must be rejected here
+            raise ValueError(f"Profiles must have the same length (demand: {time_steps}, solar: {solar.shape[0]}, other: {other.shape[0]}).")
+
+        curtailment_mwh, unmet_demand_mwh = _dispatch_reduce(demand, solar, other) # Assuming 1-hour steps for MWh
+        curtailment_mwh = float(curtailment_mwh)
+        unmet_demand_mwh = float(unmet_demand_mwh)
         
         print(f"Dispatch simulation over {time_steps} steps:")
         print(f"  Total curtailment: {curtailment_mwh:.2f} MWh")
@@ -42,12 +47,27 @@ class DispatchModeler:
         inertia_loss_from_retirements = conventional_retirements_gw * 5 # Example factor: 5 GWs of inertia per GW capacity
         inertia_gain_from_gfi = gf_inverters_added_gw * 1 # Example factor
         
-        self.current_inertia_gws = self.current_inertia_gws - inertia_loss_from_retirements + inertia_gain_from_gfi
-        self.current_inertia_gws = max(0, self.current_inertia_gws) # Inertia cannot be negative
+        inertia = self.current_inertia_gws - inertia_loss_from_retirements + inertia_gain_from_gfi
+        self.current_inertia_gws = inertia if inertia > 0 else 0.0 # Inertia cannot be negative
 
         print(f"Projected system inertia for year {year}: {self.current_inertia_gws:.2f} GWs")
         return self.current_inertia_gws
 
+    def project_system_inertia_vec(self, retirements_gw: np.ndarray, gfi_added_gw: np.ndarray) -> np.ndarray:
+        """Projects system inertia over consecutive years in one call.
+        retirements_gw and gfi_added_gw hold one entry per year; returns the inertia after each year,
+        matching repeated calls to project_system_inertia (including the floor at zero).
+        """
+        delta = np.asarray(gfi_added_gw, dtype=np.float64) - 5.0 * np.asarray(retirements_gw, dtype=np.float64) # Same factors as project_system_inertia
+        if delta.size == 0:
+            return delta
+        # Unclamped running total; whenever it dips below zero the clamped path restarts from zero,
+        # so the clamped value is the running total minus its lowest (negative) point so far.
+        running = self.current_inertia_gws + np.cumsum(delta)
+        traj = running - np.minimum.accumulate(np.minimum(running, 0.0))
+        self.current_inertia_gws = float(traj[-1])
+        return traj
+
 if __name__ == '__main__':
     # Example Usage
     params = {'initial_inertia_gws': 250, 'gf_inverter_adoption_rate': 0.05}
@@ -0,0 +1,70 @@
+"""
+Shared region table for the grid_integration models.
+
+A GridDataStore fixes the set of regions and their integer ids once, and holds the
+per-region parameter columns (one float64 array per parameter, indexed by region id)
+that GridModel and TransmissionPlanner read. Models built on the same store share
+the name -> id translation, so a region id obtained from one model can be used
+with the other.
+"""
+
+import sys
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+RegionKey = Union[str, int]
+
+class GridDataStore:
+    """A fixed set of regions with named per-region columns."""
+    def __init__(self, region_names: Sequence[str]):
+        self.region_names: List[str] = [sys.intern(name) for name in region_names]
+        self.region_index: Dict[str, int] = {name: i for i, name in enumerate(self.region_names)}
+        if len(self.region_index) != len(self.region_names):
+            raise ValueError("GridDataStore: region names must be unique.")
+        # Sorted name table for translating many names at once with np.searchsorted
+        order = np.argsort(np.array(self.region_names, dtype=str), kind='stable')
+        self._sorted_region_names = np.array(self.region_names, dtype=str)[order]
+        self._sorted_region_ids = order.astype(np.intp)
+        self.columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.region_names)
+
+    def resolve(self, region: RegionKey) -> Optional[int]:
+        """Converts a region name or integer region id to its id; None if unknown."""
+        if isinstance(region, (int, np.integer)):
+            return int(region) if 0 <= region < len(self.region_names) else None
+        return self.region_index.get(region)
+
+    def ids_of(self, region_names: Sequence[str]) -> np.ndarray:
+        """Translates region names into region ids. Raises KeyError for unknown regions."""
+        names = np.asarray(region_names, dtype=str)
+        if not self.region_names:
+            if names.size:
+                raise KeyError(names.flat[0])
+            return np.zeros(names.shape, dtype=np.intp)
+        positions = np.minimum(np.searchsorted(self._sorted_region_names, names), len(self.region_names) - 1)
+        unknown = self._sorted_region_names[positions] != names
+        if unknown.any():
+            raise KeyError(str(names[unknown][0]))
+        return self._sorted_region_ids[positions]
+
+    def add_column(self, name: str, values_by_region: Mapping[str, float], default: float = np.nan, dtype=np.float64) -> np.ndarray:
+        """Adds a per-region column and returns it.
+
+        The column starts as `default` for every region and is overwritten for the regions in
+        values_by_region (which must all be in the store). Raises ValueError if the column already
+        exists, since two models writing the same column would silently clobber each other.
+        """
+        if name in self.columns:
+            raise ValueError(f"GridDataStore: column '{name}' already exists.")
+        column = np.full(len(self.region_names), default, dtype=dtype)
+        if values_by_region:
+            column[[self.region_index[region] for region in values_by_region]] = list(values_by_region.values())
+        self.columns[name] = column
+        return column
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns the named column (the shared array, not a copy)."""
+        return self.columns[name]
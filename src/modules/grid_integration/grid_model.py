@@ -1,11 +1,85 @@
+import functools
 import logging
-from typing import Dict, Any, List
+import sys
+from collections import ChainMap
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, Any, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ._grid_kernels import _batch_intercon_cost
+from .grid_data_store import GridDataStore, RegionKey
+
+logger = logging.getLogger(__name__)
+
+_SOLAR_PV_KEYWORDS = frozenset({"PV", "SOLAR", "SILICON", "TOPCON", "PEROVSKITE"})
+_SOLAR_PV_EXCLUDED_KEYWORDS = frozenset({"BATTERY"}) # Exclude solar+storage if 'Battery' is in name
+
+@functools.lru_cache(maxsize=None)
+def _is_solar_pv(tech_name: str) -> bool:
+    """Heuristic to identify solar PV technologies by name; evaluated once per distinct name."""
+    name = tech_name.upper()
+    return (any(keyword in name for keyword in _SOLAR_PV_KEYWORDS)
+            and not any(keyword in name for keyword in _SOLAR_PV_EXCLUDED_KEYWORDS))
+
+@dataclass(slots=True)
+class RegionParams:
+    """Scalar grid parameters of one region; the object view over GridModel's per-region arrays.
+
+    Supports read/write item access (`params['current_solar_mw']`) alongside attribute access, so it can
+    stand in for the plain dicts GridModel used to store. Keys without a field are kept in `extra`.
+    Assigning a field of a record held by a GridModel (either way) also updates the model's arrays.
+    """
+    existing_capacity_mw: float
+    current_load_mw: float
+    max_solar_penetration_pct: float = 0.50
+    base_interconnection_cost_usd_per_mw: float = 100000
+    transmission_constraint_factor: float = 1.0
+    avg_transmission_cost_usd_per_mw_km: float = 2000.0
+    avg_terrain_factor: float = 1.0
+    current_solar_mw: float = 0.0
+    extra: Dict[str, Any] = field(default_factory=dict)
+    # Set by the owning GridModel; called with the record after one of its fields is assigned
+    _on_change: Optional[Callable[['RegionParams'], None]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name in _REGION_PARAM_FIELDS:
+            # The hook is unset while the dataclass __init__ assigns the fields
+            on_change = getattr(self, '_on_change', None)
+            if on_change is not None:
+                on_change(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'RegionParams':
+        """Builds a RegionParams from a parameter mapping; unrecognised keys go to `extra`."""
+        known = {key: value for key, value in data.items() if key in _REGION_PARAM_FIELDS}
+        return cls(**known, extra={key: value for key, value in data.items() if key not in _REGION_PARAM_FIELDS})
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _REGION_PARAM_FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if key in _REGION_PARAM_FIELDS:
+            setattr(self, key, value)
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return key in _REGION_PARAM_FIELDS or key in self.extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+_REGION_PARAM_FIELDS = frozenset(f.name for f in fields(RegionParams) if f.init and f.name != 'extra')
 
 class GridModel:
     """
     Models grid capacity, constraints, and integration costs for multiple regions.
     """
-    def __init__(self, initial_regional_data: Dict[str, Dict[str, Any]]):
+    def __init__(self, initial_regional_data: Dict[str, Dict[str, Any]], store: Optional[GridDataStore] = None):
         """
         Initializes the GridModel with data for multiple regions.
 
@@ -23,8 +97,15 @@ class GridModel:
                 - 'avg_transmission_cost_usd_per_mw_km' (float, default 2000.0)
                 - 'avg_terrain_factor' (float, default 1.0)
                 - 'current_solar_mw' (float, default 0)
+                - 'capacities_mw_by_tech' (dict, default empty): Installed capacity in MW by technology.
+                  Loaded into the region x technology capacity matrix; read it back with
+                  get_current_capacity_by_tech.
+                Each region's parameters are stored in `self.regional_data` as a RegionParams record.
+            store (GridDataStore, optional): Shared region table to index regions by and to hold the
+                per-region columns. Regions missing from the store are skipped. By default the model
+                gets its own store covering the valid regions of initial_regional_data.
         """
-        self.regional_data: Dict[str, Dict[str, Any]] = {}
+        self.regional_data: Dict[str, RegionParams] = {}
         self.default_grid_params = {
             'max_solar_penetration_pct': 0.50,
             'base_interconnection_cost_usd_per_mw': 100000,
@@ -32,69 +113,162 @@ class GridModel:
             'avg_transmission_cost_usd_per_mw_km': 2000.0,
             'avg_terrain_factor': 1.0,
             'current_solar_mw': 0.0,
-            'capacities_mw_by_tech': {} # New: Initialize for storing capacity by tech
         }
+        initial_capacities: Dict[str, Dict[str, float]] = {}
 
         for region_name, data in initial_regional_data.items():
             if 'existing_capacity_mw' not in data or 'current_load_mw' not in data:
-                logging.error(f"GridModel: Missing 'existing_capacity_mw' or 'current_load_mw' for region '{region_name}'. Skipping region.")
+                logger.error("GridModel: Missing 'existing_capacity_mw' or 'current_load_mw' for region '%s'. Skipping region.", region_name)
+                continue
+            if store is not None and region_name not in store.region_index:
+                logger.error("GridModel: Region '%s' is not in the shared GridDataStore. Skipping region.", region_name)
                 continue
             
-            region_params = self.default_grid_params.copy()
-            region_params.update(data)
-            
-            # Ensure capacities_mw_by_tech is initialized for each region if not already present
-            if 'capacities_mw_by_tech' not in region_params:
-                region_params['capacities_mw_by_tech'] = {}
-                
+            # Defaults are read through the ChainMap rather than copied into a fresh dict per region
+            region_params = RegionParams.from_dict(ChainMap(data, self.default_grid_params))
+            # Capacities by technology live in the capacity matrix, not in the region's parameters
+            initial_capacities[region_name] = region_params.extra.pop('capacities_mw_by_tech', None) or {}
+
             self.regional_data[region_name] = region_params
             
-            logging.info(f"GridModel: Loaded configuration for region '{region_name}'.")
-            logging.debug(f"  Region '{region_name}' data: {self.regional_data[region_name]}")
+            logger.info("GridModel: Loaded configuration for region '%s'.", region_name)
+            logger.debug("  Region '%s' data: %s", region_name, region_params)
+
+        self.store = store if store is not None else GridDataStore(list(self.regional_data))
+        self._build_region_arrays()
+        self._build_capacity_matrix(initial_capacities)
 
         if not self.regional_data:
-            logging.warning("GridModel initialized, but no valid regional data was loaded.")
+            logger.warning("GridModel initialized, but no valid regional data was loaded.")
         else:
-            logging.info(f"GridModel initialized for regions: {list(self.regional_data.keys())}")
+            logger.info("GridModel initialized for regions: %s", list(self.regional_data))
+
+    def _build_region_arrays(self):
+        """Mirrors the scalar grid parameters of every region into float64 columns of the store.
+
+        Region i in the arrays is `self._region_names[i]`; `self._region_index` maps names to i.
+        Per-region and batch calculations read these arrays instead of the nested dicts. Store
+        regions that this model has no data for are masked out by `self._configured`.
+        """
+        self._region_names: List[str] = self.store.region_names
+        self._region_index: Dict[str, int] = self.store.region_index
+        self._configured = np.zeros(len(self.store), dtype=bool)
+        self._configured[[self._region_index[name] for name in self.regional_data]] = True
+
+        def column(name: str, values_by_region: Dict[str, float], default: float = np.nan) -> np.ndarray:
+            return self.store.add_column(name, values_by_region, default)
+
+        params = self.regional_data
+        self._existing_capacity_mw = column('existing_capacity_mw', {r: p.existing_capacity_mw for r, p in params.items()})
+        self._max_solar_pen_pct = column('max_solar_penetration_pct', {r: p.max_solar_penetration_pct for r, p in params.items()})
+        # Interconnection cost is linear per region: (A + B * distance_km) * new_capacity_mw, with
+        # A = base cost * constraint factor and B = transmission cost * terrain factor * constraint factor
+        self._intercon_cost_a = column('interconnection_cost_a', {
+            r: p.base_interconnection_cost_usd_per_mw * p.transmission_constraint_factor for r, p in params.items()})
+        self._intercon_cost_b = column('interconnection_cost_b', {
+            r: p.avg_transmission_cost_usd_per_mw_km * p.avg_terrain_factor * p.transmission_constraint_factor for r, p in params.items()})
+        self._current_solar_mw = column('current_solar_mw', {r: p.current_solar_mw for r, p in params.items()}, default=0.0)
+        self._refresh_max_solar_mw()
+        # Edits to a region's RegionParams are written through to its entries in the arrays
+        for region_name, region_params in params.items():
+            region_params._on_change = functools.partial(self._sync_region_arrays, self._region_index[region_name])
+
+    def _sync_region_arrays(self, region_id: int, region_params: RegionParams):
+        """Rewrites one region's entries in the per-region arrays from its RegionParams."""
+        self._existing_capacity_mw[region_id] = region_params.existing_capacity_mw
+        self._max_solar_pen_pct[region_id] = region_params.max_solar_penetration_pct
+        self._intercon_cost_a[region_id] = region_params.base_interconnection_cost_usd_per_mw * region_params.transmission_constraint_factor
+        self._intercon_cost_b[region_id] = (region_params.avg_transmission_cost_usd_per_mw_km * region_params.avg_terrain_factor
+                                            * region_params.transmission_constraint_factor)
+        self._current_solar_mw[region_id] = region_params.current_solar_mw
+        self._max_solar_mw_arr[region_id] = self._existing_capacity_mw[region_id] * self._max_solar_pen_pct[region_id]
+
+    def _refresh_max_solar_mw(self):
+        """Recomputes the cached solar penetration limits; call after capacity or limit parameters change."""
+        # Max solar penetration is a % of existing total capacity (simplification)
+        self._max_solar_mw_arr = self._existing_capacity_mw * self._max_solar_pen_pct
+
+    def _build_capacity_matrix(self, initial_capacities: Dict[str, Dict[str, float]]):
+        """Builds the dense region x technology capacity matrix (MW).
+
+        Technology j is `self._tech_names[j]`; `self._tech_index` maps names to j and grows as new
+        technologies are added. `self._cap_present` marks which technologies each region has, so
+        regions only report technologies that were configured or invested in there.
+        """
+        self._tech_names: List[str] = []
+        self._tech_index: Dict[str, int] = {}
+        self._cap_matrix = np.zeros((len(self._region_names), 0), dtype=np.float64)
+        self._cap_present = np.zeros((len(self._region_names), 0), dtype=bool)
+        for region_name, capacities_by_tech in initial_capacities.items():
+            if capacities_by_tech:
+                region_id = self._region_index[region_name]
+                tech_ids = self._tech_ids_of(list(capacities_by_tech))
+                self._cap_matrix[region_id, tech_ids] = list(capacities_by_tech.values())
+                self._cap_present[region_id, tech_ids] = True
+
+    def _tech_ids_of(self, tech_names: Sequence[str]) -> np.ndarray:
+        """Translates technology names into capacity matrix columns, adding columns for new technologies."""
+        for tech_name in tech_names:
+            if tech_name not in self._tech_index:
+                tech_name = sys.intern(tech_name)
+                self._tech_index[tech_name] = len(self._tech_names)
+                self._tech_names.append(tech_name)
+        new_columns = len(self._tech_names) - self._cap_matrix.shape[1]
+        if new_columns:
+            self._cap_matrix = np.pad(self._cap_matrix, ((0, 0), (0, new_columns)))
+            self._cap_present = np.pad(self._cap_present, ((0, 0), (0, new_columns)))
+        return np.array([self._tech_index[tech_name] for tech_name in tech_names], dtype=np.intp)
+
+    def _resolve_region(self, region: RegionKey) -> Optional[int]:
+        """Converts a region name or integer region id to its array index; None if unknown."""
+        region_id = self.store.resolve(region)
+        return region_id if region_id is not None and self._configured[region_id] else None
+
+    def region_ids_of(self, region_names: Sequence[str]) -> np.ndarray:
+        """Translates region names into the integer ids used by the batch APIs. Raises KeyError for unknown regions."""
+        return self.store.ids_of(region_names)
 
     def update_for_year(self, year: int, regions: List[str], **kwargs):
         """Updates grid parameters for the specified regions for a given year."""
-        logging.info(f"GridModel updating for year {year} across regions: {regions}")
+        logger.info("GridModel updating for year %d across regions: %s", year, regions)
         for region_name in regions:
             if region_name not in self.regional_data:
-                logging.warning(f"GridModel: Region '{region_name}' not found during update for year {year}.")
+                logger.warning("GridModel: Region '%s' not found during update for year %d.", region_name, year)
                 continue
             # Placeholder for any year-specific updates to grid parameters for this region
             # e.g., self.regional_data[region_name]['current_load_mw'] *= 1.01 # Example: 1% load growth
-            logging.debug(f"  GridModel: Updated region '{region_name}' for year {year}.")
-        logging.info(f"GridModel yearly update for {year} complete.")
+            logger.debug("  GridModel: Updated region '%s' for year %d.", region_name, year)
+        self._refresh_max_solar_mw()
+        logger.info("GridModel yearly update for %d complete.", year)
 
-    def get_max_solar_penetration_mw(self, region_name: str) -> float:
+    def get_max_solar_penetration_mw(self, region_name: RegionKey) -> float:
         """Calculates the maximum allowable solar capacity in MW for a region based on penetration limits."""
-        if region_name not in self.regional_data:
-            logging.warning(f"GridModel: Region '{region_name}' not found for get_max_solar_penetration_mw.")
+        i = self._resolve_region(region_name)
+        if i is None:
+            logger.warning("GridModel: Region '%s' not found for get_max_solar_penetration_mw.", region_name)
             return 0.0
-        
-        region_info = self.regional_data[region_name]
-        # Max solar penetration is a % of existing total capacity (simplification)
-        max_solar_mw = region_info['existing_capacity_mw'] * region_info['max_solar_penetration_pct']
-        return max_solar_mw
+        return float(self._max_solar_mw_arr[i])
 
-    def get_current_solar_mw(self, region_name: str) -> float:
+    def get_current_solar_mw(self, region_name: RegionKey) -> float:
         """Returns the current installed solar capacity in MW for a specific region."""
-        if region_name not in self.regional_data:
-            logging.warning(f"GridModel: Region '{region_name}' not found for get_current_solar_mw.")
+        i = self._resolve_region(region_name)
+        if i is None:
+            logger.warning("GridModel: Region '%s' not found for get_current_solar_mw.", region_name)
             return 0.0
-        return self.regional_data[region_name].get('current_solar_mw', 0.0)
+        return float(self._current_solar_mw[i])
 
-    def add_solar_capacity(self, region_name: str, new_capacity_mw: float):
+    def add_solar_capacity(self, region_name: RegionKey, new_capacity_mw: float):
         """Adds newly installed solar capacity to a region's total."""
-        if region_name not in self.regional_data:
-            logging.warning(f"GridModel: Region '{region_name}' not found for add_solar_capacity.")
+        i = self._resolve_region(region_name)
+        if i is None:
+            logger.warning("GridModel: Region '%s' not found for add_solar_capacity.", region_name)
             return
-        
-        self.regional_data[region_name]['current_solar_mw'] = self.regional_data[region_name].get('current_solar_mw', 0.0) + new_capacity_mw
-        logging.info(f"GridModel: Added {new_capacity_mw} MW of solar to {region_name}. New total: {self.regional_data[region_name]['current_solar_mw']} MW.")
+
+        # Keep the array and the region's dict entry in step
+        self._current_solar_mw[i] += new_capacity_mw
+        region_name = self._region_names[i]
+        self.regional_data[region_name].current_solar_mw = float(self._current_solar_mw[i])
+        logger.info("GridModel: Added %s MW of solar to %s. New total: %s MW.", new_capacity_mw, region_name, self.regional_data[region_name].current_solar_mw)
 
     def add_new_capacity(self, year: int, new_capacity_details: Dict[str, Dict[str, float]]):
         """
@@ -108,73 +282,130 @@ class GridModel:
                 mapping technology names to the new capacity in MW.
                 Example: {'USA': {'AdvancedMonocrystallineSilicon': 50.0, 'LFP_Battery': 20.0}}
         """
-        logging.info(f"GridModel: Updating new capacities for year {year} from investments.")
+        logger.info("GridModel: Updating new capacities for year %d from investments.", year)
+        # Flatten the positive investments into parallel (region id, tech, MW) columns
+        region_ids, tech_names, capacities_mw = [], [], []
         for region_name, tech_investments in new_capacity_details.items():
-            if region_name not in self.regional_data:
-                logging.warning(f"GridModel: Region '{region_name}' not found. Cannot add new capacities: {tech_investments}")
+            region_id = self._resolve_region(region_name)
+            if region_id is None:
+                logger.warning("GridModel: Region '%s' not found. Cannot add new capacities: %s", region_name, tech_investments)
                 continue
+            for tech_name, capacity_mw in tech_investments.items():
+                if capacity_mw > 0: # Skip non-positive investments
+                    region_ids.append(region_id)
+                    tech_names.append(tech_name)
+                    capacities_mw.append(capacity_mw)
 
-            if 'capacities_mw_by_tech' not in self.regional_data[region_name]:
-                self.regional_data[region_name]['capacities_mw_by_tech'] = {}
+        if not region_ids:
+            logger.info("GridModel: Finished updating new capacities for year %d.", year)
+            return
 
-            for tech_name, capacity_mw in tech_investments.items():
-                if capacity_mw <= 0:
-                    continue # Skip non-positive investments
-
-                # Update technology-specific capacity
-                current_tech_capacity = self.regional_data[region_name]['capacities_mw_by_tech'].get(tech_name, 0.0)
-                self.regional_data[region_name]['capacities_mw_by_tech'][tech_name] = current_tech_capacity + capacity_mw
-                logging.info(f"  GridModel: Added {capacity_mw:.2f} MW of {tech_name} to {region_name}. New total for tech: {self.regional_data[region_name]['capacities_mw_by_tech'][tech_name]:.2f} MW.")
-
-                # Heuristic to identify solar PV technologies and update 'current_solar_mw'
-                # This helps maintain compatibility with existing solar-specific logic (e.g., penetration checks)
-                is_solar_pv = False
-                if "PV" in tech_name.upper() or \
-                   "SOLAR" in tech_name.upper() or \
-                   "SILICON" in tech_name.upper() or \
-                   "TOPCON" in tech_name.upper() or \
-                   "PEROVSKITE" in tech_name.upper():
-                    if "BATTERY" not in tech_name.upper(): # Exclude solar+storage if 'Battery' is in name
-                        is_solar_pv = True
-                
-                if is_solar_pv:
-                    self.regional_data[region_name]['current_solar_mw'] = self.regional_data[region_name].get('current_solar_mw', 0.0) + capacity_mw
-                    logging.info(f"    (Solar PV identified) GridModel: Updated total solar capacity in {region_name} by {capacity_mw:.2f} MW. New total solar: {self.regional_data[region_name]['current_solar_mw']:.2f} MW.")
-        logging.info(f"GridModel: Finished updating new capacities for year {year}.")
-
-    def get_current_capacity_by_tech(self, region_name: str) -> Dict[str, float]:
+        # Update technology-specific capacities with one scatter into the capacity matrix
+        region_ids = np.asarray(region_ids, dtype=np.intp)
+        tech_ids = self._tech_ids_of(tech_names)
+        capacities_mw = np.asarray(capacities_mw, dtype=np.float64)
+        np.add.at(self._cap_matrix, (region_ids, tech_ids), capacities_mw)
+        self._cap_present[region_ids, tech_ids] = True
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            new_totals = self._cap_matrix[region_ids, tech_ids]
+            for region_id, tech_name, capacity_mw, new_total in zip(region_ids.tolist(), tech_names, capacities_mw.tolist(), new_totals.tolist()):
+                logger.info("  GridModel: Added %.2f MW of %s to %s. New total for tech: %.2f MW.", capacity_mw, tech_name, self._region_names[region_id], new_total)
+
+        # Solar PV additions also update 'current_solar_mw', which the penetration checks use.
+        # All of them are scattered into the solar array in one pass.
+        is_solar = np.fromiter((_is_solar_pv(tech_name) for tech_name in tech_names), dtype=bool, count=len(tech_names))
+        solar_region_ids = region_ids[is_solar]
+        added_solar_mw = np.bincount(solar_region_ids, weights=capacities_mw[is_solar], minlength=len(self._region_names))
+        self._current_solar_mw += added_solar_mw
+        for region_id in np.unique(solar_region_ids).tolist():
+            region_name = self._region_names[region_id]
+            self.regional_data[region_name].current_solar_mw = float(self._current_solar_mw[region_id])
+            if info_enabled:
+                logger.info("    (Solar PV identified) GridModel: Updated total solar capacity in %s by %.2f MW. New total solar: %.2f MW.",
+                            region_name, added_solar_mw[region_id], self._current_solar_mw[region_id])
+        logger.info("GridModel: Finished updating new capacities for year %d.", year)
+
+    def get_current_capacity_by_tech(self, region_name: RegionKey) -> Dict[str, float]:
         """Returns the current installed capacity by technology in MW for a specific region."""
-        if region_name not in self.regional_data:
-            logging.warning(f"GridModel: Region '{region_name}' not found for get_current_capacity_by_tech.")
+        if self._resolve_region(region_name) is None:
+            logger.warning("GridModel: Region '%s' not found for get_current_capacity_by_tech.", region_name)
             return {}
-        return self.regional_data[region_name].get('capacities_mw_by_tech', {})
+        tech_names, capacities_mw = self.get_current_capacity_arrays(region_name)
+        return dict(zip(tech_names, capacities_mw.tolist()))
+
+    def get_current_capacity_arrays(self, region_name: RegionKey) -> Tuple[List[str], np.ndarray]:
+        """Returns the installed capacity of a region as parallel (tech_names, capacities_mw) arrays.
+
+        capacities_mw is a float64 array aligned with tech_names; both are empty if the region is unknown.
+        """
+        region_id = self._resolve_region(region_name)
+        if region_id is None:
+            logger.warning("GridModel: Region '%s' not found for get_current_capacity_arrays.", region_name)
+            return [], np.zeros(0, dtype=np.float64)
+        tech_ids = np.flatnonzero(self._cap_present[region_id])
+        return [self._tech_names[j] for j in tech_ids], self._cap_matrix[region_id, tech_ids]
 
-    def calculate_interconnection_costs(self, region_name: str, new_capacity_mw: float, distance_km: float = 10.0) -> float:
+    def calculate_interconnection_costs(self, region_name: RegionKey, new_capacity_mw: float, distance_km: float = 10.0) -> float:
         """Calculates interconnection costs for new capacity in a region."""
-        if region_name not in self.regional_data:
-            logging.warning(f"GridModel: Region '{region_name}' not found for calculate_interconnection_costs.")
+        i = self._resolve_region(region_name)
+        if i is None:
+            logger.warning("GridModel: Region '%s' not found for calculate_interconnection_costs.", region_name)
             return float('inf') # Return a high cost if region not found
 
-        region_info = self.regional_data[region_name]
-        base_cost = region_info['base_interconnection_cost_usd_per_mw'] * new_capacity_mw
-        transmission_cost = region_info['avg_transmission_cost_usd_per_mw_km'] * new_capacity_mw * distance_km * region_info['avg_terrain_factor']
-        total_cost = (base_cost + transmission_cost) * region_info['transmission_constraint_factor']
-        return total_cost
+        return float((self._intercon_cost_a[i] + self._intercon_cost_b[i] * distance_km) * new_capacity_mw)
+
+    def calculate_interconnection_costs_batch(self, region_ids: np.ndarray, new_capacity_mw: np.ndarray, distance_km: np.ndarray) -> np.ndarray:
+        """Calculates interconnection costs for many (region, capacity, distance) candidates at once.
+
+        region_ids come from `region_ids_of`; the three arrays are broadcast elementwise.
+        """
+        region_ids, new_capacity_mw, distance_km = np.broadcast_arrays(
+            np.asarray(region_ids, dtype=np.intp), np.asarray(new_capacity_mw, dtype=np.float64), np.asarray(distance_km, dtype=np.float64))
+        shape = region_ids.shape
+        costs = _batch_intercon_cost(np.ascontiguousarray(region_ids).ravel(), np.ascontiguousarray(new_capacity_mw).ravel(),
+                                     np.ascontiguousarray(distance_km).ravel(), self._intercon_cost_a, self._intercon_cost_b)
+        return costs.reshape(shape)
 
-    def check_grid_constraints(self, region_name: str, additional_capacity_mw: float) -> bool:
+    def check_grid_constraints(self, region_name: RegionKey, additional_capacity_mw: float) -> bool:
         """Checks if adding new capacity violates grid constraints (e.g., max solar penetration)."""
-        if region_name not in self.regional_data:
-            logging.warning(f"GridModel: Region '{region_name}' not found for check_grid_constraints.")
+        i = self._resolve_region(region_name)
+        if i is None:
+            logger.warning("GridModel: Region '%s' not found for check_grid_constraints.", region_name)
             return False # Cannot add if region doesn't exist
-        
-        current_solar = self.get_current_solar_mw(region_name)
-        max_solar = self.get_max_solar_penetration_mw(region_name)
-        
+
+        current_solar = float(self._current_solar_mw[i])
+        max_solar = float(self._max_solar_mw_arr[i])
+
         if current_solar + additional_capacity_mw > max_solar:
-            logging.info(f"GridModel Constraint: Adding {additional_capacity_mw} MW to {region_name} (current: {current_solar} MW) would exceed max penetration ({max_solar} MW).")
+            logger.info("GridModel Constraint: Adding %s MW to %s (current: %s MW) would exceed max penetration (%s MW).", additional_capacity_mw, region_name, current_solar, max_solar)
             return False
         return True
 
+    def try_add_solar_batch(self, region_ids: np.ndarray, add_mw: np.ndarray) -> np.ndarray:
+        """Checks penetration limits and adds the admitted solar capacity for many regions in one call.
+
+        Equivalent to calling check_grid_constraints and then add_solar_capacity for each entry in order.
+        Returns a boolean mask of the admitted additions; region_ids come from `region_ids_of`.
+        """
+        region_ids = np.asarray(region_ids, dtype=np.intp)
+        add_mw = np.asarray(add_mw, dtype=np.float64)
+        if np.unique(region_ids).size == region_ids.size:
+            # Each region appears at most once, so every entry is checked against the current total
+            admitted = self._current_solar_mw[region_ids] + add_mw <= self._max_solar_mw_arr[region_ids]
+            self._current_solar_mw[region_ids[admitted]] += add_mw[admitted]
+        else:
+            # Repeated regions: later entries must see the capacity admitted by earlier ones
+            admitted = np.zeros(region_ids.size, dtype=bool)
+            for k, (region_id, capacity_mw) in enumerate(zip(region_ids.tolist(), add_mw.tolist())):
+                if self._current_solar_mw[region_id] + capacity_mw <= self._max_solar_mw_arr[region_id]:
+                    self._current_solar_mw[region_id] += capacity_mw
+                    admitted[k] = True
+        for region_id in np.unique(region_ids[admitted]).tolist():
+            region_name = self._region_names[region_id]
+            self.regional_data[region_name].current_solar_mw = float(self._current_solar_mw[region_id])
+        return admitted
+
 # Example Usage (for testing purposes, can be removed or commented out)
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
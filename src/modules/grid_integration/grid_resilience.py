@@ -4,6 +4,18 @@ cybersecurity vulnerabilities, and system adequacy under stress scenarios.
 Also considers grid-enhancing technologies.
 """
 
+from typing import Sequence
+
+import numpy as np
+
+# Criticality / likelihood levels encoded as small ints; missing or unrecognised levels count as 'low'
+_LEVEL_CODES = {'low': 0, 'medium': 1, 'high': 2}
+_RISK_LEVELS = np.array(['low', 'medium', 'high'])
+# Risk code by [criticality code, likelihood code]: only high-criticality components carry elevated risk
+_RISK_LUT = np.array([[0, 0, 0],
+                      [0, 0, 0],
+                      [0, 1, 2]], dtype=np.int8)
+
 class GridResilienceAssessor:
     """A class to assess and enhance grid resilience."""
     def __init__(self, grid_topology_data: dict, threat_models: dict):
@@ -14,6 +26,12 @@ class GridResilienceAssessor:
         """
         self.grid_topology_data = grid_topology_data
         self.threat_models = threat_models
+        # Encoded criticality per component and likelihood per threat for batch risk evaluation.
+        # The extra trailing entry (code 0, 'low') stands in for unknown ids.
+        self._component_index = {component_id: i for i, component_id in enumerate(grid_topology_data)}
+        self._crit = np.array([_LEVEL_CODES.get(component.get('criticality'), 0) for component in grid_topology_data.values()] + [0], dtype=np.int8)
+        self._threat_index = {attack_vector: i for i, attack_vector in enumerate(threat_models)}
+        self._threat_lik = np.array([_LEVEL_CODES.get(threat.get('likelihood'), 0) for threat in threat_models.values()] + [0], dtype=np.int8)
         print(f"GridResilienceAssessor initialized with {len(grid_topology_data)} topology elements and {len(threat_models)} threat models.")
 
     def assess_climate_impact(self, climate_event: str, region: str) -> dict:
@@ -36,16 +54,23 @@ class GridResilienceAssessor:
         # Placeholder logic
         component = self.grid_topology_data.get(component_id, {})
         threat = self.threat_models.get(attack_vector, {})
-        risk_level = "low"
+        crit = _LEVEL_CODES.get(component.get('criticality'), 0)
+        lik = _LEVEL_CODES.get(threat.get('likelihood'), 0)
+        risk_level = _RISK_LEVELS[_RISK_LUT[crit, lik]].item()
 
-        if component.get('criticality') == 'high' and threat.get('likelihood') == 'medium':
-            risk_level = "medium"
-        elif component.get('criticality') == 'high' and threat.get('likelihood') == 'high':
-            risk_level = "high"
-        
         print(f"Cybersecurity risk for component '{component_id}' via '{attack_vector}': {risk_level}")
         return risk_level
 
+    def evaluate_cybersecurity_risk_batch(self, component_ids: Sequence[str], attack_vectors: Sequence[str]) -> np.ndarray:
+        """Evaluates cybersecurity risk for many (component, attack vector) pairs at once.
+
+        Returns an array of risk levels ('low', 'medium', 'high') matching evaluate_cybersecurity_risk.
+        """
+        unknown_component, unknown_threat = len(self._component_index), len(self._threat_index)
+        comp_ids = np.array([self._component_index.get(c, unknown_component) for c in component_ids], dtype=np.intp)
+        attack_ids = np.array([self._threat_index.get(a, unknown_threat) for a in attack_vectors], dtype=np.intp)
+        return _RISK_LEVELS[_RISK_LUT[self._crit[comp_ids], self._threat_lik[attack_ids]]]
+
     def recommend_grid_enhancing_tech(self, problem_type: str) -> list:
         """Recommends grid-enhancing technologies based on the problem type."""
         recommendations = []
@@ -3,13 +3,36 @@ Models transmission expansion planning, including costs, timelines, and constrai
 for major grid regions and cross-border interconnections.
 """
 
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from .grid_data_store import GridDataStore
+
+DEFAULT_EXPANSION_COST_PER_GW_MILE = 1000000 # USD
+
 class TransmissionPlanner:
     """A class to model and plan transmission infrastructure expansion."""
-    def __init__(self, regional_grid_data: dict):
+    def __init__(self, regional_grid_data: dict, store: Optional[GridDataStore] = None):
         """Initializes TransmissionPlanner with regional grid data.
         regional_grid_data: e.g., {'RegionA': {'capacity_gw': 100, 'expansion_cost_per_gw_mile': 1M}}
+        store: optional shared GridDataStore (e.g. the one a GridModel was built on); batch methods
+            index regions by its ids. By default the planner gets its own store over regional_grid_data.
         """
         self.regional_grid_data = regional_grid_data
+        self.store = store if store is not None else GridDataStore(list(regional_grid_data))
+        # Per-region columns for batch evaluation; regions without data have an infinite expansion cost
+        with_data = {}
+        for region, data in regional_grid_data.items():
+            if region not in self.store.region_index:
+                print(f"Warning: Region '{region}' is not in the shared GridDataStore; batch methods will treat it as unknown.")
+            elif data:
+                with_data[region] = data
+        self._has_data = self.store.add_column('has_transmission_data', dict.fromkeys(with_data, True), default=False, dtype=bool)
+        self._cost_per_gw_mile = self.store.add_column('expansion_cost_per_gw_mile', {
+            region: data.get('expansion_cost_per_gw_mile', DEFAULT_EXPANSION_COST_PER_GW_MILE) for region, data in with_data.items()}, default=np.inf)
+        self._capacity_gw = self.store.add_column('transmission_capacity_gw', {
+            region: data['capacity_gw'] for region, data in with_data.items() if 'capacity_gw' in data})
         print(f"TransmissionPlanner initialized for {len(self.regional_grid_data)} regions.")
 
     def evaluate_expansion_project(self, region: str, new_capacity_gw: float, distance_miles: float) -> dict:
@@ -19,7 +42,7 @@ class TransmissionPlanner:
             print(f"Warning: Grid data not found for region '{region}'.")
             return {'cost_estimate_usd': float('inf'), 'status': 'failed_no_data'}
 
-        cost_per_gw_mile = region_data.get('expansion_cost_per_gw_mile', 1000000) # Default 1M USD
+        cost_per_gw_mile = region_data.get('expansion_cost_per_gw_mile', DEFAULT_EXPANSION_COST_PER_GW_MILE)
         estimated_cost = new_capacity_gw * distance_miles * cost_per_gw_mile
         
         # Placeholder for timeline and constraint checks
@@ -36,6 +59,39 @@ class TransmissionPlanner:
             'timeline_years': estimated_timeline_years
         }
 
+    def evaluate_expansion_projects(self, regions: Sequence[Union[str, int]], new_capacity_gw, distance_miles) -> Dict[str, np.ndarray]:
+        """Evaluates a portfolio of expansion projects in one pass.
+
+        regions may be region names or integer ids (positions in regional_grid_data). Capacities and
+        distances broadcast against regions. Projects in regions without grid data get an infinite
+        cost and a NaN timeline, mirroring the 'failed_no_data' result of evaluate_expansion_project.
+        """
+        region_ids = self._region_ids_of(regions)
+        new_capacity_gw, distance_miles = np.broadcast_arrays(
+            np.asarray(new_capacity_gw, dtype=np.float64), np.asarray(distance_miles, dtype=np.float64))
+        gw_miles = new_capacity_gw * distance_miles
+        # Unknown regions (id -1) are read from slot 0 and then masked out
+        known = region_ids >= 0
+        safe_ids = np.where(known, region_ids, 0)
+        cost_per_gw_mile = self._cost_per_gw_mile[safe_ids]
+        has_data = known & self._has_data[safe_ids]
+        return {
+            'region_ids': region_ids,
+            'new_capacity_gw': new_capacity_gw,
+            'distance_miles': distance_miles,
+            'cost_estimate_usd': np.where(has_data, gw_miles * np.where(has_data, cost_per_gw_mile, 0.0), np.inf),
+            'timeline_years': np.where(has_data, 3.0 + gw_miles / 1000.0, np.nan),
+        }
+
+    def _region_ids_of(self, regions: Sequence[Union[str, int]]) -> np.ndarray:
+        """Maps region names (or store ids) to store ids; unknown regions map to -1."""
+        regions = np.asarray(regions)
+        if np.issubdtype(regions.dtype, np.integer):
+            region_ids = regions.astype(np.intp, copy=False)
+            return np.where((region_ids >= 0) & (region_ids < len(self.store)), region_ids, -1)
+        region_index = self.store.region_index
+        return np.array([region_index.get(name, -1) for name in regions.tolist()], dtype=np.intp)
+
     def assess_interconnection_viability(self, region_a: str, region_b: str, capacity_gw: float) -> str:
         """Assesses the viability of a cross-border interconnection."""
         # Placeholder for more complex viability assessment
@@ -45,6 +101,15 @@ class TransmissionPlanner:
             return "Potentially Viable (Further study needed)"
         return "Likely Not Viable (Missing regional data or major constraints)"
 
+    def assess_interconnection_matrix(self) -> np.ndarray:
+        """Returns an n x n bool matrix, in store region order (regional_grid_data order by default),
+        of region pairs that assess_interconnection_viability would consider potentially viable.
+
+        Like the other batch methods it reflects regional_grid_data as it was at construction, and
+        only covers regions in the store.
+        """
+        return np.outer(self._has_data, self._has_data)
+
 if __name__ == '__main__':
     # Example Usage
     grid_data = {
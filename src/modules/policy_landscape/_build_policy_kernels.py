@@ -0,0 +1,34 @@
+"""
+Ahead-of-time build of the policy kernels.
+
+Compiles `_capex_factor_batch_loop` into the `_policy_kernels_aot` extension next to this file,
+so `_policy_kernels` can import it instead of JIT-compiling on the first call (which every
+fresh worker process would otherwise pay). Requires numba and a C compiler:
+
+    python -m src.modules.policy_landscape._build_policy_kernels
+
+Note: `numba.pycc` has been pending deprecation since Numba 0.57 and will be removed once
+its replacement ships. Without it, `_policy_kernels` keeps using the cached JIT kernel.
+"""
+
+import os
+
+try:
+    from numba.pycc import CC
+except ImportError as e:
+    raise ImportError("Building the AOT policy kernels requires a numba release that still ships numba.pycc; "
+                      "without it the cached JIT kernel in _policy_kernels is used instead.") from e
+
+from ._policy_kernels_src import _capex_factor_batch_loop, CAPEX_FACTOR_BATCH_SIGNATURE
+
+
+def build(output_dir: str = None) -> None:
+    """Builds the extension module into output_dir (defaults to this package)."""
+    cc = CC('_policy_kernels_aot')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.export('capex_factor_batch', CAPEX_FACTOR_BATCH_SIGNATURE)(_capex_factor_batch_loop)
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,42 @@
+"""
+Numeric kernels backing PolicyModel's batch APIs.
+
+Numba is optional: when it is installed the batched CAPEX factor reduction runs as one
+parallel pass over the queries, without materialising the (queries x policies) mask;
+otherwise an equivalent NumPy implementation is used. A precompiled extension built by
+`_build_policy_kernels` is preferred when present, so runs (and worker processes) start
+without any JIT compilation.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
+from ._policy_kernels_src import _capex_factor_batch_loop
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def _capex_factor_batch_numpy(start_years, end_years, values, region_match, region_ids, tech_match, tech_ids, years):
+    """Returns 1 - min(sum of applicable CAPEX reductions, 1) for every query.
+
+    region_match/tech_match are (distinct query values x policies) applicability tables and
+    region_ids/tech_ids give each query's row in them.
+    """
+    active = ((start_years[None, :] <= years[:, None]) & (years[:, None] <= end_years[None, :])
+              & region_match[region_ids] & tech_match[tech_ids])
+    return 1.0 - np.minimum(np.where(active, values[None, :], 0.0).sum(axis=1), 1.0)
+
+
+try:
+    from ._policy_kernels_aot import capex_factor_batch as _capex_factor_batch
+    AOT_AVAILABLE = True
+except ImportError:  # extension not built; fall back to JIT or NumPy
+    AOT_AVAILABLE = False
+    if NUMBA_AVAILABLE:
+        _capex_factor_batch = numba.njit(cache=True, parallel=True)(_capex_factor_batch_loop)
+    else:
+        _capex_factor_batch = _capex_factor_batch_numpy
@@ -0,0 +1,37 @@
+"""
+Pure-Python source of the policy kernels.
+
+Kept separate from `_policy_kernels` so the AOT build can import the loop and its
+signature without going through the JIT set-up done there at import time.
+"""
+
+import numpy as np
+
+try:
+    from numba import prange
+except ImportError:  # numba is an optional accelerator
+    prange = range
+
+# Explicit signature used by the AOT build
+CAPEX_FACTOR_BATCH_SIGNATURE = ('float64[::1](float64[::1], float64[::1], float64[::1], boolean[:, ::1], intp[::1], '
+                                'boolean[:, ::1], intp[::1], float64[::1])')
+
+
+def _capex_factor_batch_loop(start_years, end_years, values, region_match, region_ids, tech_match, tech_ids, years):
+    """Returns 1 - min(sum of applicable CAPEX reductions, 1) for every query.
+
+    region_match/tech_match are (distinct query values x policies) applicability tables and
+    region_ids/tech_ids give each query's row in them.
+    """
+    n_queries = years.shape[0]
+    out = np.empty(n_queries)
+    for q in prange(n_queries):
+        year = years[q]
+        region_row = region_match[region_ids[q]]
+        tech_row = tech_match[tech_ids[q]]
+        reduction = 0.0
+        for p in range(values.shape[0]):
+            if start_years[p] <= year and year <= end_years[p] and region_row[p] and tech_row[p]:
+                reduction += values[p]
+        out[q] = 1.0 - min(reduction, 1.0)
+    return out
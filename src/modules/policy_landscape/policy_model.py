@@ -1,12 +1,71 @@
+import bisect
 import datetime
+import functools
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Collection, Dict, Iterator, Optional
+
+import numpy as np
+
+from ._policy_kernels import _capex_factor_batch
+
+logger = logging.getLogger(__name__)
+
+# Year used when a query gives none; read once at import rather than on every query
+_DEFAULT_YEAR = datetime.date.today().year
+
+@dataclass(slots=True, frozen=True, eq=False)
+class Policy:
+    """A policy record with its filter fields normalised at ingestion.
+
+    Missing years become -inf/inf and a missing value 0, so the query paths read attributes
+    instead of re-applying dict.get defaults. The original dict is kept as `source`; item access,
+    `in` and get() read it, so a Policy can stand in for the policy dicts PolicyModel used to return.
+    """
+    id: Any
+    type: Any
+    value: Any
+    region: Any
+    applicable_regions: Collection
+    technology_scope: Optional[Collection]
+    start_year: float
+    end_year: float
+    target_year: float
+    source: Dict[str, Any] = field(repr=False)
+
+    @classmethod
+    def from_dict(cls, policy_dict: Dict[str, Any]) -> 'Policy':
+        return cls(
+            id=policy_dict.get('id'),
+            type=policy_dict.get('type'),
+            value=policy_dict.get('value', 0),
+            region=policy_dict.get('region'),
+            applicable_regions=policy_dict.get('applicable_regions', ()),
+            technology_scope=policy_dict.get('technology_scope'),
+            start_year=policy_dict.get('start_year', -float('inf')),
+            end_year=policy_dict.get('end_year', float('inf')),
+            target_year=policy_dict.get('target_year', float('inf')),
+            source=policy_dict,
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        return self.source[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.source
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.source.get(key, default)
 
 class PolicyModel:
     """Models climate policies, support mechanisms, and their financial impacts."""
 
-    def __init__(self, policies: list = None):
+    def __init__(self, policies: list = None, verbose: bool = False):
         """
         Initializes the PolicyModel with a list of policy details.
-        Policies is a list of dictionaries, e.g.:
+        Policies is a list of dictionaries (stored as Policy records in self.policies), e.g.:
         [
             {
                 'id': 'US_ITC_SOLAR_2025',
@@ -38,31 +97,141 @@ class PolicyModel:
                 'description': 'German grant for small rooftop PV systems'
             }
         ]
+        Per-query details are logged at DEBUG level; verbose=True sets this module's logger to DEBUG.
         """
-        self.policies = policies if policies else []
-        print(f"PolicyModel initialized with {len(self.policies)} policies.")
+        if verbose:
+            logger.setLevel(logging.DEBUG)
+        self.policies = [self._as_policy(policy) for policy in policies] if policies else []
+        # Positions in self.policies, bucketed by policy type and by the regions each policy names
+        # (its 'region' and its 'applicable_regions'); policies without a region go in _any_region.
+        # Buckets stay in ascending position order, so filtered results keep the policies' order.
+        self._by_type = {}
+        self._by_region = {}
+        self._any_region = []
+        # Region, type and technology names interned to int codes, and each policy's filter fields in
+        # code form (region code or None, type code, applicable region codes, technology codes or None)
+        self._region_code = {}
+        self._type_code = {}
+        self._tech_code = {}
+        self._coded_filters = []
+        for position, policy in enumerate(self.policies):
+            self._index_policy(position, policy)
+        # Active years of every policy as parallel columns, so the year filter is one vectorized comparison
+        self._start_years = np.array([policy.start_year for policy in self.policies], dtype=np.float64)
+        self._end_years = np.array([policy.end_year for policy in self.policies], dtype=np.float64)
+        # Per-instance memo of active policy positions by (region, year, type, technology); cleared by add_policy
+        self._active_positions_cached = functools.lru_cache(maxsize=4096)(self._active_positions)
+        # Positions and year columns grouped by policy type for typed queries; built on first use
+        self._type_grouped_columns = None
+        # Columns of the CAPEX-reducing policies for calculate_effective_capex_factor_batch; built on first use
+        self._capex_policy_arrays = None
+        # Carbon price policies by region, sorted by start year, for get_carbon_price; built on first use
+        self._carbon_price_index = None
+        logger.info("PolicyModel initialized with %d policies.", len(self.policies))
+
+    @staticmethod
+    def _as_policy(policy) -> Policy:
+        return policy if isinstance(policy, Policy) else Policy.from_dict(policy)
+
+    def _index_policy(self, position: int, policy: Policy):
+        """Adds the policy at `position` in self.policies to the type and region indexes."""
+        self._coded_filters.append((
+            None if policy.region is None else self._region_code.setdefault(policy.region, len(self._region_code)),
+            self._type_code.setdefault(policy.type, len(self._type_code)),
+            frozenset(self._region_code.setdefault(r, len(self._region_code)) for r in policy.applicable_regions),
+            None if policy.technology_scope is None
+            else frozenset(self._tech_code.setdefault(t, len(self._tech_code)) for t in policy.technology_scope),
+        ))
+        self._by_type.setdefault(policy.type, []).append(position)
+        if policy.region is None:
+            # Matches every region, so its applicable_regions need no entries
+            self._any_region.append(position)
+            return
+        for named_region in dict.fromkeys([policy.region, *policy.applicable_regions]):
+            self._by_region.setdefault(named_region, []).append(position)
 
     def add_policy(self, policy_dict: dict):
-        """Adds a new policy to the model."""
-        self.policies.append(policy_dict)
-        print(f"Added policy: {policy_dict.get('id', 'Unknown Policy')}")
-
-    def get_active_policies(self, region: str = None, year: int = None, policy_type: str = None, technology: str = None) -> list:
-        """Retrieves policies active for a given region, year, type, and technology."""
-        active_policies = []
-        current_year = year if year is not None else datetime.date.today().year
-
-        for policy in self.policies:
-            region_match = (region is None or policy.get('region') is None or policy.get('region') == region or region in policy.get('applicable_regions', []))
-            year_match = (policy.get('start_year', -float('inf')) <= current_year <= policy.get('end_year', float('inf')))
-            type_match = (policy_type is None or policy.get('type') == policy_type)
-            tech_match = (technology is None or 
-                          policy.get('technology_scope') is None or 
-                          technology in policy.get('technology_scope', []))
-            
-            if region_match and year_match and type_match and tech_match:
-                active_policies.append(policy)
-        return active_policies
+        """Adds a new policy (a dict or a Policy) to the model."""
+        policy = self._as_policy(policy_dict)
+        self.policies.append(policy)
+        self._index_policy(len(self.policies) - 1, policy)
+        self._start_years = np.append(self._start_years, policy.start_year)
+        self._end_years = np.append(self._end_years, policy.end_year)
+        self._active_positions_cached.cache_clear()
+        self._type_grouped_columns = None
+        self._capex_policy_arrays = None
+        self._carbon_price_index = None
+        logger.info("Added policy: %s", policy.get('id', 'Unknown Policy'))
+
+    def _candidate_positions(self, region: str = None):
+        """Returns the positions of policies that can match the region filter, in ascending order."""
+        if region is not None:
+            return list(heapq.merge(self._by_region.get(region, []), self._any_region))
+        return range(len(self.policies))
+
+    def get_active_policies(self, region: str = None, year: int = None, policy_type: str = None, technology: str = None,
+                            min_target_year: float = None) -> list:
+        """Retrieves policies (as Policy records) active for a given region, year, type, and technology.
+        If min_target_year is given, only policies whose target_year is at least that year are returned.
+
+        Results are memoized; policies must be added through add_policy (not by editing
+        self.policies or the policy dicts in place) for later queries to see them.
+        """
+        return list(self.iter_active_policies(region, year, policy_type, technology, min_target_year))
+
+    def iter_active_policies(self, region: str = None, year: int = None, policy_type: str = None, technology: str = None,
+                             min_target_year: float = None) -> Iterator[Policy]:
+        """Yields the policies get_active_policies would return, in the same order, without building a list.
+        Callers that only need the first match can use next(model.iter_active_policies(...), None).
+        """
+        current_year = year if year is not None else _DEFAULT_YEAR
+        policies = self.policies
+        for position in self._active_positions_cached(region, current_year, policy_type, technology, min_target_year):
+            yield policies[position]
+
+    def _active_positions(self, region, current_year: int, policy_type, technology, min_target_year) -> tuple:
+        """Returns the positions in self.policies of the policies matching the filters, in order."""
+        if policy_type is not None:
+            # Policies of one type are a contiguous run of the type-grouped columns, so slice instead of gathering
+            type_code = self._type_code.get(policy_type)
+            if type_code is None:
+                return ()
+            order, start_years, end_years, bounds = self._get_type_grouped_columns()
+            run = slice(bounds[type_code], bounds[type_code + 1])
+            candidates = order[run]
+            in_year = (start_years[run] <= current_year) & (current_year <= end_years[run])
+        else:
+            candidates = np.asarray(self._candidate_positions(region), dtype=np.intp)
+            # Year filter over the candidates' year columns; the remaining filters run on the survivors only
+            in_year = (self._start_years[candidates] <= current_year) & (current_year <= self._end_years[candidates])
+        # Names never seen in any policy get code -1, which matches no policy's codes
+        region_code = self._region_code.get(region, -1)
+        type_code = self._type_code.get(policy_type, -1)
+        tech_code = self._tech_code.get(technology, -1)
+        active_positions = []
+        for position in candidates[in_year].tolist():
+            policy_region, policy_type_code, applicable_regions, technology_scope = self._coded_filters[position]
+            region_match = (region is None or policy_region is None or policy_region == region_code or region_code in applicable_regions)
+            type_match = (policy_type is None or policy_type_code == type_code)
+            tech_match = (technology is None or
+                          technology_scope is None or
+                          tech_code in technology_scope)
+            target_match = (min_target_year is None or self.policies[position].target_year >= min_target_year)
+
+            if region_match and type_match and tech_match and target_match:
+                active_positions.append(position)
+        return tuple(active_positions)
+
+    def _get_type_grouped_columns(self):
+        """Returns (order, start_years, end_years, bounds): self.policies' positions stably sorted by type code,
+        the year columns in that order, and bounds such that type code c occupies order[bounds[c]:bounds[c + 1]]."""
+        if self._type_grouped_columns is None:
+            type_codes = np.fromiter((coded[1] for coded in self._coded_filters), dtype=np.intp, count=len(self._coded_filters))
+            # Stable, so positions stay ascending within each type and results keep the policies' order
+            order = np.argsort(type_codes, kind='stable')
+            bounds = np.searchsorted(type_codes[order], np.arange(len(self._type_code) + 1))
+            self._type_grouped_columns = (order, self._start_years[order], self._end_years[order], bounds)
+        return self._type_grouped_columns
 
     def calculate_effective_capex_factor(self, region: str, year: int, technology: str = None) -> float:
         """
@@ -70,44 +239,115 @@ class PolicyModel:
         A factor of 1.0 means no change. A factor of 0.7 means CAPEX is reduced by 30%.
         Considers ITCs and direct CAPEX grants.
         """
-        itc_policies = self.get_active_policies(region=region, year=year, policy_type='itc', technology=technology)
-        grant_capex_percentage_policies = self.get_active_policies(region=region, year=year, policy_type='grant_capex_percentage', technology=technology)
+        itc_policies = self.iter_active_policies(region=region, year=year, policy_type='itc', technology=technology)
+        grant_capex_percentage_policies = self.iter_active_policies(region=region, year=year, policy_type='grant_capex_percentage', technology=technology)
         
         total_reduction_percentage = 0.0
+        # Resolve the log level once; the per-policy messages are only built when they will be emitted
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        # Sum ITCs (assuming they are stackable if multiple apply, though unusual)
-        for policy in itc_policies:
-            total_reduction_percentage += policy.get('value', 0)
-            print(f"  Applying ITC: {policy.get('id')} ({policy.get('value')*100}% reduction)")
+        # Sum ITCs, then percentage grants (assuming they are stackable if multiple apply, though unusual).
+        # Reductions are non-negative, so once the sum reaches 100% the remaining policies cannot change the result.
+        for policy in itertools.chain(itc_policies, grant_capex_percentage_policies):
+            total_reduction_percentage += policy.value
+            if debug_enabled:
+                logger.debug("  Applying %s: %s (%s%% reduction)", 'ITC' if policy.type == 'itc' else 'CAPEX Grant', policy.id, policy.value*100)
+            if total_reduction_percentage >= 1.0:
+                # Ensure reduction doesn't exceed 100%
+                total_reduction_percentage = 1.0
+                break
 
-        # Sum percentage grants (assuming stackable with ITCs and other grants)
-        for policy in grant_capex_percentage_policies:
-            total_reduction_percentage += policy.get('value', 0)
-            print(f"  Applying CAPEX Grant: {policy.get('id')} ({policy.get('value')*100}% reduction)")
-        
-        # Ensure reduction doesn't exceed 100%
-        total_reduction_percentage = min(total_reduction_percentage, 1.0)
-        
         effective_capex_factor = 1.0 - total_reduction_percentage
-        print(f"Effective CAPEX factor for {region} in {year} (Tech: {technology if technology else 'Any'}): {effective_capex_factor:.3f}")
+        if debug_enabled:
+            logger.debug("Effective CAPEX factor for %s in %s (Tech: %s): %.3f", region, year, technology if technology else 'Any', effective_capex_factor)
         return effective_capex_factor
 
+    def calculate_effective_capex_factor_batch(self, regions, years, technologies=None) -> np.ndarray:
+        """
+        Vectorized calculate_effective_capex_factor over parallel arrays of queries.
+        technologies may be None (any technology for every query) or a sequence with None entries.
+        Returns a float64 array of effective CAPEX factors, one per query.
+        """
+        regions = list(regions)
+        years = np.ascontiguousarray(years, dtype=np.float64)
+        technologies = [None] * len(regions) if technologies is None else list(technologies)
+        policies, start_years, end_years, values = self._get_capex_policy_arrays()
+        if not policies:
+            return np.ones(len(regions))
+
+        # Region and technology applicability only depend on the distinct query values
+        unique_regions = {region: i for i, region in enumerate(dict.fromkeys(regions))}
+        region_match = np.array([[region is None or policy.region is None or policy.region == region or region in policy.applicable_regions
+                                  for policy in policies] for region in unique_regions], dtype=bool).reshape(len(unique_regions), len(policies))
+        region_inverse = np.array([unique_regions[region] for region in regions], dtype=np.intp)
+        unique_techs = {technology: i for i, technology in enumerate(dict.fromkeys(technologies))}
+        tech_match = np.array([[technology is None or policy.technology_scope is None or technology in policy.technology_scope
+                                for policy in policies] for technology in unique_techs], dtype=bool).reshape(len(unique_techs), len(policies))
+        tech_inverse = np.array([unique_techs[technology] for technology in technologies], dtype=np.intp)
+
+        # Sum the reductions of the policies applicable to each query, capped at 100%
+        return _capex_factor_batch(start_years, end_years, values, region_match, region_inverse, tech_match, tech_inverse, years)
+
+    def _get_capex_policy_arrays(self):
+        """Returns the ITC and CAPEX grant policies with their start years, end years and values as arrays."""
+        if self._capex_policy_arrays is None:
+            positions = np.array([position for policy_type in ('itc', 'grant_capex_percentage')
+                                  for position in self._by_type.get(policy_type, [])], dtype=np.intp)
+            policies = [self.policies[position] for position in positions.tolist()]
+            self._capex_policy_arrays = (
+                policies,
+                self._start_years[positions],
+                self._end_years[positions],
+                np.array([policy.value for policy in policies], dtype=np.float64),
+            )
+        return self._capex_policy_arrays
+
     def get_carbon_price(self, region: str, year: int) -> float:
         """
         Retrieves the applicable carbon price in USD/ton CO2 for a given region and year.
         If multiple carbon prices are found (e.g., sub-regional), it currently returns the first one found.
         A more sophisticated model might average or prioritize.
         """
-        carbon_policies = self.get_active_policies(region=region, year=year, policy_type='carbon_price')
-        if carbon_policies:
+        position = self._first_carbon_price_position(region, year)
+        if position is not None:
             # For simplicity, taking the first applicable carbon price found.
             # Real-world scenarios might need weighted averages or more specific targeting.
-            price = carbon_policies[0].get('value', 0)
-            print(f"Carbon price for {region} in {year}: ${price}/ton CO2 (Policy: {carbon_policies[0].get('id')})")
+            carbon_policy = self.policies[position]
+            price = carbon_policy.value
+            logger.debug("Carbon price for %s in %s: $%s/ton CO2 (Policy: %s)", region, year, price, carbon_policy.id)
             return price
-        print(f"No active carbon price found for {region} in {year}.")
+        logger.debug("No active carbon price found for %s in %s.", region, year)
         return 0.0
 
+    def _first_carbon_price_position(self, region: str, year: int):
+        """Returns the position of the first carbon price policy (in policy order) active for region and year, or None."""
+        if self._carbon_price_index is None:
+            # region -> (start years, [(end year, position)]) sorted by start year; key None holds the
+            # region-less policies, which apply everywhere
+            entries_by_region = {}
+            for position in self._by_type.get('carbon_price', []):
+                policy = self.policies[position]
+                regions = [None] if policy.region is None else dict.fromkeys([policy.region, *policy.applicable_regions])
+                for named_region in regions:
+                    entries_by_region.setdefault(named_region, []).append((policy.start_year, policy.end_year, position))
+            self._carbon_price_index = {}
+            for named_region, entries in entries_by_region.items():
+                entries.sort()
+                self._carbon_price_index[named_region] = ([start for start, _, _ in entries], [(end, position) for _, end, position in entries])
+
+        current_year = year if year is not None else _DEFAULT_YEAR
+        if region is None:
+            buckets = self._carbon_price_index.values()
+        else:
+            buckets = [self._carbon_price_index[key] for key in (region, None) if key in self._carbon_price_index]
+        first_position = None
+        for starts, ends_and_positions in buckets:
+            # Only entries that have started by current_year can be active
+            for end, position in ends_and_positions[:bisect.bisect_right(starts, current_year)]:
+                if current_year <= end and (first_position is None or position < first_position):
+                    first_position = position
+        return first_position
+
     def get_ptc_value(self, region: str, year: int, technology: str = None) -> float:
         """
         Retrieves the applicable Production Tax Credit (PTC) value for a given region, year, and technology.
@@ -115,15 +355,14 @@ class PolicyModel:
         If multiple PTCs are found, it currently returns the first one found.
         A more sophisticated model might average, prioritize, or sum if stackable.
         """
-        ptc_policies = self.get_active_policies(region=region, year=year, policy_type='ptc', technology=technology)
-        if ptc_policies:
-            # For simplicity, taking the first applicable PTC found.
-            ptc_policy = ptc_policies[0]
-            value = ptc_policy.get('value', 0)
+        # For simplicity, taking the first applicable PTC found.
+        ptc_policy = next(self.iter_active_policies(region=region, year=year, policy_type='ptc', technology=technology), None)
+        if ptc_policy is not None:
+            value = ptc_policy.value
             unit = ptc_policy.get('unit', 'currency/energy_unit') # e.g., USD/kWh
-            print(f"PTC for {technology} in {region} ({year}): {value} {unit} (Policy: {ptc_policy.get('id')})")
+            logger.debug("PTC for %s in %s (%s): %s %s (Policy: %s)", technology, region, year, value, unit, ptc_policy.id)
             return value
-        print(f"No active PTC found for {technology} in {region} ({year}).")
+        logger.debug("No active PTC found for %s in %s (%s).", technology, region, year)
         return 0.0
 
     def get_rps_target(self, region: str, year: int, technology: str = None) -> dict:
@@ -135,36 +374,29 @@ class PolicyModel:
         or None if no suitable RPS policy is found.
         It currently returns the first active RPS policy found matching the criteria.
         """
-        # RPS policies are relevant if their target_year is in the future or current year
-        # and the policy's own start_year has been met.
-        rps_policies = []
-        for policy in self.get_active_policies(region=region, policy_type='rps', technology=technology):
-            # Ensure the policy is still relevant (target year not passed too far, or within its active period)
-            # and the 'target_year' for RPS is a key consideration.
-            if policy.get('start_year', -float('inf')) <= year <= policy.get('end_year', float('inf')):
-                 # For RPS, we are interested if the current year is before or at its target_year
-                if year <= policy.get('target_year', float('inf')):
-                    rps_policies.append(policy)
-
-        if rps_policies:
-            # For simplicity, taking the first applicable RPS policy found.
-            # A more complex model might prioritize (e.g., by nearest target_year or highest target_percentage)
-            rps_policy = rps_policies[0] 
+        # RPS policies are relevant if they are active in `year` and their target_year
+        # is in the future or the current year.
+        # For simplicity, taking the first applicable RPS policy found.
+        # A more complex model might prioritize (e.g., by nearest target_year or highest target_percentage)
+        rps_policy = next(self.iter_active_policies(region=region, year=year, policy_type='rps', technology=technology, min_target_year=year), None)
+
+        if rps_policy is not None:
             target_info = {
                 'policy_id': rps_policy.get('id'),
                 'target_percentage': rps_policy.get('value'), # 'value' holds the percentage
                 'target_year': rps_policy.get('target_year'),
                 'eligible_technologies': rps_policy.get('technology_scope') # Re-using technology_scope for eligibility
             }
-            print(f"RPS Target for {region} ({year}) (Tech: {technology if technology else 'Any'}): "
-                  f"{target_info['target_percentage']*100}% by {target_info['target_year']} "
-                  f"(Policy: {target_info['policy_id']})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("RPS Target for %s (%s) (Tech: %s): %s%% by %s (Policy: %s)", region, year, technology if technology else 'Any',
+                             target_info['target_percentage']*100, target_info['target_year'], target_info['policy_id'])
             return target_info
         
-        print(f"No active RPS target found for {region} ({year}) (Tech: {technology if technology else 'Any'}).")
+        logger.debug("No active RPS target found for %s (%s) (Tech: %s).", region, year, technology if technology else 'Any')
         return None
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
     example_policies = [
         {
             'id': 'US_ITC_SOLAR_2025',
@@ -3,36 +3,65 @@ Tracks climate policy implementation, including Nationally Determined Contributi
 regional net-zero strategies, and Renewable Portfolio Standards (RPS).
 """
 
+import functools
+import types
+from dataclasses import dataclass
+from typing import Any
+
+# Shared read-only stand-in for a missing jurisdiction, so misses allocate nothing
+_EMPTY = types.MappingProxyType({})
+
+@dataclass(slots=True, frozen=True)
+class NdcStatus:
+    """NDC status of a country, as returned by PolicyTracker.get_ndc_status."""
+    country: str
+    ndc_target: Any
+    assessment_notes: Any
+
+    def __str__(self) -> str:
+        return f"NDC Status for {self.country}: Target - {self.ndc_target}"
+
+@dataclass(slots=True, frozen=True)
+class RpsTarget:
+    """RPS target of a jurisdiction, as returned by PolicyTracker.get_rps_target."""
+    jurisdiction: str
+    rps_target: Any
+    compliance_year: Any
+
+    def __str__(self) -> str:
+        return f"RPS Target for {self.jurisdiction}: {self.rps_target} by {self.compliance_year}"
+
 class PolicyTracker:
     """A class to track and assess various climate and energy policies."""
     def __init__(self, policy_database: dict):
         """Initializes PolicyTracker with a database of policies.
         policy_database: e.g., {'CountryX': {'ndc_target': '50%_reduction_by_2030', 'rps': '30%_by_2025'}}
         """
-        self.policy_database = policy_database
+        # Read-only copy of the database (down to each jurisdiction's policies), so the memoized
+        # lookups below cannot go stale when the caller later edits policy_database
+        self.policy_database = types.MappingProxyType({
+            jurisdiction: types.MappingProxyType(dict(policies)) for jurisdiction, policies in policy_database.items()})
+        self.get_ndc_status = functools.lru_cache(maxsize=4096)(self.get_ndc_status)
+        self.get_rps_target = functools.lru_cache(maxsize=4096)(self.get_rps_target)
         print(f"PolicyTracker initialized with data for {len(self.policy_database)} jurisdictions.")
 
-    def get_ndc_status(self, country_iso_code: str) -> dict:
+    def get_ndc_status(self, country_iso_code: str) -> NdcStatus:
         """Retrieves the NDC status for a given country."""
-        country_policy = self.policy_database.get(country_iso_code, {})
-        ndc_info = {
-            'country': country_iso_code,
-            'ndc_target': country_policy.get('ndc_target', 'Not Available'),
-            'assessment_notes': country_policy.get('ndc_assessment', 'No assessment yet.')
-        }
-        print(f"NDC Status for {country_iso_code}: Target - {ndc_info['ndc_target']}")
-        return ndc_info
+        country_policy = self.policy_database.get(country_iso_code, _EMPTY)
+        return NdcStatus(
+            country=country_iso_code,
+            ndc_target=country_policy.get('ndc_target', 'Not Available'),
+            assessment_notes=country_policy.get('ndc_assessment', 'No assessment yet.'),
+        )
 
-    def get_rps_target(self, jurisdiction: str) -> dict:
+    def get_rps_target(self, jurisdiction: str) -> RpsTarget:
         """Retrieves Renewable Portfolio Standard (RPS) targets for a jurisdiction."""
-        policy_info = self.policy_database.get(jurisdiction, {})
-        rps_target = {
-            'jurisdiction': jurisdiction,
-            'rps_target': policy_info.get('rps', 'Not Available'),
-            'compliance_year': policy_info.get('rps_year', 'N/A')
-        }
-        print(f"RPS Target for {jurisdiction}: {rps_target['rps_target']} by {rps_target['compliance_year']}")
-        return rps_target
+        policy_info = self.policy_database.get(jurisdiction, _EMPTY)
+        return RpsTarget(
+            jurisdiction=jurisdiction,
+            rps_target=policy_info.get('rps', 'Not Available'),
+            compliance_year=policy_info.get('rps_year', 'N/A'),
+        )
 
 if __name__ == '__main__':
     # Example Usage
@@ -53,6 +82,6 @@ if __name__ == '__main__':
         }
     }
     tracker = PolicyTracker(policy_database=policies)
-    tracker.get_ndc_status(country_iso_code='USA')
-    tracker.get_ndc_status(country_iso_code='CHN')
-    tracker.get_rps_target(jurisdiction='EU27')
+    print(tracker.get_ndc_status(country_iso_code='USA'))
+    print(tracker.get_ndc_status(country_iso_code='CHN'))
+    print(tracker.get_rps_target(jurisdiction='EU27'))
@@ -3,40 +3,75 @@ Analyzes various support mechanisms for renewable energy, including financial in
 market-based instruments (e.g., RECs, CfDs), access to finance, and just transition provisions.
 """
 
+import copy
+import functools
+import types
+from dataclasses import dataclass
+from typing import Any, Tuple
+
+# Shared read-only stand-in for missing entries, so misses allocate nothing
+_EMPTY = types.MappingProxyType({})
+
+def _read_only_copy(value: Any) -> Any:
+    """Copies nested dicts into read-only mappings; other values are deep-copied."""
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: _read_only_copy(item) for key, item in value.items()})
+    return copy.deepcopy(value)
+
+@dataclass(slots=True, frozen=True)
+class IncentiveEvaluation:
+    """Evaluation of a financial incentive, as returned by SupportMechanismAnalyzer.evaluate_financial_incentive."""
+    country: str
+    incentive_type: str
+    details: Any
+    effectiveness_score: Any # e.g. 1-5 scale
+
+    def __str__(self) -> str:
+        return f"Financial Incentive '{self.incentive_type}' in {self.country}: Details - {self.details}, Effectiveness - {self.effectiveness_score}"
+
+@dataclass(slots=True, frozen=True)
+class JustTransitionInfo:
+    """Just transition provisions of a region, as returned by SupportMechanismAnalyzer.get_just_transition_info."""
+    region: str
+    programs: Tuple[str, ...]
+    funding_allocated_usd: float
+
+    def __str__(self) -> str:
+        return f"Just Transition in {self.region}: Programs - {', '.join(self.programs)}, Funding - ${self.funding_allocated_usd:,}"
+
 class SupportMechanismAnalyzer:
     """A class to analyze the effectiveness and details of RE support mechanisms."""
     def __init__(self, mechanism_data: dict):
         """Initializes with data on various support mechanisms.
         mechanism_data: e.g., {'CountryY': {'tax_credit': {'type': 'ITC', 'value': '30%'}}}
         """
-        self.mechanism_data = mechanism_data
+        # Read-only copy of the mechanism data, so the memoized lookups below cannot go stale when
+        # the caller later edits mechanism_data
+        self.mechanism_data = _read_only_copy(mechanism_data)
+        self.evaluate_financial_incentive = functools.lru_cache(maxsize=4096)(self.evaluate_financial_incentive)
+        self.get_just_transition_info = functools.lru_cache(maxsize=4096)(self.get_just_transition_info)
         print(f"SupportMechanismAnalyzer initialized with {len(self.mechanism_data)} mechanism entries.")
 
-    def evaluate_financial_incentive(self, country: str, incentive_type: str) -> dict:
+    def evaluate_financial_incentive(self, country: str, incentive_type: str) -> IncentiveEvaluation:
         """Evaluates a specific financial incentive in a country."""
-        country_mechanisms = self.mechanism_data.get(country, {})
-        incentive_details = country_mechanisms.get(incentive_type, {})
-        
-        evaluation = {
-            'country': country,
-            'incentive_type': incentive_type,
-            'details': incentive_details.get('details', 'Not specified'),
-            'effectiveness_score': incentive_details.get('effectiveness_score', 'N/A') # e.g. 1-5 scale
-        }
-        print(f"Financial Incentive '{incentive_type}' in {country}: Details - {evaluation['details']}, Effectiveness - {evaluation['effectiveness_score']}")
-        return evaluation
+        country_mechanisms = self.mechanism_data.get(country, _EMPTY)
+        incentive_details = country_mechanisms.get(incentive_type, _EMPTY)
+        return IncentiveEvaluation(
+            country=country,
+            incentive_type=incentive_type,
+            details=incentive_details.get('details', 'Not specified'),
+            effectiveness_score=incentive_details.get('effectiveness_score', 'N/A'),
+        )
 
-    def get_just_transition_info(self, region: str) -> dict:
+    def get_just_transition_info(self, region: str) -> JustTransitionInfo:
         """Retrieves information on just transition provisions in a region."""
-        region_mechanisms = self.mechanism_data.get(region, {})
-        jt_info = region_mechanisms.get('just_transition', {})
-        details = {
-            'region': region,
-            'programs': jt_info.get('programs', ['No specific programs listed']),
-            'funding_allocated_usd': jt_info.get('funding_allocated_usd', 0)
-        }
-        print(f"Just Transition in {region}: Programs - {', '.join(details['programs'])}, Funding - ${details['funding_allocated_usd']:,}")
-        return details
+        region_mechanisms = self.mechanism_data.get(region, _EMPTY)
+        jt_info = region_mechanisms.get('just_transition', _EMPTY)
+        return JustTransitionInfo(
+            region=region,
+            programs=tuple(jt_info.get('programs', ['No specific programs listed'])),
+            funding_allocated_usd=jt_info.get('funding_allocated_usd', 0),
+        )
 
 if __name__ == '__main__':
     # Example Usage
@@ -55,5 +90,5 @@ if __name__ == '__main__':
         }
     }
     analyzer = SupportMechanismAnalyzer(mechanism_data=mechanisms)
-    analyzer.evaluate_financial_incentive(country='USA', incentive_type='investment_tax_credit')
-    analyzer.get_just_transition_info(region='Germany')
+    print(analyzer.evaluate_financial_incentive(country='USA', incentive_type='investment_tax_credit'))
+    print(analyzer.get_just_transition_info(region='Germany'))
@@ -0,0 +1,45 @@
+"""
+Numeric kernels backing BuildingSolarIntegrationModel's batch APIs.
+
+Numba is optional: when it is installed the BIPV potential formula is compiled into a
+single pass over the cities; otherwise an equivalent NumPy implementation is used.
+A precompiled extension built by `_build_bipv_kernels` is preferred when present, so
+runs (and worker processes) start without any JIT compilation.
+"""
+
+from typing import Final
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
+from ..units import HOURS_PER_YEAR
+from ._bipv_kernels_src import _bipv_kernel_loop
+
+NUMBA_AVAILABLE = numba is not None
+
+# Efficiency the residential area-to-capacity conversion is normalised by
+REFERENCE_MODULE_EFFICIENCY: Final = 0.15
+
+
+def _bipv_kernel_numpy(commercial_mw, roof_sqkm, insol, eff, residential_mw_factor, generation_factor):
+    """Returns the annual BIPV generation per city from commercial capacity plus residential roof area.
+
+    residential_mw_factor converts roof sq km x insolation x efficiency to MW; generation_factor
+    converts MW to annual generation.
+    """
+    return (commercial_mw + roof_sqkm * (insol * eff * residential_mw_factor)) * generation_factor
+
+
+try:
+    from ._bipv_kernels_aot import bipv_kernel as _bipv_kernel
+    AOT_AVAILABLE = True
+except ImportError:  # extension not built; fall back to JIT or NumPy
+    AOT_AVAILABLE = False
+    if NUMBA_AVAILABLE:
+        _bipv_kernel = numba.njit(cache=True, fastmath=True)(_bipv_kernel_loop)
+    else:
+        _bipv_kernel = _bipv_kernel_numpy
@@ -0,0 +1,24 @@
+"""
+Pure-Python source of the BIPV kernels.
+
+Kept separate from `_bipv_kernels` so the AOT build can import the loop and its
+signature without going through the JIT set-up done there at import time.
+"""
+
+import numpy as np
+
+# Explicit signature used by the AOT build
+BIPV_KERNEL_SIGNATURE = 'float64[::1](float64[::1], float64[::1], float64, float64, float64, float64)'
+
+
+def _bipv_kernel_loop(commercial_mw, roof_sqkm, insol, eff, residential_mw_factor, generation_factor):
+    """Returns the annual BIPV generation per city from commercial capacity plus residential roof area.
+
+    residential_mw_factor converts roof sq km x insolation x efficiency to MW; generation_factor
+    converts MW to annual generation.
+    """
+    mw_per_sqkm = insol * eff * residential_mw_factor
+    out = np.empty(commercial_mw.shape[0])
+    for k in range(commercial_mw.shape[0]):
+        out[k] = (commercial_mw[k] + roof_sqkm[k] * mw_per_sqkm) * generation_factor
+    return out
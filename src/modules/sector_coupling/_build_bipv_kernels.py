@@ -0,0 +1,34 @@
+"""
+Ahead-of-time build of the BIPV kernels.
+
+Compiles `_bipv_kernel_loop` into the `_bipv_kernels_aot` extension next to this file,
+so `_bipv_kernels` can import it instead of JIT-compiling on the first call (which every
+fresh worker process would otherwise pay). Requires numba and a C compiler:
+
+    python -m src.modules.sector_coupling._build_bipv_kernels
+
+Note: `numba.pycc` has been pending deprecation since Numba 0.57 and will be removed once
+its replacement ships. Without it, `_bipv_kernels` keeps using the cached JIT kernel.
+"""
+
+import os
+
+try:
+    from numba.pycc import CC
+except ImportError as e:
+    raise ImportError("Building the AOT BIPV kernels requires a numba release that still ships numba.pycc; "
+                      "without it the cached JIT kernel in _bipv_kernels is used instead.") from e
+
+from ._bipv_kernels_src import _bipv_kernel_loop, BIPV_KERNEL_SIGNATURE
+
+
+def build(output_dir: str = None) -> None:
+    """Builds the extension module into output_dir (defaults to this package)."""
+    cc = CC('_bipv_kernels_aot')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.export('bipv_kernel', BIPV_KERNEL_SIGNATURE)(_bipv_kernel_loop)
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()
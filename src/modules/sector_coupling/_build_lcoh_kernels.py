@@ -0,0 +1,37 @@
+"""
+Ahead-of-time build of the scalar LCOH kernel.
+
+Compiles `_lcoh_core` (with the stack replacement present value it calls) into the
+`_lcoh_kernels_aot` extension next to this file, so `_lcoh_kernels.lcoh_core` is native code
+without JIT compilation on first use, and without numba installed at runtime. Requires
+numba and a C compiler:
+
+    python -m src.modules.sector_coupling._build_lcoh_kernels
+
+Note: `numba.pycc` has been pending deprecation since Numba 0.57 and will be removed once
+its replacement ships. Without it, `_lcoh_kernels` keeps using the cached JIT kernel.
+"""
+
+import os
+
+try:
+    from numba.pycc import CC
+except ImportError as e:
+    raise ImportError("Building the AOT LCOH kernel requires a numba release that still ships numba.pycc; "
+                      "without it the cached JIT kernel in _lcoh_kernels is used instead.") from e
+
+from . import _lcoh_kernels
+
+
+def build(output_dir: str = None) -> None:
+    """Builds the extension module into output_dir (defaults to this package)."""
+    cc = CC('_lcoh_kernels_aot')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    # The Python source of the JIT kernel; the stack replacement helper it calls is resolved
+    # to its compiled version from _lcoh_kernels' globals
+    cc.export('lcoh_core', _lcoh_kernels.LCOH_CORE_SIGNATURE)(_lcoh_kernels._lcoh_core.py_func)
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()
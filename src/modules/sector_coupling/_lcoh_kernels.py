@@ -0,0 +1,218 @@
+"""
+Numeric kernels backing IndustrialDecarbonizationModel's LCOH estimate.
+
+Numba is optional: when it is installed the electrolyzer cost arithmetic (stack replacement
+present value, annualized costs and LCOH) is compiled, so sweeps calling the estimate many
+times skip the interpreter for it; otherwise the same functions run as plain Python.
+The scalar entry point `lcoh_core` is taken from a precompiled extension built by
+`_build_lcoh_kernels` when present, which needs neither numba nor JIT compilation at runtime.
+The batch entry point `_lcoh_batch` broadcasts over its arguments; it is plain NumPy, except that
+small batches are evaluated by a compiled element-wise loop when numba is available, which avoids
+allocating a temporary array for every intermediate.
+"""
+
+import math
+from typing import Final
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
+from ..units import HOURS_PER_YEAR, KWH_PER_MWH
+
+NUMBA_AVAILABLE = numba is not None
+
+# lcoh_core(solar_lcoe, capex, efficiency, capacity_factor, discount_rate, lifetime, stack_hours,
+#           stack_replacement_pct, fixed_om_pct, variable_om, crf) -> lcoh
+LCOH_CORE_SIGNATURE: Final = 'f8(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)'
+
+# Below this many elements the compiled loop beats the NumPy expression, whose cost is dominated by
+# creating its temporaries
+LCOH_BATCH_VECTORIZE_MIN_SIZE: Final = 1024
+
+
+def _stack_replacement_present_value(cost_per_replacement, discount_rate, stack_lifetime_hours, annual_operating_hours,
+                                     num_replacements, lifetime_years):
+    """Present value of equal stack replacements every stack_lifetime_hours of operation, up to num_replacements of them.
+
+    Replacement i falls in year (i * stack_lifetime_hours) / annual_operating_hours; those at or after
+    lifetime_years are not counted. The replacement years form an arithmetic progression, so the
+    discounted sum is the geometric series q + q^2 + ... + q^n with q = (1 + discount_rate)^-interval
+    (interval being the years between replacements), evaluated in closed form. The powers of q are taken
+    as exponentials of log1p(discount_rate), with expm1 for 1 - q^k, which stays accurate for small rates.
+    """
+    # Only replacements strictly within the project lifetime count; the years increase with i, so
+    # only the last ones can fall on the lifetime boundary. Their years are computed exactly as the
+    # per-replacement loop this replaces did, so a replacement landing on end of life is dropped alike.
+    n = num_replacements
+    while n > 0 and (n * stack_lifetime_hours) / annual_operating_hours >= lifetime_years:
+        n -= 1
+    if n <= 0:
+        return 0.0
+    log_q = -(stack_lifetime_hours / annual_operating_hours) * math.log1p(discount_rate)
+    if n == 1:
+        return cost_per_replacement * math.exp(log_q)
+    if log_q == 0:
+        return cost_per_replacement * n
+    return cost_per_replacement * math.exp(log_q) * math.expm1(n * log_q) / math.expm1(log_q)
+
+
+def _lcoh_core(solar_lcoe_usd_per_mwh, capex_usd_per_kw, efficiency_kwh_per_kg_h2, capacity_factor, discount_rate,
+               lifetime_years, stack_lifetime_hours, stack_replacement_cost_pct_capex, fixed_om_cost_pct_capex,
+               variable_om_cost_usd_per_mwh, crf):
+    """Returns the LCOH ($/kg) of one kW of electrolyzer capacity given its capital recovery factor.
+
+    The caller handles an undefined CRF and zero hydrogen production; all arguments are floats.
+    """
+    annual_operating_hours = HOURS_PER_YEAR * capacity_factor
+    annual_h2_production_kg_per_kw_year = annual_operating_hours / efficiency_kwh_per_kg_h2
+
+    # Number of stack replacements over the electrolyzer lifetime; if the last one aligns perfectly
+    # with end of life, no final replacement is needed for *this* LCOH period
+    operating_hours_over_lifetime = annual_operating_hours * lifetime_years
+    num_stack_replacements = math.floor(operating_hours_over_lifetime / stack_lifetime_hours)
+    if operating_hours_over_lifetime % stack_lifetime_hours == 0 and num_stack_replacements > 0:
+        num_stack_replacements -= 1
+
+    total_stack_replacement_cost_present_value = 0.0
+    if num_stack_replacements > 0:
+        total_stack_replacement_cost_present_value = _stack_replacement_present_value(
+            capex_usd_per_kw * stack_replacement_cost_pct_capex, discount_rate, stack_lifetime_hours, annual_operating_hours,
+            num_stack_replacements, lifetime_years)
+
+    # Annualized CAPEX and stack replacements (CRF applied to the replacement NPV sum as a proxy),
+    # fixed O&M, variable O&M and electricity, per kW per year
+    annual_electricity_consumed_mwh_per_kw_year = annual_operating_hours / KWH_PER_MWH
+    total_annual_cost_usd_per_kw_year = (
+        capex_usd_per_kw * crf +
+        total_stack_replacement_cost_present_value * crf +
+        capex_usd_per_kw * fixed_om_cost_pct_capex +
+        annual_electricity_consumed_mwh_per_kw_year * variable_om_cost_usd_per_mwh +
+        annual_electricity_consumed_mwh_per_kw_year * solar_lcoe_usd_per_mwh
+    )
+    return total_annual_cost_usd_per_kw_year / annual_h2_production_kg_per_kw_year
+
+
+def _lcoh_batch_loop(solar_lcoe_usd_per_mwh, capex_usd_per_kw, efficiency_kwh_per_kg_h2, capacity_factor, discount_rate,
+                     lifetime_years, stack_lifetime_hours, stack_replacement_cost_pct_capex, fixed_om_cost_pct_capex,
+                     variable_om_cost_usd_per_mwh, out):
+    """Element-wise _lcoh_batch over equal-length 1-D float64 arrays, written into out.
+
+    Follows _lcoh_batch step by step (including its inf results), so either can serve a batch; only
+    used compiled with IEEE division semantics.
+    """
+    for i in range(out.shape[0]):
+        dr = discount_rate[i]
+        life = lifetime_years[i]
+        stack_hours = stack_lifetime_hours[i]
+        if dr > 0:
+            growth_minus_one = math.expm1(life * math.log1p(dr))
+            crf = dr * (1 + growth_minus_one) / growth_minus_one
+        elif life > 0:
+            crf = 1 / life
+        else:
+            crf = np.nan
+        annual_operating_hours = HOURS_PER_YEAR * capacity_factor[i]
+        annual_h2_production_kg_per_kw_year = annual_operating_hours / efficiency_kwh_per_kg_h2[i]
+        if not np.isfinite(crf) or annual_h2_production_kg_per_kw_year == 0 or np.isinf(solar_lcoe_usd_per_mwh[i]):
+            out[i] = np.inf
+            continue
+
+        operating_hours_over_lifetime = annual_operating_hours * life
+        n = np.floor(operating_hours_over_lifetime / stack_hours)
+        if operating_hours_over_lifetime % stack_hours == 0 and n > 0:
+            n -= 1
+        while n > 0 and (n * stack_hours) / annual_operating_hours >= life:
+            n -= 1
+        interval_years = stack_hours / annual_operating_hours
+        cost_per_replacement = capex_usd_per_kw[i] * stack_replacement_cost_pct_capex[i]
+        log_q = -interval_years * math.log1p(dr)
+        stack_present_value = 0.0
+        if n > 0:
+            if log_q == 0:
+                stack_present_value = cost_per_replacement * n
+            else:
+                stack_present_value = cost_per_replacement * math.exp(log_q) * math.expm1(n * log_q) / math.expm1(log_q)
+
+        annual_electricity_consumed_mwh_per_kw_year = annual_operating_hours / KWH_PER_MWH
+        total_annual_cost_usd_per_kw_year = (
+            capex_usd_per_kw[i] * crf +
+            stack_present_value * crf +
+            capex_usd_per_kw[i] * fixed_om_cost_pct_capex[i] +
+            annual_electricity_consumed_mwh_per_kw_year * variable_om_cost_usd_per_mwh[i] +
+            annual_electricity_consumed_mwh_per_kw_year * solar_lcoe_usd_per_mwh[i]
+        )
+        out[i] = total_annual_cost_usd_per_kw_year / annual_h2_production_kg_per_kw_year
+
+
+def _lcoh_batch(solar_lcoe_usd_per_mwh, capex_usd_per_kw, efficiency_kwh_per_kg_h2, capacity_factor, discount_rate,
+                lifetime_years, stack_lifetime_hours, stack_replacement_cost_pct_capex, fixed_om_cost_pct_capex,
+                variable_om_cost_usd_per_mwh):
+    """Vectorized _lcoh_core, including the CRF, over broadcastable float arrays.
+
+    Returns the LCOH ($/kg) per element; inf where the solar LCOE is infinite, the CRF is undefined
+    (or the lifetime is zero) or no hydrogen is produced.
+    """
+    if NUMBA_AVAILABLE:
+        arrays = np.broadcast_arrays(*(np.asarray(arg, dtype=np.float64) for arg in (
+            solar_lcoe_usd_per_mwh, capex_usd_per_kw, efficiency_kwh_per_kg_h2, capacity_factor, discount_rate,
+            lifetime_years, stack_lifetime_hours, stack_replacement_cost_pct_capex, fixed_om_cost_pct_capex,
+            variable_om_cost_usd_per_mwh)))
+        if arrays[0].size < LCOH_BATCH_VECTORIZE_MIN_SIZE:
+            lcoh = np.empty(arrays[0].size, dtype=np.float64)
+            _lcoh_batch_loop(*(np.ascontiguousarray(array).ravel() for array in arrays), lcoh)
+            return lcoh.reshape(arrays[0].shape)
+    dr = np.asarray(discount_rate, dtype=np.float64)
+    life = np.asarray(lifetime_years, dtype=np.float64)
+    stack_hours = np.asarray(stack_lifetime_hours, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        log1p_dr = np.log1p(dr)
+        growth_minus_one = np.expm1(life * log1p_dr)
+        crf = np.where(dr > 0, dr * (1 + growth_minus_one) / growth_minus_one, np.where(life > 0, 1 / life, np.nan))
+
+        annual_operating_hours = HOURS_PER_YEAR * np.asarray(capacity_factor, dtype=np.float64)
+        annual_h2_production_kg_per_kw_year = annual_operating_hours / efficiency_kwh_per_kg_h2
+
+        # Stack replacements, dropping one that aligns with end of life, then one whose year (computed as
+        # in the scalar kernel) falls at or after it; the one before the last is always well within
+        operating_hours_over_lifetime = annual_operating_hours * life
+        n = np.floor(operating_hours_over_lifetime / stack_hours)
+        n -= (operating_hours_over_lifetime % stack_hours == 0) & (n > 0)
+        n -= (n > 0) & ((n * stack_hours) / annual_operating_hours >= life)
+        interval_years = stack_hours / annual_operating_hours
+        # Closed-form geometric sum of the discounted replacements (cost * n when undiscounted)
+        cost_per_replacement = capex_usd_per_kw * np.asarray(stack_replacement_cost_pct_capex, dtype=np.float64)
+        log_q = -interval_years * log1p_dr
+        stack_present_value = np.where(n > 0, np.where(log_q == 0, cost_per_replacement * n,
+                                                       cost_per_replacement * np.exp(log_q) * np.expm1(n * log_q) / np.expm1(log_q)), 0.0)
+
+        annual_electricity_consumed_mwh_per_kw_year = annual_operating_hours / KWH_PER_MWH
+        total_annual_cost_usd_per_kw_year = (
+            capex_usd_per_kw * crf +
+            stack_present_value * crf +
+            capex_usd_per_kw * np.asarray(fixed_om_cost_pct_capex, dtype=np.float64) +
+            annual_electricity_consumed_mwh_per_kw_year * variable_om_cost_usd_per_mwh +
+            annual_electricity_consumed_mwh_per_kw_year * solar_lcoe_usd_per_mwh
+        )
+        lcoh = total_annual_cost_usd_per_kw_year / annual_h2_production_kg_per_kw_year
+    undefined = (~np.isfinite(crf) | (annual_h2_production_kg_per_kw_year == 0)
+                 | np.isinf(np.asarray(solar_lcoe_usd_per_mwh, dtype=np.float64)))
+    return np.where(undefined, np.inf, lcoh)
+
+
+if NUMBA_AVAILABLE:
+    # _lcoh_core resolves _stack_replacement_present_value when it is compiled, so it calls the compiled one
+    _stack_replacement_present_value = numba.njit(cache=True)(_stack_replacement_present_value)
+    _lcoh_core = numba.njit(cache=True)(_lcoh_core)
+    # NumPy's division semantics (inf/nan rather than ZeroDivisionError), matching _lcoh_batch
+    _lcoh_batch_loop = numba.njit(cache=True, error_model='numpy')(_lcoh_batch_loop)
+
+try:
+    from ._lcoh_kernels_aot import lcoh_core
+    AOT_AVAILABLE = True
+except ImportError:  # extension not built; use _lcoh_core (JIT-compiled when numba is available)
+    AOT_AVAILABLE = False
+    lcoh_core = _lcoh_core
@@ -3,22 +3,53 @@ Models the use of solar energy for industrial decarbonization, including green h
 industrial heat applications, and pathways for emission-intensive industries.
 """
 
+import functools
+import logging
 import math
-from typing import TYPE_CHECKING, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+import numpy as np
+
+from ..units import HOURS_PER_YEAR
+from ._lcoh_kernels import _lcoh_batch, lcoh_core
 
 if TYPE_CHECKING:
     from ..technological_evolution.solar_tech_model import SolarTechModel, SolarTechnology 
     from ..economic_framework.cost_model import CostModel
 
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=4096)
+def _crf(discount_rate: float, lifetime_years: int) -> Optional[float]:
+    """Capital recovery factor; None if it is undefined (zero or negative rate and no lifetime).
+    Memoized, since sweeps re-evaluate it for the same few (rate, lifetime) pairs."""
+    if discount_rate > 0:
+        # (1 + r)^n - 1 via expm1/log1p, which stays accurate for small rates
+        growth_minus_one = math.expm1(lifetime_years * math.log1p(discount_rate))
+        return discount_rate * (1 + growth_minus_one) / growth_minus_one
+    if lifetime_years > 0:
+        return 1 / lifetime_years
+    return None
+
+
 class IndustrialDecarbonizationModel:
     """A class to model solar energy's role in industrial decarbonization."""
+    __slots__ = ('industry_data', '_solar_lcoe_cached')
+    # Solar thermal suitability by process temperature: below 150°C, below 400°C, and above
+    _HEAT_BINS = np.array([150, 400])
+    _HEAT_LABELS = np.array(["High (e.g., using flat plate collectors, evacuated tubes)",
+                             "Medium (e.g., using concentrating solar power - parabolic troughs)",
+                             "Challenging (may require advanced CSP or hybridization)"], dtype=object)
+
     def __init__(self, industry_data: Dict[str, Any]):
         """
         Initializes with data on industrial energy demand and processes.
         industry_data: e.g., {'Steel_EU': {'current_emissions_mtco2': 150, 'hydrogen_demand_potential_mt': 5}}
         """
         self.industry_data = industry_data
-        print(f"IndustrialDecarbonizationModel initialized for {len(self.industry_data)} industrial sectors/regions.")
+        # Per-instance memo of solar LCOE results by (cost model, tech model, LCOE arguments)
+        self._solar_lcoe_cached = functools.lru_cache(maxsize=4096)(self._solar_lcoe)
+        logger.info("IndustrialDecarbonizationModel initialized for %d industrial sectors/regions.", len(self.industry_data))
 
     def estimate_green_hydrogen_production_cost(self, 
                                                 solar_tech_model: 'SolarTechModel',
@@ -57,108 +88,128 @@ class IndustrialDecarbonizationModel:
             stack_replacement_cost_pct_capex: Cost of stack replacement as a percentage of initial CAPEX.
             fixed_om_cost_pct_capex: Fixed annual O&M costs as a percentage of initial CAPEX.
             variable_om_cost_usd_per_mwh: Variable O&M costs per MWh of electricity consumed by electrolyzer.
+
+        The solar LCOE is memoized per (solar_cost_model, solar_tech_model, solar project arguments);
+        call clear_solar_lcoe_cache() after changing the costs or technologies of either model.
         """
 
         # 0. Calculate Solar LCOE for electricity input
-        solar_lcoe_results = solar_cost_model.calculate_lcoe_for_evolving_solar_tech(
-            solar_tech_model=solar_tech_model,
-            technology_name=solar_tech_name,
-            year=solar_project_year,
-            capacity_factor=solar_project_capacity_factor,
-            discount_rate=solar_project_discount_rate,
-            economic_lifetime_years=solar_project_lifetime_years
-        )
+        solar_lcoe_results = self._solar_lcoe_cached(solar_cost_model, solar_tech_model, solar_tech_name, solar_project_year,
+                                                     solar_project_capacity_factor, solar_project_discount_rate,
+                                                     solar_project_lifetime_years)
 
         if solar_lcoe_results.get('error') or solar_lcoe_results['lcoe_usd_per_mwh'] == float('inf'):
             error_msg = solar_lcoe_results.get('error', 'Solar LCOE is infinite.')
-            print(f"Error in LCOH calculation: Could not determine valid Solar LCOE. Reason: {error_msg}")
+            logger.error("Error in LCOH calculation: Could not determine valid Solar LCOE. Reason: %s", error_msg)
             return float('inf')
         
         solar_lcoe_usd_per_mwh = solar_lcoe_results['lcoe_usd_per_mwh']
-        print(f"  Internal Solar LCOE calculated: ${solar_lcoe_usd_per_mwh:.2f}/MWh for {solar_tech_name} in {solar_project_year}")
+        logger.debug("  Internal Solar LCOE calculated: $%.2f/MWh for %s in %s", solar_lcoe_usd_per_mwh, solar_tech_name, solar_project_year)
 
         # 1. Calculate Capital Recovery Factor (CRF) for Electrolyzer
-        if electrolyzer_discount_rate > 0:
-            crf = (electrolyzer_discount_rate * (1 + electrolyzer_discount_rate) ** electrolyzer_lifetime_years) / \
-                  ((1 + electrolyzer_discount_rate) ** electrolyzer_lifetime_years - 1)
-        elif electrolyzer_lifetime_years > 0:
-            crf = 1 / electrolyzer_lifetime_years
-        else:
-            print("Warning: Electrolyzer lifetime is zero and discount rate is zero. Cannot calculate CRF.")
+        crf = _crf(electrolyzer_discount_rate, electrolyzer_lifetime_years)
+        if crf is None:
+            logger.warning("Electrolyzer lifetime is zero and discount rate is zero. Cannot calculate CRF.")
             return float('inf')
 
-        # 2. Annualized CAPEX for Electrolyzer
-        annualized_capex_usd_per_kw_year = electrolyzer_capex_usd_per_kw * crf
-
-        # 3. Annual Hydrogen Production per kW of electrolyzer capacity
-        annual_operating_hours = 8760 * electrolyzer_capacity_factor
-        annual_electricity_consumed_kwh_per_kw_year = 1 * annual_operating_hours # 1 kW capacity * hours
-        annual_h2_production_kg_per_kw_year = annual_electricity_consumed_kwh_per_kw_year / electrolyzer_efficiency_kwh_per_kg_h2
-
-        if annual_h2_production_kg_per_kw_year == 0:
-            print("Warning: Annual H2 production is zero. Check capacity factor or efficiency.")
+        # 2. Hydrogen production per kW of electrolyzer capacity must be positive
+        annual_operating_hours = HOURS_PER_YEAR * electrolyzer_capacity_factor
+        if annual_operating_hours / electrolyzer_efficiency_kwh_per_kg_h2 == 0:
+            logger.warning("Annual H2 production is zero. Check capacity factor or efficiency.")
             return float('inf')
 
-        # 4. Stack Replacement Costs
-        # Number of stack replacements over the electrolyzer lifetime
-        num_stack_replacements = math.floor((annual_operating_hours * electrolyzer_lifetime_years) / stack_lifetime_hours) 
-        if (annual_operating_hours * electrolyzer_lifetime_years) % stack_lifetime_hours == 0 and num_stack_replacements > 0:
-             num_stack_replacements -=1 # If it aligns perfectly with EOL, no final replacement needed for *this* LCOH period
-
-        total_stack_replacement_cost_present_value = 0
-        if num_stack_replacements > 0:
-            cost_per_replacement = electrolyzer_capex_usd_per_kw * stack_replacement_cost_pct_capex
-            for i in range(1, int(num_stack_replacements) + 1):
-                replacement_year = (i * stack_lifetime_hours) / annual_operating_hours
-                if replacement_year < electrolyzer_lifetime_years: # only consider if within project lifetime
-                    total_stack_replacement_cost_present_value += cost_per_replacement / ((1 + electrolyzer_discount_rate) ** replacement_year)
+        # 3. Annualized CAPEX, stack replacement, O&M and electricity costs per kg of hydrogen
+        lcoh_usd_per_kg = lcoh_core(
+            float(solar_lcoe_usd_per_mwh), float(electrolyzer_capex_usd_per_kw), float(electrolyzer_efficiency_kwh_per_kg_h2),
+            float(electrolyzer_capacity_factor), float(electrolyzer_discount_rate), float(electrolyzer_lifetime_years),
+            float(stack_lifetime_hours), float(stack_replacement_cost_pct_capex), float(fixed_om_cost_pct_capex),
+            float(variable_om_cost_usd_per_mwh), crf)
         
-        annualized_stack_replacement_cost_usd_per_kw_year = total_stack_replacement_cost_present_value * crf 
-        # This is an approximation; ideally, each replacement NPV is annualized over remaining life or specific period.
-        # Simpler: average it over the project lifetime (less accurate if replacements are not uniform)
-        # annualized_stack_replacement_cost_usd_per_kw_year = (num_stack_replacements * cost_per_replacement_not_npv) / electrolyzer_lifetime_years
-        # For now, using the CRF applied to NPV sum as a proxy
-
-        # 5. Fixed O&M Costs
-        fixed_om_usd_per_kw_year = electrolyzer_capex_usd_per_kw * fixed_om_cost_pct_capex
-
-        # 6. Variable O&M Costs
-        # VOM per MWh, electricity cost is separate
-        variable_om_usd_per_kw_year = (annual_electricity_consumed_kwh_per_kw_year / 1000) * variable_om_cost_usd_per_mwh
-
-        # 7. Electricity Costs
-        electricity_cost_usd_per_kw_year = (annual_electricity_consumed_kwh_per_kw_year / 1000) * solar_lcoe_usd_per_mwh
-
-        # 8. Total Annualized Costs per kW
-        total_annual_cost_usd_per_kw_year = (
-            annualized_capex_usd_per_kw_year +
-            annualized_stack_replacement_cost_usd_per_kw_year +
-            fixed_om_usd_per_kw_year +
-            variable_om_usd_per_kw_year +
-            electricity_cost_usd_per_kw_year
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Detailed LCOH Calculation Inputs:")
+            logger.debug("  Solar LCOE (used): $%.2f/MWh, Electrolyzer CAPEX: $%s/kW", solar_lcoe_usd_per_mwh, electrolyzer_capex_usd_per_kw)
+            logger.debug("  Electrolyzer Efficiency: %s kWh/kg, Electrolyzer CF: %.0f%% H2", electrolyzer_efficiency_kwh_per_kg_h2, electrolyzer_capacity_factor*100)
+            logger.debug("  Electrolyzer Discount Rate: %.0f%%, Electrolyzer Lifetime: %s years", electrolyzer_discount_rate*100, electrolyzer_lifetime_years)
+            logger.debug("Calculated LCOH: $%.2f/kg H2", lcoh_usd_per_kg)
+        return lcoh_usd_per_kg
+
+    def estimate_green_hydrogen_production_cost_batch(self,
+                                                      solar_tech_model: 'SolarTechModel',
+                                                      solar_cost_model: 'CostModel',
+                                                      solar_tech_name,
+                                                      solar_project_year,
+                                                      solar_project_capacity_factor,
+                                                      solar_project_discount_rate,
+                                                      solar_project_lifetime_years,
+                                                      electrolyzer_capex_usd_per_kw,
+                                                      electrolyzer_efficiency_kwh_per_kg_h2=50.0,
+                                                      electrolyzer_capacity_factor=0.60,
+                                                      electrolyzer_discount_rate=0.08,
+                                                      electrolyzer_lifetime_years=20,
+                                                      stack_lifetime_hours=80000,
+                                                      stack_replacement_cost_pct_capex=0.40,
+                                                      fixed_om_cost_pct_capex=0.02,
+                                                      variable_om_cost_usd_per_mwh=1.0
+                                                      ) -> np.ndarray:
+        """Vectorized estimate_green_hydrogen_production_cost, e.g. over Monte-Carlo samples.
+
+        Every argument except the two models may be a scalar or an array; they are broadcast together
+        and the LCOH ($/kg) is returned as a float64 array of the broadcast shape. The solar LCOE is
+        evaluated once per distinct (technology, year, capacity factor, discount rate, lifetime).
+        Where the scalar version would return inf (or fail on a zero lifetime), the result is inf.
+        Nothing is printed per sample.
+        """
+        (solar_tech_name, solar_project_year, solar_project_capacity_factor, solar_project_discount_rate,
+         solar_project_lifetime_years, *electrolyzer_args) = np.broadcast_arrays(
+            np.asarray(solar_tech_name), np.asarray(solar_project_year), np.asarray(solar_project_capacity_factor),
+            np.asarray(solar_project_discount_rate), np.asarray(solar_project_lifetime_years),
+            *(np.asarray(arg, dtype=np.float64) for arg in (
+                electrolyzer_capex_usd_per_kw, electrolyzer_efficiency_kwh_per_kg_h2, electrolyzer_capacity_factor,
+                electrolyzer_discount_rate, electrolyzer_lifetime_years, stack_lifetime_hours,
+                stack_replacement_cost_pct_capex, fixed_om_cost_pct_capex, variable_om_cost_usd_per_mwh)))
+
+        # 0. Solar LCOE once per distinct solar project; errors and infinite LCOEs give an infinite LCOH
+        solar_projects = list(zip(solar_tech_name.ravel().tolist(), solar_project_year.ravel().tolist(),
+                                  solar_project_capacity_factor.ravel().tolist(), solar_project_discount_rate.ravel().tolist(),
+                                  solar_project_lifetime_years.ravel().tolist()))
+        solar_lcoes = {}
+        for project in dict.fromkeys(solar_projects):
+            results = self._solar_lcoe_cached(solar_cost_model, solar_tech_model, *project)
+            solar_lcoes[project] = float('inf') if results.get('error') else results['lcoe_usd_per_mwh']
+        solar_lcoe_usd_per_mwh = np.array([solar_lcoes[project] for project in solar_projects],
+                                          dtype=np.float64).reshape(solar_tech_name.shape)
+
+        # 1. Electrolyzer CRF, stack replacements, O&M and electricity costs per kg of hydrogen
+        return _lcoh_batch(solar_lcoe_usd_per_mwh, *electrolyzer_args)
+
+    @staticmethod
+    def _solar_lcoe(solar_cost_model: 'CostModel', solar_tech_model: 'SolarTechModel', solar_tech_name: str, solar_project_year: int,
+                    solar_project_capacity_factor: float, solar_project_discount_rate: float,
+                    solar_project_lifetime_years: int) -> Dict[str, Any]:
+        return solar_cost_model.calculate_lcoe_for_evolving_solar_tech(
+            solar_tech_model=solar_tech_model,
+            technology_name=solar_tech_name,
+            year=solar_project_year,
+            capacity_factor=solar_project_capacity_factor,
+            discount_rate=solar_project_discount_rate,
+            economic_lifetime_years=solar_project_lifetime_years
         )
 
-        # 9. Levelized Cost of Hydrogen ($/kg)
-        lcoh_usd_per_kg = total_annual_cost_usd_per_kw_year / annual_h2_production_kg_per_kw_year
-        
-        print(f"Detailed LCOH Calculation Inputs:")
-        print(f"  Solar LCOE (used): ${solar_lcoe_usd_per_mwh:.2f}/MWh, Electrolyzer CAPEX: ${electrolyzer_capex_usd_per_kw}/kW")
-        print(f"  Electrolyzer Efficiency: {electrolyzer_efficiency_kwh_per_kg_h2} kWh/kg, Electrolyzer CF: {electrolyzer_capacity_factor*100:.0f}% H2")
-        print(f"  Electrolyzer Discount Rate: {electrolyzer_discount_rate*100:.0f}%, Electrolyzer Lifetime: {electrolyzer_lifetime_years} years")
-        print(f"Calculated LCOH: ${lcoh_usd_per_kg:.2f}/kg H2")
-        return lcoh_usd_per_kg
+    def clear_solar_lcoe_cache(self):
+        """Discards memoized solar LCOE results, e.g. after updating a CostModel's costs."""
+        self._solar_lcoe_cached.cache_clear()
+
+    def assess_solar_for_industrial_heat_batch(self, temperatures_c) -> np.ndarray:
+        """Vectorized assess_solar_for_industrial_heat: the suitability label for each process temperature (°C).
+
+        Returns an object array of strings with the shape of temperatures_c.
+        """
+        return self._HEAT_LABELS[np.searchsorted(self._HEAT_BINS, temperatures_c, side='right')]
 
     def assess_solar_for_industrial_heat(self, industry_type: str, temperature_requirement_c: int) -> str:
         """Assesses suitability of solar thermal for industrial heat applications."""
-        suitability = "Low"
-        if temperature_requirement_c < 150:
-            suitability = "High (e.g., using flat plate collectors, evacuated tubes)"
-        elif temperature_requirement_c < 400:
-            suitability = "Medium (e.g., using concentrating solar power - parabolic troughs)"
-        else:
-            suitability = "Challenging (may require advanced CSP or hybridization)"
-        
-        print(f"Suitability of solar for {industry_type} (Temp: {temperature_requirement_c}°C): {suitability}")
+        suitability = self.assess_solar_for_industrial_heat_batch(np.array([temperature_requirement_c]))[0]
+        logger.debug("Suitability of solar for %s (Temp: %s°C): %s", industry_type, temperature_requirement_c, suitability)
         return suitability
 
 if __name__ == '__main__':
@@ -166,6 +217,8 @@ if __name__ == '__main__':
     from ..technological_evolution.solar_tech_model import SolarTechModel, SolarTechnology
     from ..economic_framework.cost_model import CostModel
 
+    logging.basicConfig(level=logging.DEBUG)
+
     # Example Usage
     industry_data_example = {'Cement_Global': {'decarbonization_pathway': 'CCS, H2-firing, alternative binders'}}
     model = IndustrialDecarbonizationModel(industry_data=industry_data_example)
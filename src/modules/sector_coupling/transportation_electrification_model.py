@@ -3,8 +3,26 @@ Models the integration of solar energy with transportation electrification, incl
 EV smart charging, solar-powered charging infrastructure, and Vehicle-to-Grid (V2G) services.
 """
 
+import logging
+import re
+from typing import Final
+
+logger = logging.getLogger(__name__)
+
+# Year-specific EV penetration entries in a region's fleet data, e.g. 'ev_penetration_2030'
+_EV_PENETRATION_KEY = re.compile(r'ev_penetration_(\d+)')
+DEFAULT_EV_PENETRATION: Final = 0.1
+# Placeholder fleet assumptions
+TOTAL_VEHICLES: Final = 1_000_000
+EV_ANNUAL_KWH_PER_VEHICLE: Final = 3000
+# Fraction of battery capacity (kWh) available as V2G power (kW)
+V2G_POWER_FRACTION_OF_BATTERY: Final = 0.1
+KWH_PER_GWH: Final = 1_000_000
+KW_PER_MW: Final = 1000
+
 class TransportationElectrificationModel:
     """A class to model solar integration in the transportation sector."""
+    __slots__ = ('ev_fleet_data', 'charging_infra_data', '_ev_penetration')
     def __init__(self, ev_fleet_data: dict, charging_infra_data: dict):
         """
         Initializes with EV fleet projections and charging infrastructure data.
@@ -13,29 +31,37 @@ class TransportationElectrificationModel:
         """
         self.ev_fleet_data = ev_fleet_data
         self.charging_infra_data = charging_infra_data
-        print(f"TransportationElectrificationModel initialized.")
+        # EV penetration by (region, year), parsed once from the 'ev_penetration_<year>' keys
+        self._ev_penetration = {
+            (region, int(match.group(1))): value
+            for region, fleet_data in ev_fleet_data.items()
+            for key, value in fleet_data.items()
+            if (match := _EV_PENETRATION_KEY.fullmatch(key))
+        }
+        logger.info("TransportationElectrificationModel initialized.")
 
     def project_solar_charging_demand(self, region: str, year: int) -> float:
-        """Projects the electricity demand from EVs that could be met by solar charging."""
+        """Projects the electricity demand from EVs that could be met by solar charging.
+        EV penetration is read from the fleet data as it was at construction."""
         # Placeholder logic: very simplified
-        ev_penetration = self.ev_fleet_data.get(region, {}).get(f'ev_penetration_{year}', 0.1)
-        total_vehicles = 1000000 # Assume a fixed number of vehicles for simplicity
-        ev_annual_kwh_per_vehicle = 3000 # kWh
+        ev_penetration = self._ev_penetration.get((region, year), DEFAULT_EV_PENETRATION)
         solar_charging_potential_pct = self.charging_infra_data.get('solar_powered_stations_pct_2030_target', 0.4)
         
-        projected_demand_gwh = (total_vehicles * ev_penetration * ev_annual_kwh_per_vehicle * solar_charging_potential_pct) / 1_000_000
-        print(f"Projected solar EV charging demand in {region} for {year}: {projected_demand_gwh:.2f} GWh")
+        projected_demand_gwh = (TOTAL_VEHICLES * ev_penetration * EV_ANNUAL_KWH_PER_VEHICLE * solar_charging_potential_pct) / KWH_PER_GWH
+        logger.debug("Projected solar EV charging demand in %s for %s: %.2f GWh", region, year, projected_demand_gwh)
         return projected_demand_gwh
 
     def assess_v2g_potential(self, region: str, enabled_evs_count: int, avg_battery_kwh: float = 60) -> float:
         """Assesses the potential Vehicle-to-Grid (V2G) capacity."""
         # Assume only a fraction of battery is available for V2G and for a limited time
-        v2g_capacity_per_ev_kw = avg_battery_kwh * 0.1 # 10% of battery capacity as power
-        total_v2g_potential_mw = (enabled_evs_count * v2g_capacity_per_ev_kw) / 1000
-        print(f"V2G potential in {region} from {enabled_evs_count} EVs: {total_v2g_potential_mw:.2f} MW")
+        v2g_capacity_per_ev_kw = avg_battery_kwh * V2G_POWER_FRACTION_OF_BATTERY
+        total_v2g_potential_mw = (enabled_evs_count * v2g_capacity_per_ev_kw) / KW_PER_MW
+        logger.debug("V2G potential in %s from %s EVs: %.2f MW", region, enabled_evs_count, total_v2g_potential_mw)
         return total_v2g_potential_mw
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+
     # Example Usage
     ev_data = {'California': {'ev_penetration_2030': 0.5, 'ev_penetration_2035': 0.75}}
     charge_data = {'solar_powered_stations_pct_2030_target': 0.42}
@@ -3,35 +3,70 @@ Models employment impacts of solar deployment, including job creation (direct, i
 workforce development pathways, and gender & diversity inclusion.
 """
 
+import logging
+from typing import Dict, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Job creation factors used for regions (or fields) missing from the regional employment data
+DEFAULT_JOBS_PER_MW_DIRECT = 5
+DEFAULT_INDIRECT_MULTIPLIER = 1.5
+DEFAULT_INDUCED_MULTIPLIER = 0.75
+
 class EmploymentModel:
     """A class to model socioeconomic impacts related to employment."""
+    __slots__ = ('regional_employment_data', '_region_index', '_jobs_per_mw_direct', '_indirect_multiplier', '_induced_multiplier')
     def __init__(self, regional_employment_data: dict):
         """
         Initializes with regional employment baselines and job creation factors.
         regional_employment_data: e.g., {'RegionX': {'solar_jobs_per_mw': 10}}
         """
         self.regional_employment_data = regional_employment_data
-        print(f"EmploymentModel initialized.")
+        # Job creation factors per region as parallel arrays for estimate_job_creation_batch; the
+        # trailing row holds the defaults and is used for regions without data
+        self._region_index = {region: i for i, region in enumerate(regional_employment_data)}
+        region_data = [*regional_employment_data.values(), {}]
+        self._jobs_per_mw_direct = np.array([data.get('solar_jobs_per_mw_direct', DEFAULT_JOBS_PER_MW_DIRECT) for data in region_data], dtype=np.float64)
+        self._indirect_multiplier = np.array([data.get('indirect_multiplier', DEFAULT_INDIRECT_MULTIPLIER) for data in region_data], dtype=np.float64)
+        self._induced_multiplier = np.array([data.get('induced_multiplier', DEFAULT_INDUCED_MULTIPLIER) for data in region_data], dtype=np.float64)
+        logger.info("EmploymentModel initialized.")
 
     def estimate_job_creation(self, region: str, new_solar_capacity_mw: float) -> dict:
         """Estimates direct, indirect, and induced jobs from new solar capacity."""
         region_data = self.regional_employment_data.get(region, {})
-        jobs_per_mw_direct = region_data.get('solar_jobs_per_mw_direct', 5) # Default
-        indirect_multiplier = region_data.get('indirect_multiplier', 1.5) # e.g., 1.5 indirect jobs per direct job
-        induced_multiplier = region_data.get('induced_multiplier', 0.75) # e.g., 0.75 induced jobs per direct job
+        jobs_per_mw_direct = region_data.get('solar_jobs_per_mw_direct', DEFAULT_JOBS_PER_MW_DIRECT)
+        indirect_multiplier = region_data.get('indirect_multiplier', DEFAULT_INDIRECT_MULTIPLIER) # e.g., 1.5 indirect jobs per direct job
+        induced_multiplier = region_data.get('induced_multiplier', DEFAULT_INDUCED_MULTIPLIER) # e.g., 0.75 induced jobs per direct job
 
         direct_jobs = new_solar_capacity_mw * jobs_per_mw_direct
         indirect_jobs = direct_jobs * indirect_multiplier
         induced_jobs = direct_jobs * induced_multiplier
         total_jobs = direct_jobs + indirect_jobs + induced_jobs
 
-        print(f"Job creation in {region} for {new_solar_capacity_mw} MW solar:")
-        print(f"  Direct Jobs: {direct_jobs:.0f}")
-        print(f"  Indirect Jobs: {indirect_jobs:.0f}")
-        print(f"  Induced Jobs: {induced_jobs:.0f}")
-        print(f"  Total Jobs: {total_jobs:.0f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Job creation in %s for %s MW solar:", region, new_solar_capacity_mw)
+            logger.debug("  Direct Jobs: %.0f", direct_jobs)
+            logger.debug("  Indirect Jobs: %.0f", indirect_jobs)
+            logger.debug("  Induced Jobs: %.0f", induced_jobs)
+            logger.debug("  Total Jobs: %.0f", total_jobs)
         return {'direct': direct_jobs, 'indirect': indirect_jobs, 'induced': induced_jobs, 'total': total_jobs}
 
+    def estimate_job_creation_batch(self, regions: Sequence[str], new_solar_capacity_mw) -> Dict[str, np.ndarray]:
+        """Vectorized estimate_job_creation over parallel sequences of regions and new capacities (MW).
+
+        Returns a dict of float64 arrays keyed like estimate_job_creation's result ('direct', 'indirect',
+        'induced', 'total'). Job factors are read from the regional data as it was at construction.
+        """
+        default_row = len(self._region_index)
+        rows = np.fromiter((self._region_index.get(region, default_row) for region in regions), dtype=np.intp, count=len(regions))
+        direct_jobs = np.asarray(new_solar_capacity_mw, dtype=np.float64) * self._jobs_per_mw_direct[rows]
+        indirect_jobs = direct_jobs * self._indirect_multiplier[rows]
+        induced_jobs = direct_jobs * self._induced_multiplier[rows]
+        return {'direct': direct_jobs, 'indirect': indirect_jobs, 'induced': induced_jobs,
+                'total': direct_jobs + indirect_jobs + induced_jobs}
+
     def assess_workforce_transition_needs(self, region: str, skills_gap_data: dict) -> str:
         """Assesses needs for workforce development and skills transition."""
         # Placeholder for a more detailed assessment
@@ -40,10 +75,12 @@ class EmploymentModel:
             assessment = "Low immediate need for targeted programs."
         else:
             assessment = f"High need for programs focusing on: {', '.join(skill_shortages)}."
-        print(f"Workforce transition assessment for {region}: {assessment}")
+        logger.debug("Workforce transition assessment for %s: %s", region, assessment)
         return assessment
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+
     # Example Usage
     employment_data = {
         'SunValley': {'solar_jobs_per_mw_direct': 8, 'indirect_multiplier': 1.2, 'induced_multiplier': 0.6},
@@ -3,8 +3,63 @@ Analyzes energy equity and access, including energy poverty alleviation,
 affordability metrics, community ownership models, and rural electrification pathways.
 """
 
+import logging
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Final, Mapping, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Assumed annual yield of community solar projects
+COMMUNITY_SOLAR_KWH_PER_KW_YEAR: Final = 1300
+
+@dataclass(slots=True, frozen=True)
+class CommunitySolarProject:
+    """A community solar project, as evaluated by EnergyEquityModel.evaluate_community_solar_impact."""
+    capacity_kw: float
+    subscribers: int
+    low_income_participation_pct: float = 0.0
+
+    @classmethod
+    def from_dict(cls, project_details: Mapping[str, Any]) -> 'CommunitySolarProject':
+        """Builds a project from a details dict, treating missing entries as zero."""
+        return cls(
+            capacity_kw=project_details.get('capacity_kw', 0),
+            subscribers=project_details.get('subscribers', 0),
+            low_income_participation_pct=project_details.get('low_income_participation_pct', 0),
+        )
+
+@dataclass(slots=True, frozen=True)
+class CommunitySolarImpact:
+    """Impact metrics of a community solar project.
+
+    Supports item access, `in` and get() by field name, so it can stand in for the dicts
+    evaluate_community_solar_impact used to return; to_dict() gives that dict.
+    """
+    estimated_annual_generation_kwh: float
+    direct_beneficiaries: int
+    low_income_beneficiaries: float
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _COMMUNITY_SOLAR_IMPACT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _COMMUNITY_SOLAR_IMPACT_FIELDS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _COMMUNITY_SOLAR_IMPACT_FIELDS else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _COMMUNITY_SOLAR_IMPACT_FIELDS}
+
+_COMMUNITY_SOLAR_IMPACT_FIELDS = tuple(f.name for f in fields(CommunitySolarImpact))
+
 class EnergyEquityModel:
     """A class to model and assess energy equity and access issues."""
+    __slots__ = ('demographic_data', 'energy_access_data')
     def __init__(self, demographic_data: dict, energy_access_data: dict):
         """
         Initializes with demographic and energy access data.
@@ -13,7 +68,7 @@ class EnergyEquityModel:
         """
         self.demographic_data = demographic_data
         self.energy_access_data = energy_access_data
-        print(f"EnergyEquityModel initialized.")
+        logger.info("EnergyEquityModel initialized.")
 
     def assess_energy_burden_reduction(self, region: str, avg_solar_savings_per_hh_per_year: float, target_households: int) -> float:
         """Estimates the reduction in energy burden for a target group."""
@@ -21,21 +76,32 @@ class EnergyEquityModel:
         total_annual_savings = avg_solar_savings_per_hh_per_year * target_households
         
         # Further analysis would require income data to calculate % burden reduction
-        print(f"Estimated annual energy cost savings for {target_households} households in {region}: ${total_annual_savings:,.0f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Estimated annual energy cost savings for %s households in %s: $%s", target_households, region, f"{total_annual_savings:,.0f}")
         return total_annual_savings
 
-    def evaluate_community_solar_impact(self, project_details: dict) -> dict:
+    def assess_energy_burden_reduction_batch(self, avg_solar_savings_per_hh_per_year, target_households) -> np.ndarray:
+        """Vectorized assess_energy_burden_reduction: total annual savings for broadcastable arrays of
+        per-household savings and household counts, as a float64 array."""
+        return np.multiply(avg_solar_savings_per_hh_per_year, target_households, dtype=np.float64)
+
+    def evaluate_community_solar_impact(self, project_details: Union[CommunitySolarProject, Mapping[str, Any]]) -> CommunitySolarImpact:
         """
         Evaluates the potential impact of a community solar project.
-        project_details: e.g., {'capacity_kw': 500, 'subscribers': 100, 'low_income_participation_pct': 0.3}
+        project_details: a CommunitySolarProject, or a details dict such as
+                         {'capacity_kw': 500, 'subscribers': 100, 'low_income_participation_pct': 0.3}
         """
+        if isinstance(project_details, CommunitySolarProject):
+            project = project_details
+        else:
+            project = CommunitySolarProject.from_dict(project_details)
         # Placeholder for impact metrics
-        impact = {
-            'estimated_annual_generation_kwh': project_details.get('capacity_kw', 0) * 1300, # Assuming 1300 kWh/kW/year
-            'direct_beneficiaries': project_details.get('subscribers', 0),
-            'low_income_beneficiaries': project_details.get('subscribers', 0) * project_details.get('low_income_participation_pct', 0)
-        }
-        print(f"Community solar project impact ({project_details.get('capacity_kw')} kW): Benefiting {impact['direct_beneficiaries']} subscribers.")
+        impact = CommunitySolarImpact(
+            estimated_annual_generation_kwh=project.capacity_kw * COMMUNITY_SOLAR_KWH_PER_KW_YEAR,
+            direct_beneficiaries=project.subscribers,
+            low_income_beneficiaries=project.subscribers * project.low_income_participation_pct
+        )
+        logger.debug("Community solar project impact (%s kW): Benefiting %s subscribers.", project.capacity_kw, impact.direct_beneficiaries)
         return impact
 
     def identify_rural_electrification_potential(self, country: str, technology: str = "solar_mini_grid") -> str:
@@ -47,10 +113,12 @@ class EnergyEquityModel:
             assessment = f"High potential for {technology} in {country} to serve ~{population_without_electricity:,} people."
         else:
             assessment = f"Low direct need for new rural electrification in {country} based on available data."
-        print(assessment)
+        logger.debug("%s", assessment)
         return assessment
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+
     # Example Usage
     demographics = {'PoorCounty': {'low_income_households_pct': 0.4, 'avg_income_low_quintile': 15000}}
     access = {'RuralNationX': {'population_without_electricity': 2500000}}
@@ -58,6 +126,6 @@ if __name__ == '__main__':
     
     model.assess_energy_burden_reduction(region='PoorCounty', avg_solar_savings_per_hh_per_year=300, target_households=1000)
     
-    community_project = {'capacity_kw': 200, 'subscribers': 50, 'low_income_participation_pct': 0.4}
-    model.evaluate_community_solar_impact(project_details=community_project)
+    community_project = CommunitySolarProject(capacity_kw=200, subscribers=50, low_income_participation_pct=0.4)
+    print(model.evaluate_community_solar_impact(project_details=community_project))
     model.identify_rural_electrification_potential(country='RuralNationX', technology="solar_home_systems")
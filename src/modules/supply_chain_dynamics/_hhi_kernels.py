@@ -0,0 +1,64 @@
+"""
+Numeric kernels backing SupplyChainModel's concentration risk.
+
+The HHI of a set of capacities follows from two moments, the total and the sum of squares:
+HHI = 10000 * sum(c^2) / sum(c)^2 (the sum of squared percentage shares). Keeping the moments
+rather than the HHI lets them be updated in place when one capacity changes.
+
+Numba is optional: when it is installed both moments are accumulated in one compiled pass,
+which removes the interpreter and NumPy call overhead that dominates for a handful of regions;
+otherwise an equivalent NumPy implementation is used. Items with only a few regions (the common
+case) skip the array altogether: straight-line kernels for each small region count are generated at
+import time and take the capacities as arguments.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def _capacity_moments_loop(capacities):
+    """Returns (total, sum of squares) of a float64 capacity array."""
+    total = 0.0
+    sum_of_squares = 0.0
+    for i in range(capacities.shape[0]):
+        total += capacities[i]
+        sum_of_squares += capacities[i] * capacities[i]
+    return total, sum_of_squares
+
+
+def _capacity_moments_numpy(capacities):
+    """Returns (total, sum of squares) of a float64 capacity array."""
+    return float(capacities.sum()), float(np.dot(capacities, capacities))
+
+
+def _hhi_from_moments(total, sum_of_squares):
+    """HHI (0-10000) of capacities with the given moments; 0 if the total is zero."""
+    if total == 0:
+        return 0.0
+    return sum_of_squares * 10000.0 / (total * total)
+
+
+def _make_unrolled_capacity_moments(n):
+    """Generates `f(c0, ..., c{n-1}) -> (total, sum of squares)`, accumulating in float in order."""
+    args = [f'c{i}' for i in range(n)]
+    source = (f"def _capacity_moments_{n}({', '.join(args)}):\n"
+              f"    return 0.0 + {' + '.join(args)}, 0.0 + {' + '.join(f'{c} * {c}' for c in args)}\n")
+    namespace = {}
+    exec(source, namespace)
+    return namespace[f'_capacity_moments_{n}']
+
+
+# Unrolled kernels by number of capacities
+_UNROLLED_CAPACITY_MOMENTS = {n: _make_unrolled_capacity_moments(n) for n in range(1, 9)}
+
+
+if NUMBA_AVAILABLE:
+    _capacity_moments = numba.njit(cache=True, fastmath=True)(_capacity_moments_loop)
+else:
+    _capacity_moments = _capacity_moments_numpy
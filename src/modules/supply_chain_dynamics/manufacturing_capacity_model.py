@@ -3,35 +3,105 @@ Models the evolution of manufacturing capacity for solar (ingot/wafer, cell, mod
 and batteries, geographic diversification, and critical mineral requirements.
 """
 
+import collections
+import logging
+import types
+from typing import Sequence
+
+import numpy as np
+
+# Year of the capacity snapshots in capacity_data (keys like 'solar_module_gw_2025')
+CAPACITY_BASE_YEAR = 2025
+_BASE_YEAR_SUFFIX = f"_{CAPACITY_BASE_YEAR}"
+
+# Minerals tracked per technology: {technology: {mineral: (mineral_data intensity key, default intensity)}}
+_MINERAL_INTENSITY_KEYS = {
+    'silicon_pv_cells': {'silver_grams': ('silver_grams_per_cell', 0)},
+    'lfp_battery_kwh': {'lithium_kg': ('lithium_kg_per_kwh_lfp', 0.5), 'phosphate_kg': ('phosphate_kg_per_kwh_lfp', 1.0)},
+}
+# Columns of estimate_critical_mineral_demand_batch's result
+MINERAL_NAMES = tuple(dict.fromkeys(mineral for minerals in _MINERAL_INTENSITY_KEYS.values() for mineral in minerals))
+
+# Capacity column of a component without base-year data: only the zero row for new regions
+_NO_CAPACITY = np.zeros(1)
+
+logger = logging.getLogger(__name__)
+
 class ManufacturingCapacityModel:
-    """A class to model manufacturing capacity and material demands."""
+    """A class to model manufacturing capacity and material demands.
+
+    The capacity and mineral data are copied at construction and exposed read-only; projections and
+    demand estimates are computed from that snapshot. Build a new model to change them.
+    """
+    __slots__ = ('_capacity_data', '_mineral_data', '_base_capacities', '_region_index', '_caps', '_tech_index', '_mineral_index', '_intensity')
     def __init__(self, capacity_data: dict, mineral_data: dict):
         """
         Initializes with current capacity and mineral intensity data.
         capacity_data: e.g., {'solar_module_gw_2025': {'China': 500, 'ROW': 100}}
         mineral_data: e.g., {'silver_grams_per_cell': 0.1, 'lithium_kg_per_kwh': 0.6}
         """
-        self.capacity_data = capacity_data
-        self.mineral_data = mineral_data
-        print(f"ManufacturingCapacityModel initialized.")
+        self._capacity_data = types.MappingProxyType({
+            key: types.MappingProxyType(dict(value)) if isinstance(value, dict) else value for key, value in capacity_data.items()})
+        self._mineral_data = types.MappingProxyType(dict(mineral_data))
+        # Base-year capacities per component, as {region: capacity} and as {region: row} plus a capacity
+        # column whose trailing zero row stands for regions without base-year capacity
+        self._base_capacities = {}
+        self._region_index = {}
+        self._caps = {}
+        for key, capacities in capacity_data.items():
+            if key.endswith(_BASE_YEAR_SUFFIX):
+                component = key[:-len(_BASE_YEAR_SUFFIX)]
+                self._caps[component] = np.array([*capacities.values(), 0.0], dtype=np.float64)
+                self._base_capacities[component] = dict(zip(capacities, self._caps[component][:-1].tolist()))
+                self._region_index[component] = {region: i for i, region in enumerate(capacities)}
+        # (technology x mineral) intensity matrix; the trailing all-zero row is used for unknown technologies
+        self._tech_index = {technology: i for i, technology in enumerate(_MINERAL_INTENSITY_KEYS)}
+        self._mineral_index = {mineral: j for j, mineral in enumerate(MINERAL_NAMES)}
+        self._intensity = np.zeros((len(self._tech_index) + 1, len(MINERAL_NAMES)))
+        for technology, minerals in _MINERAL_INTENSITY_KEYS.items():
+            for mineral, (intensity_key, default) in minerals.items():
+                self._intensity[self._tech_index[technology], self._mineral_index[mineral]] = mineral_data.get(intensity_key, default)
+        logger.info("ManufacturingCapacityModel initialized.")
+
+    @property
+    def capacity_data(self) -> types.MappingProxyType:
+        """Read-only copy of the capacity data the model was built with."""
+        return self._capacity_data
+
+    @property
+    def mineral_data(self) -> types.MappingProxyType:
+        """Read-only copy of the mineral intensity data the model was built with."""
+        return self._mineral_data
 
     def project_manufacturing_capacity(self, component: str, year: int, region_projections: dict) -> dict:
         """Projects manufacturing capacity for a component and year based on regional growth.
         component: e.g., 'solar_module_gw', 'battery_gwh'
         region_projections: e.g., {'China': {'growth_rate': 0.1}, 'USA': {'new_capacity_gw': 50}}
         """
-        current_capacities = self.capacity_data.get(f"{component}_2025", {})
-        projected_capacities = current_capacities.copy()
-
+        region_index = self._region_index.get(component, {})
+        regions, rows, growth, new_cap = [], [], [], []
         for region, proj in region_projections.items():
-            current_cap = projected_capacities.get(region, 0)
             if 'growth_rate' in proj:
-                projected_capacities[region] = current_cap * (1 + proj['growth_rate']) ** (year - 2025)
+                growth_rate, new_capacity = proj['growth_rate'], 0.0
             elif 'new_capacity_gw' in proj: # or new_capacity_gwh
-                projected_capacities[region] = current_cap + proj['new_capacity_gw']
-        
-        total_projected = sum(projected_capacities.values())
-        print(f"Projected {component} capacity for {year}: {total_projected:.0f} (Details: {projected_capacities})")
+                growth_rate, new_capacity = 0.0, proj['new_capacity_gw']
+            else:
+                continue
+            regions.append(region)
+            # Regions without base-year capacity start from zero (the trailing row)
+            rows.append(region_index.get(region, -1))
+            growth.append(growth_rate)
+            new_cap.append(new_capacity)
+
+        caps = self._caps.get(component, _NO_CAPACITY)
+        # Growth regions compound from the base year; the others add their new capacity
+        projected = caps[rows] * np.power(1.0 + np.array(growth), year - CAPACITY_BASE_YEAR) + np.array(new_cap)
+        # Only the projected regions get new values; the rest read through to the base year
+        projected_capacities = dict(collections.ChainMap(dict(zip(regions, projected.tolist())),
+                                                         self._base_capacities.get(component, {})))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Projected %s capacity for %s: %.0f (Details: %s)", component, year, sum(projected_capacities.values()), projected_capacities)
         return projected_capacities
 
     def estimate_critical_mineral_demand(self, technology: str, production_volume: float) -> dict:
@@ -41,16 +111,29 @@ class ManufacturingCapacityModel:
         production_volume: e.g., number of cells, or kWh of batteries
         """
         demands = {}
-        if technology == 'silicon_pv_cells':
-            demands['silver_grams'] = production_volume * self.mineral_data.get('silver_grams_per_cell', 0)
-        elif technology == 'lfp_battery_kwh':
-            demands['lithium_kg'] = production_volume * self.mineral_data.get('lithium_kg_per_kwh_lfp', 0.5)
-            demands['phosphate_kg'] = production_volume * self.mineral_data.get('phosphate_kg_per_kwh_lfp', 1.0)
+        row = self._tech_index.get(technology)
+        if row is not None:
+            intensities = self._intensity[row].tolist()
+            for mineral in _MINERAL_INTENSITY_KEYS[technology]:
+                demands[mineral] = production_volume * intensities[self._mineral_index[mineral]]
 
-        print(f"Estimated mineral demand for {production_volume} units of {technology}: {demands}")
+        logger.debug("Estimated mineral demand for %s units of %s: %s", production_volume, technology, demands)
         return demands
 
+    def estimate_critical_mineral_demand_batch(self, technologies: Sequence[str], production_volumes) -> np.ndarray:
+        """
+        Vectorized estimate_critical_mineral_demand over parallel sequences of technologies and volumes.
+        Returns a (len(technologies), len(MINERAL_NAMES)) float64 array of demands, with columns in
+        MINERAL_NAMES order; minerals a technology does not use, and unknown technologies, give zeros.
+        """
+        unknown_row = len(self._tech_index)
+        rows = np.fromiter((self._tech_index.get(technology, unknown_row) for technology in technologies),
+                           dtype=np.intp, count=len(technologies))
+        return np.asarray(production_volumes, dtype=np.float64)[:, None] * self._intensity[rows]
+
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+
     # Example Usage
     cap_data = {
         'solar_module_gw_2025': {'China': 600, 'EU': 50, 'USA': 40, 'India': 30, 'SEA': 60},
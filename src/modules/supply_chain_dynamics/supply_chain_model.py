@@ -1,4 +1,17 @@
+import logging
 import math
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from ._hhi_kernels import _UNROLLED_CAPACITY_MOMENTS, _capacity_moments, _hhi_from_moments
+
+logger = logging.getLogger(__name__)
+
+# Items with at least this many regions have their shares rounded with one np.round call;
+# below it the per-region round() is faster than building the array
+SHARES_VECTORIZE_MIN_REGIONS = 16
 
 # --- Default Initial Supply Chain Data ---
 initial_data = {
@@ -18,13 +31,46 @@ initial_data = {
     }
 }
 # Correct global capacities based on regional sum for consistency in example data
-for _item_name_init in list(initial_data.keys()): # Use a different loop variable name to avoid conflicts if run in global scope
-    _item_data_init = initial_data[_item_name_init]
-    for _key_init in list(_item_data_init.keys()):
-        _val_init = _item_data_init[_key_init]
-        if _key_init.startswith('regional_capacity_') and isinstance(_val_init, dict):
-            _global_key_init = _key_init.replace('regional_capacity_', 'global_capacity_')
-            _item_data_init[_global_key_init] = sum(_val_init.values())
+for _item_data_init in initial_data.values(): # Prefixed name to avoid conflicts if run in global scope
+    _item_data_init.update({key.replace('regional_capacity_', 'global_capacity_'): sum(value.values())
+                            for key, value in _item_data_init.items()
+                            if key.startswith('regional_capacity_') and isinstance(value, dict)})
+
+@dataclass(slots=True, frozen=True)
+class ConcentrationRisk:
+    """Concentration risk of one item, as returned by SupplyChainModel.get_concentration_risk.
+
+    Supports item access, `in` and get() by field name, so it can stand in for the dicts
+    get_concentration_risk used to return; to_dict() gives that dict. Optional fields left as
+    None are treated as missing keys: regional_shares_pct when the shares were not requested or
+    could not be computed, error unless the item's data is missing or invalid, and details unless
+    its capacity is zero.
+    """
+    item_name: str
+    hhi: float
+    assessment: str
+    regional_shares_pct: Optional[Dict[str, float]] = None
+    error: Optional[str] = None
+    details: Optional[str] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _CONCENTRATION_RISK_FIELDS and getattr(self, key) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _CONCENTRATION_RISK_FIELDS if name in self}
+
+_CONCENTRATION_RISK_FIELDS = tuple(f.name for f in fields(ConcentrationRisk))
+
+# HHI assessments by band: below 1500, 1500 to 2500, above 2500
+_HHI_ASSESSMENTS = ("Unconcentrated (Competitive)", "Moderately concentrated", "Highly concentrated")
 
 class SupplyChainModel:
     """Models manufacturing capacity, material availability, and supply chain risks."""
@@ -47,17 +93,21 @@ class SupplyChainModel:
         }
         """
         if initial_supply_data is None:
-            # Use a deep copy of the global initial_data to avoid modifying it inadvertently
-            import copy
-            self.supply_data = copy.deepcopy(initial_data)
+            # Copy the global initial_data (items of scalars and flat dicts) to avoid modifying it inadvertently
+            self.supply_data = {item_name: {key: dict(value) if isinstance(value, dict) else value for key, value in item.items()}
+                                for item_name, item in initial_data.items()}
         else:
             self.supply_data = initial_supply_data
-        print(f"SupplyChainModel initialized with {len(self.supply_data)} primary items.")
+        # Regional capacity moments, [total, sum of squares], by (item, capacity key); filled by
+        # get_concentration_risk and kept current by model_capacity_expansion
+        self._capacity_moments = {}
+        logger.info("SupplyChainModel initialized with %d primary items.", len(self.supply_data))
 
     def add_supply_item(self, item_name: str, data: dict):
         """Adds or updates a supply chain item (material, component)."""
         self.supply_data[item_name] = data
-        print(f"Supply item '{item_name}' added/updated.")
+        self._forget_capacity_moments(item_name)
+        logger.debug("Supply item '%s' added/updated.", item_name)
 
     def get_material_availability(self, material_name: str, required_annual_quantity: float) -> dict:
         """
@@ -67,7 +117,7 @@ class SupplyChainModel:
         """
         item = self.supply_data.get(material_name)
         if not item or 'global_capacity_tons_per_year' not in item: # Assuming tons for raw materials for now
-            print(f"Warning: Data or global capacity not found for material '{material_name}'.")
+            logger.warning("Data or global capacity not found for material '%s'.", material_name)
             return {'available': False, 'reason': f"Data or global capacity not found for '{material_name}'", 'shortfall': required_annual_quantity}
 
         global_capacity = item['global_capacity_tons_per_year']
@@ -76,51 +126,77 @@ class SupplyChainModel:
         else:
             return {'available': False, 'global_capacity': global_capacity, 'required': required_annual_quantity, 'shortfall': required_annual_quantity - global_capacity, 'reason': 'Required quantity exceeds global capacity'}
 
-    def calculate_hhi(self, shares: list) -> float:
-        """Calculates the Herfindahl-Hirschman Index (HHI). Shares should be percentages (0-100)."""
-        if not shares or sum(shares) == 0:
+    def calculate_hhi(self, shares) -> float:
+        """Calculates the Herfindahl-Hirschman Index (HHI). Shares (a list or array) should be percentages (0-100)."""
+        shares = np.asarray(shares, dtype=np.float64)
+        if shares.size == 0 or shares.sum() == 0:
             return 0.0 # Or handle as an error/undefined
         # Ensure shares sum to roughly 100 if they are market shares
         # For simplicity, we assume the input 'shares' are correct market shares.
-        hhi = sum(s**2 for s in shares)
-        return hhi
+        # The sum of squared shares is the dot product of the shares with themselves
+        return float(np.dot(shares, shares))
 
-    def get_concentration_risk(self, item_name: str, capacity_key: str = 'regional_capacity_tons_per_year') -> dict:
+    def get_concentration_risk(self, item_name: str, capacity_key: str = 'regional_capacity_tons_per_year', *, detail: bool = True) -> ConcentrationRisk:
         """
         Calculates concentration risk for a component/material using HHI based on regional capacities.
         capacity_key: The dictionary key that holds the regional capacity data (e.g., '_tons_per_year' or '_gw_per_year').
-        Returns HHI score and a qualitative assessment.
+        detail: If False, the regional shares are not computed and regional_shares_pct is omitted
+                (for callers that only need the HHI or the assessment).
+        Returns a ConcentrationRisk with the HHI score and a qualitative assessment; missing or invalid
+        data gives an HHI of -1 and an error message, zero capacity an HHI of 0 and details.
         HHI < 1500: Unconcentrated
         1500 <= HHI <= 2500: Moderately concentrated
         HHI > 2500: Highly concentrated
         """
         item = self.supply_data.get(item_name)
         if not item or capacity_key not in item:
-            return {'hhi': -1, 'assessment': 'Data not found', 'error': f"Item or capacity key '{capacity_key}' not found for '{item_name}'."}
+            return ConcentrationRisk(item_name=item_name, hhi=-1, assessment='Data not found',
+                                     error=f"Item or capacity key '{capacity_key}' not found for '{item_name}'.")
 
         regional_capacities = item[capacity_key]
         if not isinstance(regional_capacities, dict) or not regional_capacities:
-             return {'hhi': -1, 'assessment': 'Regional capacity data invalid', 'error': f"Regional capacity data for '{item_name}' is missing or not a dict."}
+            return ConcentrationRisk(item_name=item_name, hhi=-1, assessment='Regional capacity data invalid',
+                                     error=f"Regional capacity data for '{item_name}' is missing or not a dict.")
 
-        total_capacity = sum(regional_capacities.values())
+        moments = self._capacity_moments.get((item_name, capacity_key))
+        if moments is None:
+            unrolled_moments = _UNROLLED_CAPACITY_MOMENTS.get(len(regional_capacities))
+            if unrolled_moments is not None:
+                moments = list(unrolled_moments(*regional_capacities.values()))
+            else:
+                capacities = np.fromiter(regional_capacities.values(), dtype=np.float64, count=len(regional_capacities))
+                moments = list(_capacity_moments(capacities))
+            self._capacity_moments[item_name, capacity_key] = moments
+        total_capacity, sum_of_squares = moments
         if total_capacity == 0:
-            return {'hhi': 0, 'assessment': 'No capacity', 'details': 'Total regional capacity is zero.'}
+            return ConcentrationRisk(item_name=item_name, hhi=0, assessment='No capacity', details='Total regional capacity is zero.')
 
-        market_shares_pct = [(capacity / total_capacity) * 100 for capacity in regional_capacities.values()]
-        hhi_score = self.calculate_hhi(market_shares_pct)
+        hhi_score = _hhi_from_moments(total_capacity, sum_of_squares)
 
-        assessment = "Highly concentrated"
-        if hhi_score < 1500:
-            assessment = "Unconcentrated (Competitive)"
-        elif hhi_score <= 2500:
-            assessment = "Moderately concentrated"
-        
-        return {
-            'item_name': item_name,
-            'hhi': round(hhi_score, 2),
-            'assessment': assessment,
-            'regional_shares_pct': {region: round((cap/total_capacity)*100, 2) for region, cap in regional_capacities.items()}
-        }
+        assessment = _HHI_ASSESSMENTS[2 - (hhi_score < 1500) - (hhi_score <= 2500)]
+        if not detail:
+            return ConcentrationRisk(item_name=item_name, hhi=round(hhi_score, 2), assessment=assessment)
+
+        if len(regional_capacities) >= SHARES_VECTORIZE_MIN_REGIONS:
+            capacities = np.fromiter(regional_capacities.values(), dtype=np.float64, count=len(regional_capacities))
+            regional_shares_pct = dict(zip(regional_capacities, np.round(capacities / total_capacity * 100, 2).tolist()))
+        else:
+            regional_shares_pct = {region: round((cap/total_capacity)*100, 2) for region, cap in regional_capacities.items()}
+
+        return ConcentrationRisk(
+            item_name=item_name,
+            hhi=round(hhi_score, 2),
+            assessment=assessment,
+            regional_shares_pct=regional_shares_pct
+        )
+
+    def clear_capacity_moments_cache(self):
+        """Discards cached concentration data, e.g. after editing regional capacities in supply_data directly."""
+        self._capacity_moments.clear()
+
+    def _forget_capacity_moments(self, item_name: str):
+        for key in [key for key in self._capacity_moments if key[0] == item_name]:
+            del self._capacity_moments[key]
 
     def model_capacity_expansion(self, item_name: str, region: str, additional_capacity: float, year: int, capacity_key_suffix: str = '_tons_per_year'):
         """
@@ -132,7 +208,7 @@ class SupplyChainModel:
         global_capacity_key = 'global_capacity' + capacity_key_suffix
 
         if item_name not in self.supply_data:
-            print(f"Warning: Item '{item_name}' not found. Cannot expand capacity.")
+            logger.warning("Item '%s' not found. Cannot expand capacity.", item_name)
             return
         
         item = self.supply_data[item_name]
@@ -141,15 +217,24 @@ class SupplyChainModel:
         if global_capacity_key not in item:
             item[global_capacity_key] = 0
 
-        item[regional_capacity_key][region] = item[regional_capacity_key].get(region, 0) + additional_capacity
+        old_capacity = item[regional_capacity_key].get(region, 0)
+        new_capacity = item[regional_capacity_key][region] = old_capacity + additional_capacity
+        moments = self._capacity_moments.get((item_name, regional_capacity_key))
+        if moments is not None:
+            # Update the cached total and sum of squares for the one changed region
+            moments[0] += new_capacity - old_capacity
+            moments[1] += new_capacity * new_capacity - old_capacity * old_capacity
         item[global_capacity_key] = sum(item[regional_capacity_key].values()) # Recalculate global from regional
 
-        print(f"Capacity expansion for '{item_name}' in {region} by {additional_capacity} in {year} modeled.")
-        print(f"  New regional capacity for {region}: {item[regional_capacity_key][region]}")
-        print(f"  New global capacity for {item_name}: {item[global_capacity_key]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Capacity expansion for '%s' in %s by %s in %s modeled.", item_name, region, additional_capacity, year)
+            logger.debug("  New regional capacity for %s: %s", region, new_capacity)
+            logger.debug("  New global capacity for %s: %s", item_name, item[global_capacity_key])
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+
     # The initial_data is now defined globally and used by default in the constructor.
     # So, we can directly instantiate scm without passing initial_data, 
     # or pass a custom one if needed for this specific test.
@@ -2,8 +2,16 @@
 Models supply chain resilience, including concentration risk (HHI), onshoring/friendshoring
 trends, end-of-life management (recycling), and ESG compliance.
 """
+import logging
 import math
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Concentration levels by HHI band: up to 1500, up to 2500, above 2500
+_CONCENTRATION_LEVELS = ("Low", "Moderate", "High")
+
 class SupplyChainResilienceModel:
     """A class to model and assess supply chain resilience factors."""
     def __init__(self, market_share_data: dict, recycling_data: dict):
@@ -14,23 +22,19 @@ class SupplyChainResilienceModel:
         """
         self.market_share_data = market_share_data
         self.recycling_data = recycling_data
-        print(f"SupplyChainResilienceModel initialized.")
+        logger.info("SupplyChainResilienceModel initialized.")
 
     def calculate_hhi(self, component_key: str) -> float:
         """Calculates the Herfindahl-Hirschman Index (HHI) for a given component/material."""
         shares = self.market_share_data.get(component_key, {})
         if not shares:
-            print(f"Warning: Market share data not found for '{component_key}'. Returning HHI of -1.")
+            logger.warning("Market share data not found for '%s'. Returning HHI of -1.", component_key)
             return -1.0
         
         hhi = sum([(share * 100) ** 2 for share in shares.values()])
-        concentration = "Low"
-        if hhi > 1500:
-            concentration = "Moderate"
-        if hhi > 2500:
-            concentration = "High"
+        concentration = _CONCENTRATION_LEVELS[(hhi > 1500) + (hhi > 2500)]
         
-        print(f"HHI for {component_key}: {hhi:.0f} (Concentration: {concentration})")
+        logger.debug("HHI for %s: %.0f (Concentration: %s)", component_key, hhi, concentration)
         return hhi
 
     def project_recycling_capacity(self, year: int, annual_growth_rate: float = 0.20) -> float:
@@ -38,9 +42,14 @@ class SupplyChainResilienceModel:
         base_capacity = self.recycling_data.get('solar_panel_recycling_capacity_gw_2025', 0)
         # Simple exponential growth projection
         projected_capacity_gw = base_capacity * (1 + annual_growth_rate) ** (year - 2025)
-        print(f"Projected solar panel recycling capacity for {year}: {projected_capacity_gw:.1f} GW/year")
+        logger.debug("Projected solar panel recycling capacity for %s: %.1f GW/year", year, projected_capacity_gw)
         return projected_capacity_gw
 
+    def project_recycling_capacity_series(self, years, annual_growth_rate: float = 0.20) -> np.ndarray:
+        """Vectorized project_recycling_capacity: the projected recycling capacity (GW/year) for each year in years."""
+        base_capacity = self.recycling_data.get('solar_panel_recycling_capacity_gw_2025', 0)
+        return base_capacity * np.power(1 + annual_growth_rate, np.asarray(years) - 2025.0)
+
     def assess_esg_compliance_risk(self, supplier_profile: dict) -> str:
         """
         Assesses ESG compliance risk based on supplier profile (simplified).
@@ -53,10 +62,12 @@ class SupplyChainResilienceModel:
         if supplier_profile.get('labor_standards_audit') == 'fail':
             risk_level = "High"
         
-        print(f"ESG Compliance Risk Assessment: {risk_level}")
+        logger.debug("ESG Compliance Risk Assessment: %s", risk_level)
         return risk_level
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+
     # Example Usage
     market_shares = {
         'polysilicon_production': {'CompanyA': 0.35, 'CompanyB': 0.25, 'CompanyC': 0.15, 'CompanyD': 0.10, 'Others': 0.15},
@@ -1,7 +1,80 @@
 import datetime
+import functools
+import logging
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Union
+
+import numpy as np
+
+# Years after start_year for which SolarTechnology tabulates its CAPEX learning curve
+CAPEX_TABLE_YEARS = 50
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=None)
+def is_storage_technology(tech_name: str) -> bool:
+    """Classifies a technology as storage from its name (e.g., 'LFP_Battery')."""
+    return "BATTERY" in tech_name.upper()
+
+@dataclass(slots=True, frozen=True)
+class TechParams:
+    """Parameters of one technology in one year, as returned by SolarTechnology.get_params_for_year.
+
+    Supports item access, `in` and get() by field name, so it can stand in for the dicts
+    get_params_for_year used to return; to_dict() gives that dict.
+    """
+    name: str
+    year: int
+    efficiency: float
+    degradation_rate_annual: float
+    capex_usd_per_kw: float
+    is_commercially_available: bool
+    commercial_scale_year: int
+    is_storage: bool
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _TECH_PARAMS_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _TECH_PARAMS_FIELDS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _TECH_PARAMS_FIELDS else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _TECH_PARAMS_FIELDS}
+
+_TECH_PARAMS_FIELDS = tuple(f.name for f in fields(TechParams))
+
+def _efficiency_and_capex(years, start_year, base_efficiency, annual_efficiency_improvement,
+                          projected_efficiency_2035, base_capex_usd_per_kw, annual_capex_reduction_rate):
+    """Unrounded efficiency and CAPEX as in SolarTechnology.get_params_for_year, over broadcastable arrays."""
+    before_start = years < start_year
+    years_since_start = np.maximum(years - start_year, 0)
+
+    # Linear efficiency improvement capped at the 2035 projection; base efficiency before the start year
+    efficiency = np.minimum(base_efficiency + annual_efficiency_improvement * years_since_start, projected_efficiency_2035)
+    efficiency = np.where(before_start, base_efficiency, np.where(years >= 2035, projected_efficiency_2035, efficiency))
+
+    # CAPEX learning curve from the start year
+    capex = np.maximum(base_capex_usd_per_kw * np.power(1 - annual_capex_reduction_rate, years_since_start), 0)
+    capex = np.where(before_start, base_capex_usd_per_kw, capex)
+    return efficiency, capex
+
+# SolarTechnology attributes set once in __init__; the CAPEX table, rounded constants and
+# get_params_for_year memo are derived from them, so they cannot be reassigned afterwards
+_SOLAR_TECHNOLOGY_PARAMETERS = frozenset({
+    'name', 'base_efficiency', 'projected_efficiency_2035', 'start_year', 'commercial_scale_year',
+    'degradation_rate_annual', 'base_capex_usd_per_kw', 'annual_capex_reduction_rate',
+    'annual_efficiency_improvement', 'is_storage'})
 
 class SolarTechnology:
-    """Represents a specific solar photovoltaic technology and its parameters."""
+    """Represents a specific solar photovoltaic technology and its parameters.
+
+    The parameters are read-only once constructed; create a new SolarTechnology to change them.
+    """
     def __init__(self, name: str, 
                  base_efficiency: float, # Efficiency at commercial_scale_year or start_year
                  projected_efficiency_2035: float, 
@@ -18,6 +91,14 @@ class SolarTechnology:
         self.degradation_rate_annual = degradation_rate_annual
         self.base_capex_usd_per_kw = base_capex_usd_per_kw
         self.annual_capex_reduction_rate = annual_capex_reduction_rate
+        self.is_storage = is_storage_technology(name)
+        # Rounded CAPEX for each year since start_year up to CAPEX_TABLE_YEARS, as get_params_for_year computes it
+        self._rounded_capex_by_years_since_start = [
+            round(max(base_capex_usd_per_kw * ((1 - annual_capex_reduction_rate) ** years), 0), 2) for years in range(CAPEX_TABLE_YEARS)]
+        # Rounded parameters of the regimes where they do not depend on the year
+        self._rounded_base_efficiency = round(base_efficiency, 4)
+        self._rounded_projected_efficiency_2035 = round(projected_efficiency_2035, 4)
+        self._rounded_base_capex = round(base_capex_usd_per_kw, 2)
 
         if self.start_year > 2035:
             # If start_year is beyond 2035, the annual improvement rate calculation would be problematic.
@@ -29,34 +110,74 @@ class SolarTechnology:
             # Linear interpolation for annual improvement
             self.annual_efficiency_improvement = (self.projected_efficiency_2035 - self.base_efficiency) / (2035 - self.start_year)
 
-    def get_params_for_year(self, year: int) -> dict:
+        # The parameters are read-only (see __setattr__), so each year's (immutable) TechParams can be reused.
+        # typed=True keeps e.g. 2030 and 2030.0 apart, so the returned year has the type that was passed in.
+        self._cached_params_for_year = functools.lru_cache(maxsize=64, typed=True)(self._compute_params_for_year)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _SOLAR_TECHNOLOGY_PARAMETERS and name in self.__dict__:
+            raise AttributeError(f"SolarTechnology.{name} is read-only; create a new SolarTechnology instead.")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if name in _SOLAR_TECHNOLOGY_PARAMETERS:
+            raise AttributeError(f"SolarTechnology.{name} is read-only; create a new SolarTechnology instead.")
+        object.__delattr__(self, name)
+
+    def get_params_for_year(self, year: int) -> TechParams:
         """Calculates technology parameters for a given year using linear interpolation for efficiency."""
-        if year < self.start_year:
+        return self._cached_params_for_year(year)
+
+    def _compute_params_for_year(self, year: int) -> TechParams:
+        years_since_start = year - self.start_year
+        if years_since_start < 0:
             # Technology not yet available or using base_efficiency if before official start
-            current_efficiency = self.base_efficiency 
-        elif year >= 2035:
-            current_efficiency = self.projected_efficiency_2035
+            current_efficiency = self._rounded_base_efficiency
+            current_capex = self._rounded_base_capex
         else:
-            years_since_start = year - self.start_year
-            current_efficiency = self.base_efficiency + (self.annual_efficiency_improvement * years_since_start)
-            current_efficiency = min(current_efficiency, self.projected_efficiency_2035) # Cap at projected max
+            if year >= 2035:
+                current_efficiency = self._rounded_projected_efficiency_2035
+            else:
+                current_efficiency = self.base_efficiency + (self.annual_efficiency_improvement * years_since_start)
+                current_efficiency = round(min(current_efficiency, self.projected_efficiency_2035), 4) # Cap at projected max
 
-        # Apply CAPEX learning curve
-        if year < self.start_year:
-            current_capex = self.base_capex_usd_per_kw
-        else:
-            years_for_capex_reduction = year - self.start_year
-            current_capex = self.base_capex_usd_per_kw * ((1 - self.annual_capex_reduction_rate) ** years_for_capex_reduction)
-            current_capex = max(current_capex, 0) # Ensure CAPEX doesn't go negative
+            # Apply CAPEX learning curve
+            if isinstance(year, (int, np.integer)) and years_since_start < CAPEX_TABLE_YEARS:
+                current_capex = self._rounded_capex_by_years_since_start[years_since_start]
+            else:
+                current_capex = self.base_capex_usd_per_kw * ((1 - self.annual_capex_reduction_rate) ** years_since_start)
+                current_capex = round(max(current_capex, 0), 2) # Ensure CAPEX doesn't go negative
+
+        return TechParams(
+            name=self.name,
+            year=year,
+            efficiency=current_efficiency,
+            degradation_rate_annual=self.degradation_rate_annual,
+            capex_usd_per_kw=current_capex,
+            is_commercially_available=year >= self.commercial_scale_year,
+            commercial_scale_year=self.commercial_scale_year,
+            is_storage=self.is_storage
+        )
+
+    def get_params_for_years(self, years) -> dict:
+        """Vectorized get_params_for_year over an array of years.
 
+        Returns the same keys; 'year', 'efficiency', 'capex_usd_per_kw' and 'is_commercially_available'
+        hold arrays of the shape of years (rounded like the scalar version), the rest are scalars.
+        """
+        years = np.asarray(years)
+        current_efficiency, current_capex = _efficiency_and_capex(
+            years, self.start_year, self.base_efficiency, self.annual_efficiency_improvement,
+            self.projected_efficiency_2035, self.base_capex_usd_per_kw, self.annual_capex_reduction_rate)
         return {
             'name': self.name,
-            'year': year,
-            'efficiency': round(current_efficiency, 4),
+            'year': years,
+            'efficiency': np.round(current_efficiency, 4),
             'degradation_rate_annual': self.degradation_rate_annual,
-            'capex_usd_per_kw': round(current_capex, 2),
-            'is_commercially_available': year >= self.commercial_scale_year,
-            'commercial_scale_year': self.commercial_scale_year
+            'capex_usd_per_kw': np.round(current_capex, 2),
+            'is_commercially_available': years >= self.commercial_scale_year,
+            'commercial_scale_year': self.commercial_scale_year,
+            'is_storage': self.is_storage
         }
 
     def __repr__(self):
@@ -66,19 +187,77 @@ class SolarTechModel:
     """Manages a portfolio of solar technologies and their evolution."""
     def __init__(self):
         self.technologies = {}
-        print("SolarTechModel initialized.")
+        # Per-technology parameter columns for portfolio-wide queries; built on first use
+        self._portfolio_columns = None
+        logger.info("SolarTechModel initialized.")
 
     def add_technology(self, tech: SolarTechnology):
         self.technologies[tech.name] = tech
-        print(f"Added technology: {tech.name}")
+        self._portfolio_columns = None
+        logger.debug("Added technology: %s", tech.name)
 
-    def get_technology_details(self, tech_name: str, year: int) -> dict:
+    def get_technology_details(self, tech_name: str, year: int) -> Union[TechParams, Dict[str, str]]:
+        """The technology's TechParams for the year, or a dict with an 'error' message if it is unknown."""
         if tech_name not in self.technologies:
             return {'error': f"Technology '{tech_name}' not found."}
         
         tech = self.technologies[tech_name]
         return tech.get_params_for_year(year)
 
+    def get_portfolio_params(self, years, out: dict = None) -> dict:
+        """Technology parameters for every technology (rows, in list_technologies() order) and year (columns).
+
+        Returns 'names' and 'years', (technologies x years) arrays 'efficiency', 'capex_usd_per_kw' and
+        'is_commercially_available' as in get_params_for_year (rounded alike), and per-technology arrays
+        'degradation_rate_annual', 'commercial_scale_year' and 'is_storage'.
+
+        out: Optional dict of preallocated 'efficiency' and 'capex_usd_per_kw' (float64) and
+             'is_commercially_available' (bool) arrays of shape (technologies,) + years.shape to fill
+             instead of allocating new ones, e.g. the result of a previous call for as many years.
+        """
+        if self._portfolio_columns is None:
+            techs = list(self.technologies.values())
+            self._portfolio_columns = {
+                field: np.array([getattr(tech, field) for tech in techs])
+                for field in ('start_year', 'base_efficiency', 'annual_efficiency_improvement', 'projected_efficiency_2035',
+                              'base_capex_usd_per_kw', 'annual_capex_reduction_rate', 'degradation_rate_annual',
+                              'commercial_scale_year', 'is_storage')
+            }
+        columns = self._portfolio_columns
+        years = np.asarray(years)
+        # Technologies along a new leading axis, broadcast against the years
+        rows = {field: values[(slice(None),) + (None,) * years.ndim] for field, values in columns.items()}
+        if out is None:
+            shape = (len(self.technologies),) + years.shape
+            out = {'efficiency': np.empty(shape), 'capex_usd_per_kw': np.empty(shape),
+                   'is_commercially_available': np.empty(shape, dtype=bool)}
+        efficiency, capex, available = out['efficiency'], out['capex_usd_per_kw'], out['is_commercially_available']
+
+        # _efficiency_and_capex computed in the output buffers: capex first holds the years since the
+        # start year, and the availability mask first holds the years before the start year
+        before_start = np.less(years, rows['start_year'], out=available)
+        years_since_start = np.maximum(np.subtract(years, rows['start_year'], out=capex), 0, out=capex)
+        np.multiply(rows['annual_efficiency_improvement'], years_since_start, out=efficiency)
+        np.add(rows['base_efficiency'], efficiency, out=efficiency)
+        np.minimum(efficiency, rows['projected_efficiency_2035'], out=efficiency)
+        np.copyto(efficiency, rows['projected_efficiency_2035'], where=years >= 2035)
+        np.copyto(efficiency, rows['base_efficiency'], where=before_start)
+        np.power(1 - rows['annual_capex_reduction_rate'], years_since_start, out=capex)
+        np.multiply(rows['base_capex_usd_per_kw'], capex, out=capex)
+        np.maximum(capex, 0, out=capex)
+        np.copyto(capex, rows['base_capex_usd_per_kw'], where=before_start)
+        np.greater_equal(years, rows['commercial_scale_year'], out=available)
+        return {
+            'names': list(self.technologies),
+            'years': years,
+            'efficiency': np.round(efficiency, 4, out=efficiency),
+            'capex_usd_per_kw': np.round(capex, 2, out=capex),
+            'is_commercially_available': available,
+            'degradation_rate_annual': columns['degradation_rate_annual'],
+            'commercial_scale_year': columns['commercial_scale_year'],
+            'is_storage': columns['is_storage'],
+        }
+
     def list_technologies(self, year: int = None) -> list:
         """Lists available technologies. If year is provided, lists only commercially available ones."""
         if year is None:
@@ -91,6 +270,8 @@ class SolarTechModel:
             return available_techs
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+
     stm = SolarTechModel()
 
     # Data based on project description (adjust as needed)
@@ -0,0 +1,8 @@
+"""
+Unit conversion constants shared across the simulation modules.
+"""
+
+from typing import Final
+
+HOURS_PER_YEAR: Final = 8760
+KWH_PER_MWH: Final = 1000
@@ -1,6 +1,7 @@
 # Main simulation engine for the Global Solar Energy Simulation Framework
 import pandas as pd
 import logging
+from dataclasses import asdict, is_dataclass
 from typing import Dict, Any, List
 
 # Configure basic logging
@@ -208,7 +209,8 @@ class SimulationEngine:
                     solar_tech_model=self.solar_tech_model,
                     cost_model=self.cost_model # Added cost_model instance
                 )
-                self.logger.info(f"Market outcomes for year {year}: {market_outcomes}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Market outcomes for year %d: %s", year, market_outcomes)
                 return market_outcomes if market_outcomes is not None else {}
             except TypeError as e:
                 self.logger.error(f"Error during market simulation for year {year}: {e}", exc_info=True)
@@ -272,6 +274,10 @@ class SimulationEngine:
         """
         self.logger.info(f"Collecting results for year {year}...")
 
+        # Region outcomes may be RegionOutcome records; store plain dicts so saved results stay literal_eval-able
+        market_outcomes = {region: asdict(outcome) if is_dataclass(outcome) else outcome
+                           for region, outcome in market_outcomes.items()}
+
         # Basic structure for yearly results
         yearly_data = {
             "year": year,
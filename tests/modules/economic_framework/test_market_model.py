@@ -1,5 +1,8 @@
 import unittest
+from unittest.mock import patch
 from src.modules.economic_framework.market_model import MarketSimulator
+from src.modules.grid_integration.grid_model import GridModel
+from src.modules.technological_evolution.solar_tech_model import SolarTechModel, SolarTechnology
 
 class TestMarketSimulator(unittest.TestCase):
     def setUp(self):
@@ -83,5 +86,110 @@ class TestMarketSimulator(unittest.TestCase):
         revenue = self.simulator.estimate_ancillary_revenue(capacity_mw=10, service_type='freq_control', region='UnknownRegion')
         self.assertAlmostEqual(revenue, 0.0)
 
+    def test_estimate_ancillary_revenue_with_availability_factor(self):
+        simulator = MarketSimulator(market_designs={
+            'R': {'ancillary_services': {'spinning_reserve': {'price_usd_per_mw_year': 7000, 'availability_factor': 0.5}}}
+        })
+        revenue = simulator.estimate_ancillary_revenue(capacity_mw=10, service_type='spinning_reserve', region='R')
+        self.assertAlmostEqual(revenue, 35000.0)
+
+    def test_refresh_lookup_tables_after_design_change(self):
+        self.market_designs['TestRegionC']['base_energy_price_usd_per_mwh'] = 80
+        self.market_designs['TestRegionC']['ancillary_services'] = {'freq_control': {'price_usd_per_mw_year': 1000}}
+        self.simulator.refresh_lookup_tables()
+        self.assertAlmostEqual(self.simulator.get_energy_price(region='TestRegionC', time_of_day='peak'), 160.0)
+        revenue = self.simulator.estimate_ancillary_revenue(capacity_mw=10, service_type='freq_control', region='TestRegionC')
+        self.assertAlmostEqual(revenue, 10000.0)
+
+class TestMarketSimulatorDispatch(unittest.TestCase):
+    def setUp(self):
+        self.simulator = MarketSimulator(market_designs={})
+        self.stm = SolarTechModel()
+        self.stm.add_technology(SolarTechnology(name='TestPV', base_efficiency=0.22, projected_efficiency_2035=0.26,
+                                                start_year=2023, commercial_scale_year=2022))
+        self.stm.add_technology(SolarTechnology(name='Test_Battery', base_efficiency=0.90, projected_efficiency_2035=0.92,
+                                                start_year=2020, commercial_scale_year=2020))
+        self.stm.add_technology(SolarTechnology(name='FuturePV', base_efficiency=0.30, projected_efficiency_2035=0.35,
+                                                start_year=2028, commercial_scale_year=2030))
+
+    def _grid(self, load_mw, capacities):
+        return GridModel(initial_regional_data={
+            'R1': {'existing_capacity_mw': 1000, 'current_load_mw': load_mw, 'capacities_mw_by_tech': capacities}
+        })
+
+    def test_dispatch_demand_exceeds_potential(self):
+        grid = self._grid(100, {'TestPV': 50, 'Test_Battery': 20})
+        outcomes = self.simulator.simulate_dispatch_for_year(2025, ['R1'], {}, self.stm, grid, None)
+        region = outcomes['R1']
+        # PV: 50 MW * 0.20 * 8760; Battery: 20 MW * 0.10 * 8760
+        self.assertAlmostEqual(region.total_generation_mwh['TestPV'], 87600.0)
+        self.assertAlmostEqual(region.total_generation_mwh['Test_Battery'], 17520.0)
+        self.assertAlmostEqual(region.annual_demand_mwh, 876000.0)
+        self.assertAlmostEqual(region.total_dispatched_generation_mwh, 105120.0)
+        self.assertAlmostEqual(region.unmet_demand_mwh, 876000.0 - 105120.0)
+
+    def test_dispatch_clips_to_demand(self):
+        # Demand 10 MW flat = 87600 MWh; PV alone could provide 500 * 0.2 * 8760 = 876000 MWh
+        grid = self._grid(10, {'TestPV': 500, 'Test_Battery': 20})
+        outcomes = self.simulator.simulate_dispatch_for_year(2025, ['R1'], {}, self.stm, grid, None)
+        region = outcomes['R1']
+        self.assertEqual(region.total_generation_mwh, {'TestPV': 87600.0})
+        self.assertAlmostEqual(region.total_dispatched_generation_mwh, 87600.0)
+        self.assertEqual(region.unmet_demand_mwh, 0)
+
+    def test_dispatch_marginal_tech_covers_remainder(self):
+        # Demand 876000 MWh; PV gives 262800 + 350400, battery 438000 -> battery only covers the remainder
+        self.stm.add_technology(SolarTechnology(name='OtherPV', base_efficiency=0.2, projected_efficiency_2035=0.25,
+                                                start_year=2023, commercial_scale_year=2022))
+        grid = self._grid(100, {'TestPV': 150, 'OtherPV': 200, 'Test_Battery': 500})
+        region = self.simulator.simulate_dispatch_for_year(2025, ['R1'], {}, self.stm, grid, None)['R1']
+        self.assertAlmostEqual(region.total_generation_mwh['TestPV'], 262800.0)
+        self.assertAlmostEqual(region.total_generation_mwh['OtherPV'], 350400.0)
+        self.assertAlmostEqual(region.total_generation_mwh['Test_Battery'], 876000.0 - 613200.0)
+        self.assertAlmostEqual(region.unmet_demand_mwh, 0.0)
+
+    def test_dispatch_stops_when_demand_met_exactly(self):
+        # TestPV alone meets demand exactly (500 * 0.2 * 8760 = 100 * 8760)
+        grid = self._grid(100, {'TestPV': 500, 'Test_Battery': 20})
+        region = self.simulator.simulate_dispatch_for_year(2025, ['R1'], {}, self.stm, grid, None)['R1']
+        self.assertEqual(list(region.total_generation_mwh), ['TestPV'])
+        self.assertAlmostEqual(region.unmet_demand_mwh, 0.0)
+
+    def test_dispatch_skips_unavailable_and_unknown_techs(self):
+        grid = self._grid(100, {'FuturePV': 50, 'UnknownTech': 50, 'TestPV': 0})
+        outcomes = self.simulator.simulate_dispatch_for_year(2025, ['R1'], {}, self.stm, grid, None)
+        region = outcomes['R1']
+        self.assertEqual(region.total_generation_mwh, {})
+        self.assertAlmostEqual(region.unmet_demand_mwh, 876000.0)
+
+    def test_dispatch_looks_up_tech_details_once_per_year(self):
+        grid = GridModel(initial_regional_data={
+            region: {'existing_capacity_mw': 1000, 'current_load_mw': 100, 'capacities_mw_by_tech': {'TestPV': 10, 'Test_Battery': 5}}
+            for region in ('R1', 'R2', 'R3')
+        })
+        with patch.object(self.stm, 'get_technology_details', wraps=self.stm.get_technology_details) as mock_details:
+            outcomes = self.simulator.simulate_dispatch_for_year(2025, ['R1', 'R2', 'R3'], {}, self.stm, grid, None)
+        self.assertEqual(mock_details.call_count, 2)
+        self.assertAlmostEqual(outcomes['R3'].total_generation_mwh['TestPV'], 17520.0)
+
+    def test_dispatch_region_without_capacity(self):
+        grid = self._grid(100, {})
+        outcomes = self.simulator.simulate_dispatch_for_year(2025, ['R1', 'Missing'], {}, self.stm, grid, None)
+        self.assertAlmostEqual(outcomes['R1'].unmet_demand_mwh, 876000.0)
+        self.assertEqual(outcomes['Missing'].total_generation_mwh, {})
+
+    def test_parallel_dispatch_matches_serial(self):
+        regions = ['R%d' % i for i in range(6)]
+        grid = GridModel(initial_regional_data={
+            region: {'existing_capacity_mw': 1000, 'current_load_mw': 10 * (i + 1),
+                     'capacities_mw_by_tech': {'TestPV': 40, 'Test_Battery': 30 * i, 'FuturePV': 10}}
+            for i, region in enumerate(regions)
+        })
+        serial = self.simulator.simulate_dispatch_for_year(2025, regions + ['Missing'], {}, self.stm, grid, None)
+        parallel_simulator = MarketSimulator(market_designs={}, max_workers=2)
+        parallel_simulator.PARALLEL_MIN_REGIONS = 1
+        parallel = parallel_simulator.simulate_dispatch_for_year(2025, regions + ['Missing'], {}, self.stm, grid, None)
+        self.assertEqual(parallel, serial)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import numpy as np
+from src.modules.grid_integration.dispatch_modeler import DispatchModeler
+
+class TestDispatchModeler(unittest.TestCase):
+    def setUp(self):
+        self.modeler = DispatchModeler(system_parameters={'initial_inertia_gws': 250})
+        self.demand = [100, 110, 120, 150, 160, 155, 140, 120]
+        self.solar = [0, 5, 20, 50, 60, 55, 30, 0]
+        self.other = [100, 100, 100, 100, 100, 100, 100, 100]
+
+    def test_simulate_dispatch_curtailment_and_unmet(self):
+        result = self.modeler.simulate_dispatch(self.demand, self.solar, self.other)
+        # Surplus per step: 0, -5, 0, 0, 0, 0, -10, -20
+        self.assertAlmostEqual(result['curtailment_mwh'], 0.0)
+        self.assertAlmostEqual(result['unmet_demand_mwh'], 35.0)
+
+    def test_simulate_dispatch_matches_stepwise_reference(self):
+        demand = [50, 80, 20, 0, 75.5]
+        solar = [70, 10, 40, 5, 0]
+        other = [0, 30, 0, 0, 75.5]
+        result = self.modeler.simulate_dispatch(demand, solar, other)
+        expected_curtailment = sum(max(s + o - d, 0) for d, s, o in zip(demand, solar, other))
+        expected_unmet = sum(max(d - s - o, 0) for d, s, o in zip(demand, solar, other))
+        self.assertAlmostEqual(result['curtailment_mwh'], expected_curtailment)
+        self.assertAlmostEqual(result['unmet_demand_mwh'], expected_unmet)
+
+    def test_simulate_dispatch_accumulates_long_profiles_in_float64(self):
+        steps = 8760 * 4
+        demand = np.full(steps, 1000.1)
+        solar = np.full(steps, 1200.3)
+        other = np.zeros(steps)
+        result = self.modeler.simulate_dispatch(demand, solar, other)
+        # Per-step values are rounded to float32, but the sum over all steps must not drift further
+        step_surplus = float(np.float32(1200.3)) - float(np.float32(1000.1))
+        self.assertAlmostEqual(result['curtailment_mwh'], step_surplus * steps, places=3)
+        self.assertEqual(result['unmet_demand_mwh'], 0.0)
+
+    def test_simulate_dispatch_empty_profiles(self):
+        result = self.modeler.simulate_dispatch([], [], [])
+        self.assertEqual(result['curtailment_mwh'], 0.0)
+        self.assertEqual(result['unmet_demand_mwh'], 0.0)
+
+    def test_simulate_dispatch_rejects_mismatched_profiles(self):
+        with self.assertRaises(ValueError):
+            self.modeler.simulate_dispatch(self.demand, [1], [1])
+        with self.assertRaises(ValueError):
+            self.modeler.simulate_dispatch(self.demand, self.solar, self.other[:-1])
+
+    def test_project_system_inertia_floors_at_zero(self):
+        inertia = self.modeler.project_system_inertia(year=2030, conventional_retirements_gw=10, gf_inverters_added_gw=5)
+        self.assertAlmostEqual(inertia, 250 - 50 + 5)
+        inertia = self.modeler.project_system_inertia(year=2031, conventional_retirements_gw=100, gf_inverters_added_gw=0)
+        self.assertEqual(inertia, 0)
+
+    def test_project_system_inertia_vec_matches_yearly_calls(self):
+        retirements = [10, 60, 0, 2, 0]
+        gfi_added = [5, 0, 20, 4, 1]
+        reference = DispatchModeler(system_parameters={'initial_inertia_gws': 250})
+        expected = [reference.project_system_inertia(2030 + i, r, g) for i, (r, g) in enumerate(zip(retirements, gfi_added))]
+        traj = self.modeler.project_system_inertia_vec(np.array(retirements), np.array(gfi_added))
+        np.testing.assert_allclose(traj, expected)
+        self.assertAlmostEqual(self.modeler.current_inertia_gws, expected[-1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+from src.modules.grid_integration.grid_data_store import GridDataStore
+from src.modules.grid_integration.grid_model import GridModel
+from src.modules.grid_integration.transmission_planner import TransmissionPlanner
+
+class TestGridDataStore(unittest.TestCase):
+    def setUp(self):
+        self.store = GridDataStore(['North', 'South', 'East'])
+
+    def test_region_lookup(self):
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.resolve('South'), 1)
+        self.assertEqual(self.store.resolve(2), 2)
+        self.assertIsNone(self.store.resolve('West'))
+        self.assertIsNone(self.store.resolve(3))
+        np.testing.assert_array_equal(self.store.ids_of(['East', 'North']), [2, 0])
+        with self.assertRaises(KeyError):
+            self.store.ids_of(['West'])
+
+    def test_duplicate_region_names_rejected(self):
+        with self.assertRaises(ValueError):
+            GridDataStore(['North', 'North'])
+
+    def test_add_column(self):
+        column = self.store.add_column('load_mw', {'South': 40.0}, default=0.0)
+        np.testing.assert_array_equal(column, [0.0, 40.0, 0.0])
+        self.assertIs(self.store.column('load_mw'), column)
+        with self.assertRaises(ValueError):
+            self.store.add_column('load_mw', {})
+
+    def test_models_share_region_ids_and_columns(self):
+        grid = GridModel(initial_regional_data={
+            'North': {'existing_capacity_mw': 1000, 'current_load_mw': 600},
+            'South': {'existing_capacity_mw': 500, 'current_load_mw': 400},
+            'Offshore': {'existing_capacity_mw': 100, 'current_load_mw': 50},
+        }, store=self.store)
+        planner = TransmissionPlanner(regional_grid_data={
+            'South': {'capacity_gw': 120, 'expansion_cost_per_gw_mile': 1200000},
+            'East': {'capacity_gw': 90},
+        }, store=self.store)
+
+        # Regions outside the store are skipped; store regions without grid data are unknown to the grid model
+        self.assertNotIn('Offshore', grid.regional_data)
+        self.assertEqual(grid.get_current_capacity_by_tech('East'), {})
+        self.assertEqual(grid.get_max_solar_penetration_mw('East'), 0.0)
+
+        # Ids from one model are valid for the other
+        ids = grid.region_ids_of(['South', 'North'])
+        projects = planner.evaluate_expansion_projects(ids, 10.0, 100.0)
+        self.assertEqual(projects['cost_estimate_usd'][0], 10.0 * 100.0 * 1200000)
+        self.assertTrue(np.isinf(projects['cost_estimate_usd'][1]))
+
+        grid.add_solar_capacity('South', 25.0)
+        np.testing.assert_array_equal(self.store.column('current_solar_mw'), [0.0, 25.0, 0.0])
+        np.testing.assert_array_equal(planner.assess_interconnection_matrix(), np.outer([False, True, True], [False, True, True]))
+
+    def test_planner_scalar_checks_cover_regions_outside_store(self):
+        planner = TransmissionPlanner(regional_grid_data={
+            'South': {'capacity_gw': 120}, 'Offshore': {'capacity_gw': 5}}, store=self.store)
+        self.assertTrue(planner.assess_interconnection_viability('South', 'Offshore', 1.0).startswith('Potentially Viable'))
+        self.assertEqual(planner.evaluate_expansion_project('Offshore', 1.0, 10.0)['cost_estimate_usd'], 10.0 * 1000000)
+
+if __name__ == '__main__':
+    unittest.main()
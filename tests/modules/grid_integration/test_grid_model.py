@@ -1,6 +1,7 @@
 import unittest
 import sys
 import os
+import numpy as np
 
 # Adjust path to import modules from src
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,7 +11,7 @@ src_path = os.path.join(project_root_dir, 'src')
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-from modules.grid_integration.grid_model import GridModel
+from modules.grid_integration.grid_model import GridModel, RegionParams, _is_solar_pv
 
 class TestGridModel(unittest.TestCase):
 
@@ -124,5 +125,129 @@ class TestGridModel(unittest.TestCase):
         )
         self.assertEqual(cost, 0)
 
+class TestGridModelMultiRegion(unittest.TestCase):
+    """Tests for the multi-region GridModel API (initial_regional_data)."""
+
+    def setUp(self):
+        self.grid = GridModel(initial_regional_data={
+            'RegionA': {'existing_capacity_mw': 1000, 'current_load_mw': 600},
+            'RegionB': {'existing_capacity_mw': 500, 'current_load_mw': 400, 'max_solar_penetration_pct': 0.10}
+        })
+
+    def test_get_current_capacity_arrays(self):
+        self.grid.add_new_capacity(2025, {'RegionA': {'TOPCon_PV': 50.0, 'LFP_Battery': 20.0}})
+        self.grid.add_new_capacity(2026, {'RegionA': {'TOPCon_PV': 25.0}})
+        tech_names, capacities = self.grid.get_current_capacity_arrays('RegionA')
+        self.assertEqual(tech_names, ['TOPCon_PV', 'LFP_Battery'])
+        self.assertEqual(capacities.tolist(), [75.0, 20.0])
+
+    def test_get_current_capacity_arrays_empty_and_unknown_region(self):
+        for region in ('RegionB', 'UnknownRegion'):
+            tech_names, capacities = self.grid.get_current_capacity_arrays(region)
+            self.assertEqual(tech_names, [])
+            self.assertEqual(capacities.shape, (0,))
+
+    def test_interconnection_costs_batch_matches_scalar(self):
+        regions = ['RegionA', 'RegionB', 'RegionA']
+        capacities = np.array([100.0, 50.0, 10.0])
+        distances = np.array([10.0, 25.0, 0.0])
+        batch = self.grid.calculate_interconnection_costs_batch(self.grid.region_ids_of(regions), capacities, distances)
+        expected = [self.grid.calculate_interconnection_costs(r, c, d) for r, c, d in zip(regions, capacities, distances)]
+        np.testing.assert_allclose(batch, expected)
+        # Scalar distances broadcast across candidates
+        batch = self.grid.calculate_interconnection_costs_batch(self.grid.region_ids_of(regions), capacities, 10.0)
+        np.testing.assert_allclose(batch, [self.grid.calculate_interconnection_costs(r, c, 10.0) for r, c in zip(regions, capacities)])
+
+    def test_solar_capacity_kept_in_step_with_region_data(self):
+        self.grid.add_solar_capacity('RegionB', 30.0)
+        self.grid.add_new_capacity(2025, {'RegionB': {'TOPCon_PV': 10.0, 'LFP_Battery': 5.0}})
+        self.assertEqual(self.grid.get_current_solar_mw('RegionB'), 40.0)
+        self.assertEqual(self.grid.regional_data['RegionB']['current_solar_mw'], 40.0)
+        self.assertAlmostEqual(self.grid.get_max_solar_penetration_mw('RegionB'), 50.0)
+        self.assertFalse(self.grid.check_grid_constraints('RegionB', 20.0))
+
+    def test_add_new_capacity_batches_solar_totals(self):
+        self.grid.add_new_capacity(2025, {
+            'RegionA': {'TOPCon_PV': 50.0, 'Perovskite_Tandem': 30.0, 'LFP_Battery': 20.0, 'PV_Battery_Hybrid': 5.0, 'Idle_PV': 0.0},
+            'UnknownRegion': {'TOPCon_PV': 10.0},
+        })
+        self.assertEqual(self.grid.get_current_solar_mw('RegionA'), 80.0)
+        self.assertEqual(self.grid.regional_data['RegionA']['current_solar_mw'], 80.0)
+        self.assertNotIn('Idle_PV', self.grid.get_current_capacity_by_tech('RegionA'))
+        self.assertEqual(self.grid.get_current_capacity_by_tech('RegionA')['PV_Battery_Hybrid'], 5.0)
+
+    def test_is_solar_pv_classification(self):
+        for name in ('TOPCon_PV', 'AdvancedMonocrystallineSilicon', 'Perovskite_Tandem', 'solar_farm'):
+            self.assertTrue(_is_solar_pv(name), name)
+        for name in ('LFP_Battery', 'Solar_Plus_Battery', 'Onshore_Wind'):
+            self.assertFalse(_is_solar_pv(name), name)
+
+    def test_try_add_solar_batch_matches_sequential_checks(self):
+        # RegionA limit 500 MW, RegionB limit 50 MW
+        regions = ['RegionA', 'RegionB', 'RegionA', 'RegionB']
+        additions = [300.0, 60.0, 250.0, 40.0]
+        admitted = self.grid.try_add_solar_batch(self.grid.region_ids_of(regions), np.array(additions))
+        self.assertEqual(admitted.tolist(), [True, False, False, True])
+        self.assertEqual(self.grid.get_current_solar_mw('RegionA'), 300.0)
+        self.assertEqual(self.grid.regional_data['RegionB']['current_solar_mw'], 40.0)
+
+        admitted = self.grid.try_add_solar_batch(self.grid.region_ids_of(['RegionB', 'RegionA']), np.array([20.0, 200.0]))
+        self.assertEqual(admitted.tolist(), [False, True])
+        self.assertEqual(self.grid.get_current_solar_mw('RegionA'), 500.0)
+
+    def test_capacities_are_tracked_per_region(self):
+        # Neither region configures capacities_mw_by_tech, so both start from the defaults
+        self.grid.add_new_capacity(2025, {'RegionA': {'LFP_Battery': 20.0}})
+        self.grid.add_new_capacity(2025, {'RegionB': {'TOPCon_PV': 5.0, 'LFP_Battery': 1.0}})
+        self.assertEqual(self.grid.get_current_capacity_by_tech('RegionA'), {'LFP_Battery': 20.0})
+        self.assertEqual(self.grid.get_current_capacity_by_tech('RegionB'), {'TOPCon_PV': 5.0, 'LFP_Battery': 1.0})
+        self.assertNotIn('capacities_mw_by_tech', self.grid.regional_data['RegionA'])
+
+    def test_region_methods_accept_integer_ids(self):
+        region_b = int(self.grid.region_ids_of(['RegionB'])[0])
+        self.grid.add_solar_capacity(region_b, 10.0)
+        self.assertEqual(self.grid.get_current_solar_mw('RegionB'), 10.0)
+        self.assertEqual(self.grid.get_max_solar_penetration_mw(region_b), self.grid.get_max_solar_penetration_mw('RegionB'))
+        self.assertEqual(self.grid.calculate_interconnection_costs(region_b, 5.0), self.grid.calculate_interconnection_costs('RegionB', 5.0))
+        self.assertFalse(self.grid.check_grid_constraints(region_b, 45.0))
+        self.assertEqual(self.grid.get_current_solar_mw(99), 0.0)
+
+    def test_regional_data_holds_region_params(self):
+        params = self.grid.regional_data['RegionB']
+        self.assertIsInstance(params, RegionParams)
+        self.assertEqual(params.max_solar_penetration_pct, 0.10)
+        self.assertEqual(params['current_load_mw'], 400)
+        self.assertEqual(params.get('avg_terrain_factor'), 1.0)
+        params['notes'] = 'coastal'
+        self.assertIn('notes', params)
+        self.assertEqual(params.extra, {'notes': 'coastal'})
+        self.assertIsNone(params.get('missing_key'))
+
+    def test_region_params_edits_reach_calculations(self):
+        params = self.grid.regional_data['RegionB']
+        max_solar = self.grid.get_max_solar_penetration_mw('RegionB')
+        params['max_solar_penetration_pct'] = 0.20
+        self.assertAlmostEqual(self.grid.get_max_solar_penetration_mw('RegionB'), 2 * max_solar)
+        params.current_solar_mw = 15.0
+        self.assertEqual(self.grid.get_current_solar_mw('RegionB'), 15.0)
+        cost = self.grid.calculate_interconnection_costs('RegionB', 5.0, 0.0)
+        params['transmission_constraint_factor'] = 2.0
+        self.assertAlmostEqual(self.grid.calculate_interconnection_costs('RegionB', 5.0, 0.0), 2 * cost)
+
+    def test_interconnection_costs_with_region_factors(self):
+        grid = GridModel(initial_regional_data={'RegionC': {
+            'existing_capacity_mw': 800, 'current_load_mw': 500, 'base_interconnection_cost_usd_per_mw': 90000,
+            'avg_transmission_cost_usd_per_mw_km': 2500.0, 'avg_terrain_factor': 1.3, 'transmission_constraint_factor': 1.2}})
+        expected = (90000 * 100.0 + 2500.0 * 100.0 * 20.0 * 1.3) * 1.2
+        self.assertAlmostEqual(grid.calculate_interconnection_costs('RegionC', 100.0, 20.0), expected)
+        np.testing.assert_allclose(grid.calculate_interconnection_costs_batch([0], 100.0, 20.0), [expected])
+
+    def test_region_ids_of(self):
+        np.testing.assert_array_equal(self.grid.region_ids_of(['RegionB', 'RegionA', 'RegionB']), [1, 0, 1])
+        self.assertEqual(self.grid.region_ids_of([]).shape, (0,))
+        with self.assertRaises(KeyError):
+            self.grid.region_ids_of(['RegionA', 'RegionZ'])
+
+
 if __name__ == '__main__':
     unittest.main()
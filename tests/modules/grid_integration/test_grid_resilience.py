@@ -0,0 +1,32 @@
+import unittest
+from src.modules.grid_integration.grid_resilience import GridResilienceAssessor
+
+class TestGridResilienceAssessor(unittest.TestCase):
+    def setUp(self):
+        topology = {
+            'substation_A': {'criticality': 'high'},
+            'substation_B': {'criticality': 'medium'},
+            'line_C': {},
+        }
+        threats = {
+            'ransomware': {'likelihood': 'medium'},
+            'supply_chain_implant': {'likelihood': 'high'},
+            'phishing': {'likelihood': 'low'},
+        }
+        self.assessor = GridResilienceAssessor(grid_topology_data=topology, threat_models=threats)
+
+    def test_evaluate_cybersecurity_risk(self):
+        self.assertEqual(self.assessor.evaluate_cybersecurity_risk('substation_A', 'ransomware'), 'medium')
+        self.assertEqual(self.assessor.evaluate_cybersecurity_risk('substation_A', 'supply_chain_implant'), 'high')
+        self.assertEqual(self.assessor.evaluate_cybersecurity_risk('substation_B', 'supply_chain_implant'), 'low')
+        self.assertEqual(self.assessor.evaluate_cybersecurity_risk('unknown', 'ransomware'), 'low')
+
+    def test_batch_risk_matches_scalar(self):
+        components = ['substation_A', 'substation_B', 'line_C', 'unknown']
+        threats = ['ransomware', 'supply_chain_implant', 'phishing', 'unknown']
+        pairs = [(c, t) for c in components for t in threats]
+        batch = self.assessor.evaluate_cybersecurity_risk_batch([c for c, _ in pairs], [t for _, t in pairs])
+        self.assertEqual(batch.tolist(), [self.assessor.evaluate_cybersecurity_risk(c, t) for c, t in pairs])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+from src.modules.grid_integration.transmission_planner import TransmissionPlanner
+
+class TestTransmissionPlanner(unittest.TestCase):
+    def setUp(self):
+        grid_data = {
+            'North_Zone': {'capacity_gw': 150, 'expansion_cost_per_gw_mile': 800000},
+            'South_Zone': {'capacity_gw': 120, 'expansion_cost_per_gw_mile': 1200000},
+            'East_Zone': {'capacity_gw': 90},
+            'West_Zone': {},
+        }
+        self.planner = TransmissionPlanner(regional_grid_data=grid_data)
+
+    def test_batch_matches_scalar(self):
+        regions = ['North_Zone', 'South_Zone', 'East_Zone']
+        capacities = [20.0, 5.0, 12.5]
+        distances = [100.0, 250.0, 40.0]
+        batch = self.planner.evaluate_expansion_projects(regions, capacities, distances)
+        for i, region in enumerate(regions):
+            scalar = self.planner.evaluate_expansion_project(region, capacities[i], distances[i])
+            self.assertAlmostEqual(batch['cost_estimate_usd'][i], scalar['cost_estimate_usd'])
+            self.assertAlmostEqual(batch['timeline_years'][i], scalar['timeline_years'])
+
+    def test_batch_accepts_region_ids_and_broadcasts(self):
+        batch = self.planner.evaluate_expansion_projects([0, 1], 10.0, [100.0, 200.0])
+        np.testing.assert_allclose(batch['cost_estimate_usd'], [10.0 * 100.0 * 800000, 10.0 * 200.0 * 1200000])
+        np.testing.assert_allclose(batch['timeline_years'], [4.0, 5.0])
+
+    def test_batch_regions_without_data(self):
+        batch = self.planner.evaluate_expansion_projects(['West_Zone', 'Unknown_Zone'], [0.0, 10.0], [100.0, 100.0])
+        self.assertTrue(np.all(np.isinf(batch['cost_estimate_usd'])))
+        self.assertTrue(np.all(np.isnan(batch['timeline_years'])))
+        self.assertEqual(self.planner.evaluate_expansion_project('West_Zone', 0.0, 100.0)['status'], 'failed_no_data')
+
+    def test_interconnection_matrix_matches_scalar(self):
+        matrix = self.planner.assess_interconnection_matrix()
+        regions = list(self.planner.regional_grid_data)
+        self.assertEqual(matrix.shape, (len(regions), len(regions)))
+        for i, region_a in enumerate(regions):
+            for j, region_b in enumerate(regions):
+                viability = self.planner.assess_interconnection_viability(region_a, region_b, 10.0)
+                self.assertEqual(matrix[i, j], viability.startswith('Potentially Viable'))
+        self.assertTrue(self.planner.assess_interconnection_viability('Unknown_Zone', 'North_Zone', 10.0).startswith('Likely Not Viable'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 import sys
 import os
+import numpy as np
 
 # Adjust path to import modules from src
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,7 +11,7 @@ src_path = os.path.join(project_root_dir, 'src')
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-from modules.policy_landscape.policy_model import PolicyModel
+from modules.policy_landscape.policy_model import Policy, PolicyModel
 
 class TestPolicyModel(unittest.TestCase):
 
@@ -165,5 +166,95 @@ class TestPolicyModel(unittest.TestCase):
         rps_too_early = self.policy_model.get_rps_target(region='California', year=2019, technology='solar_pv')
         self.assertIsNone(rps_too_early)
 
+    def test_get_active_policies_uses_indexes_added_later(self):
+        global_policy = {'id': 'GLOBAL_ITC', 'type': 'itc', 'value': 0.05, 'start_year': 2020, 'end_year': 2030}
+        cal_policy = {'id': 'CAL_ITC', 'type': 'itc', 'value': 0.10, 'region': 'USA',
+                      'applicable_regions': ['California', 'USA'], 'start_year': 2020, 'end_year': 2030}
+        self.policy_model.add_policy(global_policy)
+        self.policy_model.add_policy(cal_policy)
+
+        # Region-only queries combine the region's policies with region-less ones, in insertion order
+        ids = [p['id'] for p in self.policy_model.get_active_policies(region='California', year=2025)]
+        self.assertEqual(ids, ['CAL_RPS_2030', 'GLOBAL_ITC', 'CAL_ITC'])
+        ids = [p['id'] for p in self.policy_model.get_active_policies(region='USA', year=2025, policy_type='itc', technology='solar_pv')]
+        self.assertEqual(ids, ['US_ITC_SOLAR_2025', 'GLOBAL_ITC', 'CAL_ITC'])
+        self.assertEqual(len(self.policy_model.get_active_policies(year=2025)), 6)
+
+    def test_get_active_policies_cache_cleared_by_add_policy(self):
+        first = self.policy_model.get_active_policies(region='China', year=2027, policy_type='itc')
+        self.assertEqual(first, [])
+        first.append('caller-owned list')  # Mutating a result must not leak into later results
+        self.assertEqual(self.policy_model.get_active_policies(region='China', year=2027, policy_type='itc'), [])
+
+        self.policy_model.add_policy({'id': 'CHINA_ITC', 'type': 'itc', 'value': 0.15, 'region': 'China', 'start_year': 2026, 'end_year': 2030})
+        ids = [p['id'] for p in self.policy_model.get_active_policies(region='China', year=2027, policy_type='itc')]
+        self.assertEqual(ids, ['CHINA_ITC'])
+
+    def test_calculate_effective_capex_factor_batch_matches_scalar(self):
+        self.policy_model.add_policy({'id': 'GLOBAL_GRANT', 'type': 'grant_capex_percentage', 'value': 0.02, 'start_year': 2026, 'end_year': 2030})
+        queries = [(region, year, technology)
+                   for region in ('USA', 'Germany', 'California', 'China')
+                   for year in (2021, 2025, 2026, 2033)
+                   for technology in ('solar_pv', 'utility_scale_pv', 'wind_onshore', None)]
+        regions, years, technologies = zip(*queries)
+        batch = self.policy_model.calculate_effective_capex_factor_batch(regions, years, technologies)
+        expected = [self.policy_model.calculate_effective_capex_factor(*query) for query in queries]
+        np.testing.assert_allclose(batch, expected)
+        self.assertEqual(self.policy_model.calculate_effective_capex_factor_batch([], []).shape, (0,))
+        # Omitting technologies matches technology=None for every query
+        np.testing.assert_allclose(self.policy_model.calculate_effective_capex_factor_batch(['USA', 'Germany'], [2025, 2026]),
+                                   [self.policy_model.calculate_effective_capex_factor('USA', 2025), self.policy_model.calculate_effective_capex_factor('Germany', 2026)])
+
+    def test_policies_are_stored_as_policy_records(self):
+        policy = self.policy_model.policies[1]
+        self.assertIsInstance(policy, Policy)
+        self.assertEqual(policy['id'], 'EU_CARBON_PRICE_2028')
+        self.assertEqual(policy.get('description'), 'EU ETS Carbon Price Projection for 2028')
+        self.assertIsNone(policy.technology_scope)
+        self.assertEqual(policy.target_year, float('inf'))
+        self.assertNotIn('target_year', policy)
+        self.assertIsNone(policy.get('target_year'))
+
+    def test_get_rps_target_uses_query_year(self):
+        self.policy_model.add_policy({'id': 'TX_RPS_2015', 'type': 'rps', 'value': 0.20, 'region': 'Texas',
+                                      'target_year': 2015, 'start_year': 2005, 'end_year': 2015})
+        rps = self.policy_model.get_rps_target(region='Texas', year=2010, technology='solar_pv')
+        self.assertIsNotNone(rps)
+        self.assertEqual(rps['policy_id'], 'TX_RPS_2015')
+        self.assertIsNone(self.policy_model.get_rps_target(region='Texas', year=2016))
+
+    def test_get_carbon_price_takes_first_policy_in_order(self):
+        self.policy_model.add_policy({'id': 'EU_CARBON_FLOOR', 'type': 'carbon_price', 'value': 60, 'region': 'EU', 'start_year': 2020, 'end_year': 2040})
+        self.policy_model.add_policy({'id': 'GLOBAL_CARBON', 'type': 'carbon_price', 'value': 10, 'start_year': 2020, 'end_year': 2040})
+        self.assertEqual(self.policy_model.get_carbon_price(region='EU', year=2029), 95) # Listed first, though it starts later
+        self.assertEqual(self.policy_model.get_carbon_price(region='EU', year=2025), 60)
+        self.assertEqual(self.policy_model.get_carbon_price(region='USA', year=2025), 10)
+        self.assertEqual(self.policy_model.get_carbon_price(region='USA', year=2041), 0.0)
+
+    def test_iter_active_policies_matches_get_active_policies(self):
+        for query in [dict(region='USA', year=2025), dict(region='DEU', year=2025, policy_type='fit'),
+                      dict(year=2030, technology='solar_pv'), dict(region='Unknown', year=2025)]:
+            iterated = self.policy_model.iter_active_policies(**query)
+            self.assertNotIsInstance(iterated, list)
+            self.assertEqual([p.id for p in iterated], [p.id for p in self.policy_model.get_active_policies(**query)])
+
+    def test_calculate_effective_capex_factor_saturates_at_full_reduction(self):
+        self.policy_model.add_policy({'id': 'USA_GRANT_A', 'type': 'grant_capex_percentage', 'value': 0.5, 'region': 'USA', 'start_year': 2020, 'end_year': 2030})
+        self.policy_model.add_policy({'id': 'USA_GRANT_B', 'type': 'grant_capex_percentage', 'value': 0.5, 'region': 'USA', 'start_year': 2020, 'end_year': 2030})
+        self.assertEqual(self.policy_model.calculate_effective_capex_factor(region='USA', year=2025, technology='solar_pv'), 0.0)
+        self.assertEqual(self.policy_model.calculate_effective_capex_factor_batch(['USA'], [2025], ['solar_pv']).tolist(), [0.0])
+
+    def test_typed_queries_keep_policy_order_across_interleaved_types(self):
+        model = PolicyModel(policies=[
+            {'id': 'PTC_B', 'type': 'ptc', 'value': 0.02, 'region': 'USA', 'start_year': 2020, 'end_year': 2030},
+            {'id': 'ITC_A', 'type': 'itc', 'value': 0.1, 'region': 'USA', 'start_year': 2020, 'end_year': 2030},
+            {'id': 'PTC_A', 'type': 'ptc', 'value': 0.01, 'start_year': 2010, 'end_year': 2030},
+        ])
+        model.add_policy({'id': 'ITC_B', 'type': 'itc', 'value': 0.2, 'start_year': 2021, 'end_year': 2030})
+        self.assertEqual([p.id for p in model.get_active_policies(region='USA', year=2025, policy_type='ptc')], ['PTC_B', 'PTC_A'])
+        self.assertEqual([p.id for p in model.get_active_policies(region='USA', year=2025, policy_type='itc')], ['ITC_A', 'ITC_B'])
+        self.assertEqual(model.get_ptc_value(region='USA', year=2025), 0.02)
+        self.assertEqual(model.get_active_policies(region='USA', year=2025, policy_type='fit'), [])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from src.modules.policy_landscape.policy_tracker import NdcStatus, PolicyTracker, RpsTarget
+
+class TestPolicyTracker(unittest.TestCase):
+    def setUp(self):
+        self.tracker = PolicyTracker(policy_database={
+            'EU27': {'ndc_target': 'At least 55% net GHG reduction by 2030', 'rps': '42.5% renewables', 'rps_year': 2030},
+            'CHN': {'ndc_target': 'Carbon neutrality before 2060'},
+        })
+
+    def test_get_ndc_status(self):
+        status = self.tracker.get_ndc_status('CHN')
+        self.assertEqual(status, NdcStatus(country='CHN', ndc_target='Carbon neutrality before 2060', assessment_notes='No assessment yet.'))
+        self.assertEqual(str(status), "NDC Status for CHN: Target - Carbon neutrality before 2060")
+        self.assertEqual(self.tracker.get_ndc_status('XYZ').ndc_target, 'Not Available')
+
+    def test_get_rps_target_is_memoized(self):
+        target = self.tracker.get_rps_target('EU27')
+        self.assertEqual(target, RpsTarget(jurisdiction='EU27', rps_target='42.5% renewables', compliance_year=2030))
+        self.assertIs(self.tracker.get_rps_target('EU27'), target)
+        self.assertEqual(self.tracker.get_rps_target('CHN').compliance_year, 'N/A')
+
+    def test_policy_database_is_a_snapshot(self):
+        database = {'CHN': {'ndc_target': 'Carbon neutrality before 2060'}}
+        tracker = PolicyTracker(policy_database=database)
+        database['CHN']['ndc_target'] = 'Revised'
+        database['USA'] = {'ndc_target': '50-52% by 2030'}
+        self.assertEqual(tracker.get_ndc_status('CHN').ndc_target, 'Carbon neutrality before 2060')
+        self.assertNotIn('USA', tracker.policy_database)
+        with self.assertRaises(TypeError):
+            tracker.policy_database['CHN']['ndc_target'] = 'Revised'
+
+if __name__ == '__main__':
+    unittest.main()
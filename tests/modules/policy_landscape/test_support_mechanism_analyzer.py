@@ -0,0 +1,36 @@
+import unittest
+from src.modules.policy_landscape.support_mechanism_analyzer import IncentiveEvaluation, SupportMechanismAnalyzer
+
+class TestSupportMechanismAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = SupportMechanismAnalyzer(mechanism_data={
+            'Germany': {
+                'feed_in_tariff': {'details': 'Declining FiT for small solar', 'effectiveness_score': 4},
+                'just_transition': {'programs': ['Coal region fund', 'Retraining'], 'funding_allocated_usd': 40000000000},
+            },
+            'USA': {'production_tax_credit': {'details': 'PTC for wind'}},
+        })
+
+    def test_evaluate_financial_incentive(self):
+        evaluation = self.analyzer.evaluate_financial_incentive('Germany', 'feed_in_tariff')
+        self.assertEqual(evaluation, IncentiveEvaluation(country='Germany', incentive_type='feed_in_tariff',
+                                                         details='Declining FiT for small solar', effectiveness_score=4))
+        self.assertIs(self.analyzer.evaluate_financial_incentive('Germany', 'feed_in_tariff'), evaluation)
+        self.assertEqual(self.analyzer.evaluate_financial_incentive('USA', 'production_tax_credit').effectiveness_score, 'N/A')
+
+    def test_get_just_transition_info(self):
+        info = self.analyzer.get_just_transition_info('Germany')
+        self.assertEqual(info.programs, ('Coal region fund', 'Retraining'))
+        self.assertEqual(str(info), "Just Transition in Germany: Programs - Coal region fund, Retraining, Funding - $40,000,000,000")
+        self.assertEqual(self.analyzer.get_just_transition_info('USA').programs, ('No specific programs listed',))
+
+    def test_mechanism_data_is_a_snapshot(self):
+        data = {'Germany': {'just_transition': {'programs': ['Coal region fund']}}}
+        analyzer = SupportMechanismAnalyzer(mechanism_data=data)
+        data['Germany']['just_transition']['programs'].append('Retraining')
+        self.assertEqual(analyzer.get_just_transition_info('Germany').programs, ('Coal region fund',))
+        with self.assertRaises(TypeError):
+            analyzer.mechanism_data['Germany']['feed_in_tariff'] = {}
+
+if __name__ == '__main__':
+    unittest.main()
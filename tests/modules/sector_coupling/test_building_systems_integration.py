@@ -0,0 +1,36 @@
+import unittest
+from src.modules.sector_coupling.building_systems_integration import BuildingSolarIntegrationModel
+
+class TestBuildingSolarIntegrationModel(unittest.TestCase):
+    def setUp(self):
+        stock_data = {
+            'MetroCity': {'commercial_bipv_potential_mw': 200, 'residential_roof_area_sqkm': 80},
+            'SuburbTown': {'commercial_bipv_potential_mw': 50, 'residential_roof_area_sqkm': 30},
+            'Village': {'residential_roof_area_sqkm': 2.5},
+        }
+        self.model = BuildingSolarIntegrationModel(building_stock_data=stock_data)
+
+    def test_bipv_potential_batch_matches_scalar(self):
+        cities = ['MetroCity', 'SuburbTown', 'Village', 'UnknownCity']
+        batch = self.model.estimate_bipv_potential_batch(cities, bipv_efficiency=0.18, solar_insolation_kwh_m2_year=1300)
+        self.assertEqual(list(batch), cities)
+        for city in cities:
+            expected = self.model.estimate_bipv_potential(city, bipv_efficiency=0.18, solar_insolation_kwh_m2_year=1300)
+            self.assertAlmostEqual(batch[city], expected, delta=1e-9 * max(1.0, abs(expected)))
+        self.assertEqual(batch['UnknownCity'], 0.0)
+    def test_district_energy_synergy(self):
+        self.assertEqual(self.model.evaluate_district_energy_synergy({'num_buildings': 100, 'shared_solar_mw': 5, 'shared_storage_mwh': 10}), "High")
+        self.assertEqual(self.model.evaluate_district_energy_synergy({'num_buildings': 10, 'shared_solar_mw': 5, 'shared_storage_mwh': 10}), "Moderate")
+        self.assertEqual(self.model.evaluate_district_energy_synergy({}), "Moderate")
+
+    def test_district_energy_synergy_batch(self):
+        levels = self.model.evaluate_district_energy_synergy_batch({
+            'num_buildings': [100, 10, 50, 21],
+            'shared_solar_mw': [5, 5, 1, 1.5],
+            'shared_storage_mwh': [10, 10, 10, 2.5],
+        })
+        self.assertEqual(levels.tolist(), ["High", "Moderate", "Moderate", "High"])
+        self.assertEqual(self.model.evaluate_district_energy_synergy_batch({'num_buildings': [100, 100]}).tolist(), ["Moderate", "Moderate"])
+
+if __name__ == '__main__':
+    unittest.main()
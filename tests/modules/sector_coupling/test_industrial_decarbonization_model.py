@@ -2,10 +2,14 @@ import unittest
 from unittest.mock import MagicMock, patch
 import math
 
+import numpy as np
+
 # Assuming the module structure, adjust if necessary
 # If running tests from the root directory, these imports should work.
 # You might need to adjust them based on your PYTHONPATH or test runner configuration.
-from src.modules.sector_coupling.industrial_decarbonization_model import IndustrialDecarbonizationModel
+from src.modules.sector_coupling.industrial_decarbonization_model import IndustrialDecarbonizationModel, _crf
+from src.modules.sector_coupling._lcoh_kernels import LCOH_BATCH_VECTORIZE_MIN_SIZE, _stack_replacement_present_value
+from src.modules.units import HOURS_PER_YEAR
 from src.modules.technological_evolution.solar_tech_model import SolarTechModel
 from src.modules.economic_framework.cost_model import CostModel
 
@@ -106,5 +110,110 @@ class TestIndustrialDecarbonizationModel(unittest.TestCase):
         lcoh = self.model.estimate_green_hydrogen_production_cost(**params)
         self.assertEqual(lcoh, float('inf'))
 
+    def test_stack_replacement_present_value_matches_discounted_sum(self):
+        """The closed-form stack replacement sum equals discounting each replacement within the lifetime."""
+        for rate, stack_hours, hours, n, lifetime in [(0.07, 80000, 6132, 1, 20), (0.05, 20000, 8000, 7, 20),
+                                                      (0.0, 24000, 8000, 4, 20), (0.08, 40000, 8000, 4, 20)]:
+            expected = sum(210 / (1 + rate) ** ((i * stack_hours) / hours) for i in range(1, n + 1) if (i * stack_hours) / hours < lifetime)
+            self.assertAlmostEqual(_stack_replacement_present_value(210, rate, stack_hours, hours, n, lifetime), expected, places=9)
+        self.assertEqual(_stack_replacement_present_value(210, 0.07, 40000, 8000, 0, 20), 0)
+
+    def test_stack_replacement_on_end_of_life_at_non_integer_stack_lifetimes(self):
+        """A replacement landing on end of life up to rounding is dropped exactly when the per-replacement loop dropped it."""
+        self.mock_cost_model.calculate_lcoe_for_evolving_solar_tech.return_value = {'lcoe_usd_per_mwh': 30.0, 'error': None}
+        cases = [(0.98767, 39, 67485.327, 0.1257), (0.8283, 20, 29024.27, 0.0)]
+        cases += [(cf, life, HOURS_PER_YEAR * cf * life / k, rate) for cf, life, k, rate in
+                  [(0.88, 18, 6, 0.0541), (0.49, 15, 3, 0.0153), (0.75606, 1, 6, 0.0), (0.3, 7, 3, 0.03)]]
+        for cf, life, stack_hours, rate in cases:
+            params = dict(self.default_lcoh_params, electrolyzer_capacity_factor=cf, electrolyzer_lifetime_years=life,
+                          stack_lifetime_hours=stack_hours, electrolyzer_discount_rate=rate)
+            hours = HOURS_PER_YEAR * cf
+            n = math.floor(hours * life / stack_hours)
+            if (hours * life) % stack_hours == 0 and n > 0:
+                n -= 1
+            stack_pv = sum(params['electrolyzer_capex_usd_per_kw'] * params['stack_replacement_cost_pct_capex'] / (1 + rate) ** ((i * stack_hours) / hours)
+                           for i in range(1, n + 1) if (i * stack_hours) / hours < life)
+            crf = rate * (1 + rate) ** life / ((1 + rate) ** life - 1) if rate > 0 else 1 / life
+            annual_mwh = hours / 1000
+            expected = ((params['electrolyzer_capex_usd_per_kw'] * (crf + params['fixed_om_cost_pct_capex']) + stack_pv * crf
+                         + annual_mwh * (params['variable_om_cost_usd_per_mwh'] + 30.0)) / (hours / params['electrolyzer_efficiency_kwh_per_kg_h2']))
+            self.assertAlmostEqual(self.model.estimate_green_hydrogen_production_cost(**params), expected, places=9)
+            for size in (3, LCOH_BATCH_VECTORIZE_MIN_SIZE):
+                batch = self.model.estimate_green_hydrogen_production_cost_batch(**dict(params, electrolyzer_capacity_factor=np.full(size, cf)))
+                np.testing.assert_allclose(batch, expected, rtol=1e-11)
+
+    def test_estimate_lcoh_memoizes_solar_lcoe(self):
+        """Repeated LCOH evaluations reuse the solar LCOE until the cache is cleared."""
+        self.mock_cost_model.calculate_lcoe_for_evolving_solar_tech.return_value = {'lcoe_usd_per_mwh': 30.0, 'error': None}
+        first = self.model.estimate_green_hydrogen_production_cost(**self.default_lcoh_params)
+        params = dict(self.default_lcoh_params, electrolyzer_capex_usd_per_kw=500)
+        self.assertLess(self.model.estimate_green_hydrogen_production_cost(**params), first)
+        self.assertEqual(self.mock_cost_model.calculate_lcoe_for_evolving_solar_tech.call_count, 1)
+
+        self.model.clear_solar_lcoe_cache()
+        self.mock_cost_model.calculate_lcoe_for_evolving_solar_tech.return_value = {'lcoe_usd_per_mwh': 40.0, 'error': None}
+        self.assertGreater(self.model.estimate_green_hydrogen_production_cost(**self.default_lcoh_params), first)
+        self.assertEqual(self.mock_cost_model.calculate_lcoe_for_evolving_solar_tech.call_count, 2)
+
+    def test_estimate_lcoh_batch_matches_scalar(self):
+        """The batch LCOH broadcasts its arguments and agrees with the scalar estimate element-wise."""
+        self.mock_cost_model.calculate_lcoe_for_evolving_solar_tech.return_value = {'lcoe_usd_per_mwh': 30.0, 'error': None}
+        capex = np.array([[400.0], [600.0]])
+        capacity_factor = np.array([0.0, 0.5, 0.7, 0.95])
+        params = dict(self.default_lcoh_params, electrolyzer_capex_usd_per_kw=capex, electrolyzer_capacity_factor=capacity_factor)
+        batch = self.model.estimate_green_hydrogen_production_cost_batch(**params)
+        self.assertEqual(batch.shape, (2, 4))
+        for i, j in np.ndindex(batch.shape):
+            expected = self.model.estimate_green_hydrogen_production_cost(**dict(
+                self.default_lcoh_params, electrolyzer_capex_usd_per_kw=capex[i, 0], electrolyzer_capacity_factor=capacity_factor[j]))
+            if math.isfinite(expected):
+                self.assertAlmostEqual(batch[i, j], expected, places=9)
+            else:
+                self.assertEqual(batch[i, j], expected)
+        self.assertEqual(self.mock_cost_model.calculate_lcoe_for_evolving_solar_tech.call_count, 1)
+
+    def test_estimate_lcoh_batch_invalid_inputs(self):
+        """Undefined CRFs and infinite solar LCOEs give an infinite LCOH in the batch."""
+        self.mock_cost_model.calculate_lcoe_for_evolving_solar_tech.side_effect = lambda **kwargs: (
+            {'lcoe_usd_per_mwh': float('inf'), 'error': 'No data'} if kwargs['year'] == 2030 else {'lcoe_usd_per_mwh': 30.0, 'error': None})
+        params = dict(self.default_lcoh_params, solar_project_year=[2025, 2030, 2025, 2025],
+                      electrolyzer_discount_rate=[0.07, 0.07, 0.0, 0.07], electrolyzer_lifetime_years=[20, 20, 0, 0])
+        lcoh = self.model.estimate_green_hydrogen_production_cost_batch(**params)
+        self.assertTrue(np.isfinite(lcoh[0]))
+        self.assertEqual(lcoh[1:].tolist(), [float('inf')] * 3)
+
+    def test_crf_accurate_for_small_discount_rates(self):
+        """The CRF tends to 1/lifetime as the rate goes to zero, without cancellation error."""
+        self.assertAlmostEqual(_crf(0.07, 20), 0.07 * 1.07 ** 20 / (1.07 ** 20 - 1), places=15)
+        self.assertAlmostEqual(_crf(1e-12, 20), 1 / 20, places=10)
+        self.assertEqual(_crf(0.0, 20), 1 / 20)
+        self.assertIsNone(_crf(0.0, 0))
+
+    def test_estimate_lcoh_batch_small_and_large_agree(self):
+        """Small batches (compiled loop when numba is present) agree with large ones (NumPy expression)."""
+        self.mock_cost_model.calculate_lcoe_for_evolving_solar_tech.return_value = {'lcoe_usd_per_mwh': 30.0, 'error': None}
+        capex = np.linspace(300.0, 1500.0, 1200)
+        discount_rate = np.resize([0.0, 0.03, 0.07, 0.1], capex.size)
+        capacity_factor = np.resize([0.0, 0.45, 0.7, 0.95, 1.0], capex.size)
+        params = dict(self.default_lcoh_params, electrolyzer_capex_usd_per_kw=capex,
+                      electrolyzer_discount_rate=discount_rate, electrolyzer_capacity_factor=capacity_factor)
+        large = self.model.estimate_green_hydrogen_production_cost_batch(**params)
+        small = self.model.estimate_green_hydrogen_production_cost_batch(**dict(
+            params, electrolyzer_capex_usd_per_kw=capex[:20], electrolyzer_discount_rate=discount_rate[:20],
+            electrolyzer_capacity_factor=capacity_factor[:20]))
+        np.testing.assert_allclose(small, large[:20], rtol=1e-12)
+        self.assertAlmostEqual(_stack_replacement_present_value(210, 0.07, 40000, 8000, 1, 20), 210 / 1.07 ** 5, places=12)
+
+    def test_assess_solar_for_industrial_heat_batch_matches_thresholds(self):
+        """Temperatures below 150°C and 400°C fall in the High and Medium bands; the rest are Challenging."""
+        temps = np.array([[20, 149.9, 150], [399, 400, 1500]])
+        labels = self.model.assess_solar_for_industrial_heat_batch(temps)
+        self.assertEqual(labels.shape, (2, 3))
+        self.assertEqual([label.split()[0] for label in labels.ravel()],
+                         ['High', 'High', 'Medium', 'Medium', 'Challenging', 'Challenging'])
+        for temp, label in zip(temps.ravel(), labels.ravel()):
+            self.assertEqual(self.model.assess_solar_for_industrial_heat('Food processing', temp), label)
+
+
 if __name__ == '__main__':
     unittest.main()
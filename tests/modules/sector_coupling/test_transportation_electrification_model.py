@@ -0,0 +1,24 @@
+import unittest
+
+from src.modules.sector_coupling.transportation_electrification_model import TransportationElectrificationModel
+
+class TestTransportationElectrificationModel(unittest.TestCase):
+    def setUp(self):
+        ev_data = {'California': {'ev_penetration_2030': 0.5, 'ev_penetration_2035': 0.75, 'ev_penetration_notes': 'n/a'}}
+        charge_data = {'solar_powered_stations_pct_2030_target': 0.42}
+        self.model = TransportationElectrificationModel(ev_fleet_data=ev_data, charging_infra_data=charge_data)
+
+    def test_project_solar_charging_demand(self):
+        self.assertAlmostEqual(self.model.project_solar_charging_demand('California', 2030), 630.0)
+        self.assertAlmostEqual(self.model.project_solar_charging_demand('California', 2035), 945.0)
+
+    def test_project_solar_charging_demand_defaults_penetration(self):
+        # Years and regions without an entry fall back to 10% penetration
+        self.assertAlmostEqual(self.model.project_solar_charging_demand('California', 2040), 126.0)
+        self.assertAlmostEqual(self.model.project_solar_charging_demand('Texas', 2030), 126.0)
+
+    def test_assess_v2g_potential(self):
+        self.assertAlmostEqual(self.model.assess_v2g_potential('California', enabled_evs_count=500000, avg_battery_kwh=70), 3500.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+import numpy as np
+
+from src.modules.socioeconomic_dimensions.employment_model import EmploymentModel
+
+class TestEmploymentModel(unittest.TestCase):
+    def setUp(self):
+        self.model = EmploymentModel(regional_employment_data={
+            'SunValley': {'solar_jobs_per_mw_direct': 8, 'indirect_multiplier': 1.2, 'induced_multiplier': 0.6},
+            'NorthState': {'solar_jobs_per_mw_direct': 6}
+        })
+
+    def test_estimate_job_creation(self):
+        jobs = self.model.estimate_job_creation('SunValley', 100)
+        self.assertEqual(jobs['direct'], 800)
+        self.assertAlmostEqual(jobs['total'], 800 * (1 + 1.2 + 0.6))
+
+    def test_estimate_job_creation_batch_matches_scalar(self):
+        regions = ['SunValley', 'NorthState', 'Unknown', 'SunValley']
+        capacities = [100, 50.5, 20, 0]
+        batch = self.model.estimate_job_creation_batch(regions, np.array(capacities))
+        for i, (region, capacity) in enumerate(zip(regions, capacities)):
+            expected = self.model.estimate_job_creation(region, capacity)
+            for key in ('direct', 'indirect', 'induced', 'total'):
+                self.assertEqual(batch[key][i], expected[key])
+
+    def test_estimate_job_creation_batch_empty(self):
+        self.assertEqual(self.model.estimate_job_creation_batch([], [])['total'].shape, (0,))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from src.modules.socioeconomic_dimensions.energy_equity_model import (
+    CommunitySolarImpact, CommunitySolarProject, EnergyEquityModel)
+
+class TestEnergyEquityModel(unittest.TestCase):
+    def setUp(self):
+        self.model = EnergyEquityModel(demographic_data={}, energy_access_data={'RuralNationX': {'population_without_electricity': 2500000}})
+
+    def test_evaluate_community_solar_impact(self):
+        project = CommunitySolarProject(capacity_kw=200, subscribers=50, low_income_participation_pct=0.4)
+        impact = self.model.evaluate_community_solar_impact(project)
+        self.assertEqual(impact, CommunitySolarImpact(estimated_annual_generation_kwh=260000, direct_beneficiaries=50,
+                                                      low_income_beneficiaries=20.0))
+        with self.assertRaises(AttributeError):
+            impact.direct_beneficiaries = 0
+
+    def test_evaluate_community_solar_impact_accepts_details_dict(self):
+        impact = self.model.evaluate_community_solar_impact(project_details={'capacity_kw': 100, 'subscribers': 10})
+        self.assertEqual(impact.estimated_annual_generation_kwh, 130000)
+        self.assertEqual(impact['low_income_beneficiaries'], 0)
+        self.assertEqual(impact.get('direct_beneficiaries'), 10)
+        self.assertEqual(impact.to_dict(), {'estimated_annual_generation_kwh': 130000, 'direct_beneficiaries': 10,
+                                            'low_income_beneficiaries': 0})
+        with self.assertRaises(KeyError):
+            impact['missing']
+
+    def test_assess_energy_burden_reduction_batch_matches_scalar(self):
+        savings = [300, 250.5, 0]
+        households = [1000, 40, 7]
+        batch = self.model.assess_energy_burden_reduction_batch(savings, households)
+        self.assertEqual(batch.tolist(), [self.model.assess_energy_burden_reduction('R', s, h) for s, h in zip(savings, households)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from src.modules.supply_chain_dynamics.manufacturing_capacity_model import MINERAL_NAMES, ManufacturingCapacityModel
+
+class TestManufacturingCapacityModel(unittest.TestCase):
+    def setUp(self):
+        self.capacity_data = {
+            'solar_module_gw_2025': {'China': 600, 'EU': 50, 'USA': 40},
+            'battery_gwh_2025': {'China': 1000}
+        }
+        self.model = ManufacturingCapacityModel(capacity_data=self.capacity_data, mineral_data={'silver_grams_per_cell': 0.08, 'lithium_kg_per_kwh_lfp': 0.55})
+
+    def test_project_manufacturing_capacity(self):
+        projections = {
+            'China': {'growth_rate': 0.08},
+            'USA': {'new_capacity_gw': 100},
+            'India': {'new_capacity_gw': 20},  # No base-year capacity
+            'SEA': {'growth_rate': 0.1},       # No base-year capacity, grows from zero
+            'ROW': {}                          # Neither key: not added
+        }
+        projected = self.model.project_manufacturing_capacity('solar_module_gw', 2030, projections)
+        self.assertEqual(list(projected), ['China', 'EU', 'USA', 'India', 'SEA'])
+        self.assertAlmostEqual(projected['China'], 600 * 1.08 ** 5)
+        self.assertEqual(projected['EU'], 50)
+        self.assertEqual(projected['USA'], 140)
+        self.assertEqual(projected['India'], 20)
+        self.assertEqual(projected['SEA'], 0)
+
+    def test_project_manufacturing_capacity_growth_takes_precedence(self):
+        projected = self.model.project_manufacturing_capacity('battery_gwh', 2026, {'China': {'growth_rate': 0.1, 'new_capacity_gw': 50}})
+        self.assertAlmostEqual(projected['China'], 1100)
+
+    def test_project_manufacturing_capacity_unknown_component(self):
+        self.assertEqual(self.model.project_manufacturing_capacity('wafer_gw', 2030, {}), {})
+        self.assertEqual(self.model.project_manufacturing_capacity('wafer_gw', 2030, {'EU': {'new_capacity_gw': 5}}), {'EU': 5})
+
+    def test_estimate_critical_mineral_demand(self):
+        self.assertEqual(self.model.estimate_critical_mineral_demand('silicon_pv_cells', 1000), {'silver_grams': 80.0})
+        self.assertEqual(self.model.estimate_critical_mineral_demand('lfp_battery_kwh', 100), {'lithium_kg': 55.00000000000001, 'phosphate_kg': 100.0})
+        self.assertEqual(self.model.estimate_critical_mineral_demand('perovskite_cells', 100), {})
+
+    def test_estimate_critical_mineral_demand_batch_matches_scalar(self):
+        technologies = ['silicon_pv_cells', 'lfp_battery_kwh', 'perovskite_cells', 'lfp_battery_kwh']
+        volumes = np.array([1000, 100, 5, 2.5])
+        demand = self.model.estimate_critical_mineral_demand_batch(technologies, volumes)
+        self.assertEqual(demand.shape, (4, len(MINERAL_NAMES)))
+        for i, (technology, volume) in enumerate(zip(technologies, volumes.tolist())):
+            expected = self.model.estimate_critical_mineral_demand(technology, volume)
+            self.assertEqual({mineral: demand[i, j] for j, mineral in enumerate(MINERAL_NAMES) if mineral in expected}, expected)
+            self.assertEqual(demand[i].sum(), sum(expected.values()))
+
+    def test_input_data_is_a_read_only_snapshot(self):
+        self.capacity_data['solar_module_gw_2025']['EU'] = 500
+        self.assertEqual(self.model.capacity_data['solar_module_gw_2025']['EU'], 50)
+        self.assertEqual(self.model.project_manufacturing_capacity('solar_module_gw', 2030, {})['EU'], 50)
+        with self.assertRaises(TypeError):
+            self.model.mineral_data['silver_grams_per_cell'] = 0.1
+        with self.assertRaises(AttributeError):
+            self.model.mineral_data = {}
+
+
+if __name__ == '__main__':
+    unittest.main()
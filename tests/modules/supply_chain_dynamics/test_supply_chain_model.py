@@ -0,0 +1,110 @@
+import unittest
+
+import numpy as np
+
+from src.modules.supply_chain_dynamics._hhi_kernels import _UNROLLED_CAPACITY_MOMENTS, _capacity_moments, _capacity_moments_numpy
+from src.modules.supply_chain_dynamics.supply_chain_model import (
+    SHARES_VECTORIZE_MIN_REGIONS, ConcentrationRisk, SupplyChainModel, initial_data)
+
+class TestSupplyChainModel(unittest.TestCase):
+    def setUp(self):
+        self.supply_data = {
+            'polysilicon': {
+                'global_capacity_tons_per_year': 1000,
+                'regional_capacity_tons_per_year': {'China': 800, 'USA': 150, 'Germany': 50},
+            },
+            'wafers': {'regional_capacity_tons_per_year': {'China': 0, 'USA': 0}},
+        }
+        self.model = SupplyChainModel(initial_supply_data=self.supply_data)
+
+    def test_calculate_hhi(self):
+        self.assertAlmostEqual(self.model.calculate_hhi([50, 30, 20]), 3800)
+        self.assertAlmostEqual(self.model.calculate_hhi(np.array([100.0])), 10000)
+        self.assertEqual(self.model.calculate_hhi([]), 0.0)
+        self.assertEqual(self.model.calculate_hhi([0, 0]), 0.0)
+
+    def test_get_concentration_risk(self):
+        risk = self.model.get_concentration_risk('polysilicon')
+        self.assertEqual(risk['hhi'], 6650.0)  # 80^2 + 15^2 + 5^2
+        self.assertEqual(risk['assessment'], "Highly concentrated")
+        self.assertEqual(risk['regional_shares_pct'], {'China': 80.0, 'USA': 15.0, 'Germany': 5.0})
+
+    def test_get_concentration_risk_no_capacity_or_data(self):
+        no_capacity = self.model.get_concentration_risk('wafers')
+        self.assertEqual(no_capacity['assessment'], 'No capacity')
+        self.assertIn('details', no_capacity)
+        self.assertNotIn('error', no_capacity)
+        missing = self.model.get_concentration_risk('missing')
+        self.assertIsInstance(missing, ConcentrationRisk)
+        self.assertEqual(missing['hhi'], -1)
+        self.assertIn('error', missing)
+        self.assertNotIn('regional_shares_pct', missing)
+
+    def test_capacity_moments_kernel_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        for capacities in (rng.uniform(0, 1000, 7), rng.uniform(0, 1, 500), np.array([42.0]), np.zeros(0)):
+            total, sum_of_squares = _capacity_moments(capacities)
+            expected_total, expected_sum_of_squares = _capacity_moments_numpy(capacities)
+            self.assertAlmostEqual(total, expected_total, places=8)
+            self.assertAlmostEqual(sum_of_squares, expected_sum_of_squares, places=6)
+
+    def test_unrolled_capacity_moments_match_loop(self):
+        rng = np.random.default_rng(1)
+        for n, unrolled_moments in _UNROLLED_CAPACITY_MOMENTS.items():
+            capacities = rng.uniform(0, 1e6, n)
+            total, sum_of_squares = unrolled_moments(*capacities.tolist())
+            self.assertAlmostEqual(total, capacities.sum(), places=6)
+            self.assertAlmostEqual(sum_of_squares / np.dot(capacities, capacities), 1.0, places=12)
+            self.assertIsInstance(unrolled_moments(*range(n))[0], float)
+
+    def test_concentration_risk_follows_capacity_expansion(self):
+        """Cached concentration data is updated by expansions and dropped when an item is replaced."""
+        self.model.get_concentration_risk('polysilicon')
+        self.model.model_capacity_expansion('polysilicon', 'USA', 450, 2030)
+        self.model.model_capacity_expansion('polysilicon', 'India', 550, 2030)
+        risk = self.model.get_concentration_risk('polysilicon')
+        self.assertEqual(risk['hhi'], 3262.5)  # 40^2 + 30^2 + 2.5^2 + 27.5^2
+        self.assertEqual(self.supply_data['polysilicon']['global_capacity_tons_per_year'], 2000)
+
+        self.model.add_supply_item('polysilicon', {'regional_capacity_tons_per_year': {'China': 1, 'USA': 1}})
+        self.assertEqual(self.model.get_concentration_risk('polysilicon')['hhi'], 5000.0)
+
+    def test_concentration_assessment_bands(self):
+        for regions, assessment in [(7, "Unconcentrated (Competitive)"), (4, "Moderately concentrated"), (2, "Highly concentrated")]:
+            self.model.add_supply_item('cells', {'regional_capacity_tons_per_year': {f'R{i}': 10 for i in range(regions)}})
+            self.assertEqual(self.model.get_concentration_risk('cells')['assessment'], assessment)
+
+    def test_default_data_is_copied(self):
+        """Expanding capacity in a default model leaves the module's initial_data untouched."""
+        china = initial_data['polysilicon']['regional_capacity_tons_per_year']['China']
+        model = SupplyChainModel()
+        self.assertEqual(model.supply_data, initial_data)
+        model.model_capacity_expansion('polysilicon', 'China', 1000, 2030)
+        self.assertEqual(initial_data['polysilicon']['regional_capacity_tons_per_year']['China'], china)
+
+    def test_concentration_risk_record_behaves_like_dict(self):
+        risk = self.model.get_concentration_risk('polysilicon')
+        self.assertEqual(risk.to_dict()['hhi'], risk.hhi)
+        self.assertIn('assessment', risk)
+        self.assertEqual(risk.get('error', 'none'), 'none')
+        with self.assertRaises(KeyError):
+            risk['error']
+
+    def test_concentration_risk_without_detail(self):
+        risk = self.model.get_concentration_risk('polysilicon', detail=False)
+        self.assertEqual((risk['hhi'], risk['assessment']), (6650.0, "Highly concentrated"))
+        self.assertNotIn('regional_shares_pct', risk)
+        self.assertEqual(risk.to_dict(), {'item_name': 'polysilicon', 'hhi': 6650.0, 'assessment': "Highly concentrated"})
+
+    def test_regional_shares_for_many_regions(self):
+        """Shares rounded in one array match the per-region rounding used for small items."""
+        capacities = {f'R{i}': float(i * i + 1) for i in range(SHARES_VECTORIZE_MIN_REGIONS + 5)}
+        self.model.add_supply_item('cells', {'regional_capacity_tons_per_year': capacities})
+        total = sum(capacities.values())
+        self.assertEqual(self.model.get_concentration_risk('cells')['regional_shares_pct'],
+                         {region: round((cap/total)*100, 2) for region, cap in capacities.items()})
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+import numpy as np
+
+from src.modules.supply_chain_dynamics.supply_chain_resilience_model import SupplyChainResilienceModel
+
+class TestSupplyChainResilienceModel(unittest.TestCase):
+    def setUp(self):
+        market_shares = {'lithium_refining': {'RefinerX': 0.5, 'RefinerY': 0.3, 'RefinerZ': 0.2}}
+        self.model = SupplyChainResilienceModel(market_share_data=market_shares,
+                                                recycling_data={'solar_panel_recycling_capacity_gw_2025': 20})
+
+    def test_calculate_hhi(self):
+        self.assertAlmostEqual(self.model.calculate_hhi('lithium_refining'), 3800)
+        self.assertEqual(self.model.calculate_hhi('missing'), -1.0)
+
+    def test_project_recycling_capacity_series_matches_scalar(self):
+        years = np.arange(2020, 2061)
+        series = self.model.project_recycling_capacity_series(years, annual_growth_rate=0.25)
+        self.assertEqual(series.shape, years.shape)
+        for year, capacity in zip(years.tolist(), series.tolist()):
+            self.assertAlmostEqual(capacity, self.model.project_recycling_capacity(year, annual_growth_rate=0.25), places=6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -526,6 +526,16 @@ class TestLoadClimateZonesData(unittest.TestCase):
         self.assertEqual(zones[0].resolution_minutes, 15)
         self.assertIsNone(zones[0].data_source_path)
 
+class TestDataModelIdentity(unittest.TestCase):
+    def test_instances_compare_and_hash_by_identity(self):
+        first = Country(name='Testland', iso_code='TL')
+        second = Country(name='Testland', iso_code='TL')
+        self.assertNotEqual(first, second)
+        self.assertEqual(len({first, second}), 2)
+        pv = PVTechnology(name='PV', technology_type='Silicon')
+        self.assertEqual({pv: 1}[pv], 1)
+        self.assertFalse(hasattr(pv, '__dict__'))
+
 if __name__ == '__main__':
     # This allows running the tests directly from this file
     unittest.main()
@@ -2,6 +2,8 @@ import unittest
 import sys
 import os
 
+import numpy as np
+
 # Add src directory to Python path to import modules
 # __file__ is .../tests/unit/technological_evolution/test_solar_tech_model.py
 # os.path.dirname(__file__) is .../tests/unit/technological_evolution
@@ -85,11 +87,51 @@ class TestSolarTechnology(unittest.TestCase):
         expected_capex_emerging_2030 = 1200 * ((1-0.05)**2)
         self.assertAlmostEqual(params_emerging_2030['capex_usd_per_kw'], expected_capex_emerging_2030, places=2)
 
+    def test_is_storage_classification(self):
+        self.assertFalse(self.tech_topcon.is_storage)
+        self.assertFalse(self.tech_topcon.get_params_for_year(2025)['is_storage'])
+        battery = SolarTechnology(name='LFP_Battery', base_efficiency=0.90, projected_efficiency_2035=0.92,
+                                  start_year=2020, commercial_scale_year=2020)
+        self.assertTrue(battery.is_storage)
+        self.assertTrue(battery.get_params_for_year(2025)['is_storage'])
+
     def test_commercial_availability(self):
         self.assertFalse(self.tech_emerging.get_params_for_year(2029)['is_commercially_available'])
         self.assertTrue(self.tech_emerging.get_params_for_year(2030)['is_commercially_available'])
         self.assertTrue(self.tech_topcon.get_params_for_year(2022)['is_commercially_available'])
 
+    def test_capex_beyond_table_and_fractional_years(self):
+        params_2083 = self.tech_topcon.get_params_for_year(2023 + 60)
+        self.assertAlmostEqual(params_2083['capex_usd_per_kw'], 700 * ((1 - 0.03) ** 60), places=2)
+        params_2027_5 = self.tech_topcon.get_params_for_year(2027.5)
+        self.assertAlmostEqual(params_2027_5['capex_usd_per_kw'], 700 * ((1 - 0.03) ** 4.5), places=2)
+
+    def test_get_params_for_years_matches_scalar(self):
+        years = np.arange(2020, 2046)
+        for tech in (self.tech_topcon, self.tech_emerging):
+            batch = tech.get_params_for_years(years)
+            self.assertEqual(batch['efficiency'].shape, years.shape)
+            for i, year in enumerate(years.tolist()):
+                params = tech.get_params_for_year(year)
+                self.assertAlmostEqual(batch['efficiency'][i], params['efficiency'], places=4)
+                self.assertAlmostEqual(batch['capex_usd_per_kw'][i], params['capex_usd_per_kw'], places=2)
+                self.assertEqual(batch['is_commercially_available'][i], params['is_commercially_available'])
+
+    def test_get_params_for_year_is_memoized(self):
+        self.assertIs(self.tech_topcon.get_params_for_year(2030), self.tech_topcon.get_params_for_year(2030))
+        self.assertIsInstance(self.tech_topcon.get_params_for_year(2030.0).year, float)
+
+    def test_parameters_are_read_only(self):
+        params_2028 = self.tech_topcon.get_params_for_year(2028)
+        with self.assertRaises(AttributeError):
+            self.tech_topcon.base_capex_usd_per_kw = 500
+        with self.assertRaises(AttributeError):
+            self.tech_topcon.annual_efficiency_improvement = 0
+        with self.assertRaises(AttributeError):
+            del self.tech_topcon.start_year
+        self.assertEqual(self.tech_topcon.base_capex_usd_per_kw, 700)
+        self.assertEqual(self.tech_topcon.get_params_for_year(2028), params_2028)
+
 
 class TestSolarTechModel(unittest.TestCase):
 
@@ -155,5 +197,40 @@ class TestSolarTechModel(unittest.TestCase):
         available_2023 = self.stm.list_technologies(year=2023)
         self.assertEqual(len(available_2023), 0)
 
+    def test_get_portfolio_params_matches_per_technology(self):
+        years = np.arange(2020, 2041)
+        portfolio = self.stm.get_portfolio_params(years)
+        self.assertEqual(portfolio['names'], ['TechA', 'TechB_Future'])
+        self.assertEqual(portfolio['efficiency'].shape, (2, years.size))
+        for row, name in enumerate(portfolio['names']):
+            expected = self.stm.technologies[name].get_params_for_years(years)
+            for key in ('efficiency', 'capex_usd_per_kw', 'is_commercially_available'):
+                np.testing.assert_array_equal(portfolio[key][row], expected[key])
+            self.assertEqual(portfolio['is_storage'][row], expected['is_storage'])
+
+        self.stm.add_technology(SolarTechnology('LFP_Battery', 0.9, 0.92, 2023, 2020))
+        portfolio = self.stm.get_portfolio_params(years)
+        self.assertEqual(portfolio['efficiency'].shape, (3, years.size))
+        self.assertTrue(portfolio['is_storage'][2])
+
+    def test_get_portfolio_params_fills_out_buffers(self):
+        first = self.stm.get_portfolio_params(np.arange(2020, 2041))
+        years = np.arange(2030.0, 2051.0)
+        second = self.stm.get_portfolio_params(years, out=first)
+        self.assertIs(second['efficiency'], first['efficiency'])
+        self.assertIs(second['is_commercially_available'], first['is_commercially_available'])
+        expected = self.stm.get_portfolio_params(years)
+        for key in ('efficiency', 'capex_usd_per_kw', 'is_commercially_available'):
+            np.testing.assert_array_equal(second[key], expected[key])
+
+    def test_params_record_behaves_like_dict(self):
+        params = self.stm.get_technology_details('TechA', 2025)
+        self.assertEqual(params.to_dict()['capex_usd_per_kw'], params.capex_usd_per_kw)
+        self.assertIn('is_storage', params)
+        self.assertNotIn('missing', params)
+        self.assertIsNone(params.get('missing'))
+        with self.assertRaises(KeyError):
+            params['missing']
+
 if __name__ == '__main__':
     unittest.main()